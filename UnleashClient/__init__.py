@@ -4,36 +4,23 @@ import string
 import threading
 import uuid
 import warnings
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import IntEnum
-from typing import Any, Callable, Dict, Optional
-
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.job import Job
-from apscheduler.jobstores.base import JobLookupError
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.schedulers.base import STATE_RUNNING, BaseScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
 from yggdrasil_engine.engine import UnleashEngine
 
-from UnleashClient.api import register_client
-from UnleashClient.connectors import (
-    BaseConnector,
-    BootstrapConnector,
-    OfflineConnector,
-    PollingConnector,
-    StreamingConnector,
-)
+from UnleashClient import api, connectors, constants, periodic_tasks
 from UnleashClient.constants import (
     APPLICATION_HEADERS,
+    CONNECTION_POOL_SIZE,
     DISABLED_VARIATION,
     ETAG,
     METRIC_LAST_SENT_TIME,
     REQUEST_RETRIES,
     REQUEST_TIMEOUT,
     SDK_NAME,
-    SDK_VERSION,
 )
 from UnleashClient.events import (
     BaseEvent,
@@ -41,12 +28,38 @@ from UnleashClient.events import (
     UnleashEventType,
     UnleashReadyEvent,
 )
-from UnleashClient.periodic_tasks import (
-    aggregate_and_send_metrics,
+from UnleashClient.periodic_tasks import MetricsShards, MetricsSpool, collect_metrics
+
+from .cache import BaseCache, FileCache, destroy_cache
+from .context import (
+    CLOCK,
+    UnleashContext,
+    callback_context,
+    normalize_context,
+    trim_context,
+)
+from .evaluation_cache import MISSING, EvaluationCache
+from .feature_index import FeatureIndex
+from .impressions import ImpressionDispatcher, ImpressionSampler
+from .instrumentation import (
+    CONTEXT,
+    ENGINE,
+    EVENTS,
+    METRICS,
+    EvaluationInstrumentation,
+    EvaluationTimer,
 )
+from .scheduler import STATE_RUNNING, TimerScheduler, add_interval_job
+from .shared_state import SharedStatePublisher, StateFileError
+from .snapshot import read_snapshot, write_snapshot
+from .utils import LOGGER, Deadline, InstanceAllowType, InstanceCounter
 
-from .cache import BaseCache, FileCache
-from .utils import LOGGER, InstanceAllowType, InstanceCounter
+if TYPE_CHECKING:
+    import requests
+    from apscheduler.job import Job
+    from apscheduler.schedulers.base import BaseScheduler
+
+    from UnleashClient.connectors import BaseConnector
 
 try:
     from typing import Literal, TypedDict
@@ -54,15 +67,6 @@ except ImportError:
     from typing_extensions import Literal, TypedDict  # type: ignore
 
 INSTANCES = InstanceCounter()
-_BASE_CONTEXT_FIELDS = [
-    "userId",
-    "sessionId",
-    "environment",
-    "appName",
-    "currentTime",
-    "remoteAddress",
-    "properties",
-]
 
 
 class _RunState(IntEnum):
@@ -72,7 +76,49 @@ class _RunState(IntEnum):
 
 
 class ExperimentalMode(TypedDict, total=False):
-    type: Literal["streaming", "polling"]
+    type: Literal["streaming", "polling", "shared_state"]
+    path: str
+
+
+@dataclass
+class PerformanceOptions:
+    """
+    Opt-in components that tune the client's performance, passed to UnleashClient as
+    ``performance``.  Leaving a field unset keeps the client's default behaviour.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.evaluation_cache import EvaluationCache
+
+        client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(evaluation_cache=EvaluationCache(maxsize=10000)),
+        )
+
+    :param evaluation_cache: Optional UnleashClient.evaluation_cache.EvaluationCache used to memoize evaluation results.  Only results that depend solely on the context fields a feature references are cached, and the cache is cleared whenever the feature set changes.  Metrics and impression events are still recorded for cached results.
+    :param connection_pool_size: Maximum number of keep-alive connections to the unleash server, optional & defaults to 10.  Feature fetches, registration and metrics share one pooled HTTP session, which is closed by destroy().
+    :param request_compression_threshold: Size in bytes above which registration and metrics request bodies are gzipped, optional & defaults to None (never compress).  Only enable this if your Unleash server or proxy accepts gzipped request bodies.
+    :param state_publisher: Optional UnleashClient.shared_state.SharedStatePublisher.  Publishes the feature state to a file whenever it changes, so other processes can use it with the "shared_state" mode.
+    :param metrics_spool: Optional UnleashClient.periodic_tasks.MetricsSpool that keeps metrics which couldn't be sent and retries them with backoff.  Defaults to an in-memory spool; pass MetricsSpool(cache=...) to persist unsent metrics.
+    :param impression_dispatcher: Optional UnleashClient.impressions.ImpressionDispatcher.  Impression events are queued and passed to event_callback on a background thread instead of on the thread that checks the flag.  Queued events are delivered by destroy().
+    :param impression_sampler: Optional UnleashClient.impressions.ImpressionSampler.  Only builds impression events for a fraction of the checks of each flag, and can emit periodic summary events that count every check instead.
+    :param metrics_shards: Optional UnleashClient.periodic_tasks.MetricsShards.  Counts flag checks in per-thread shards that are combined when metrics are sent, instead of in the shared engine.  Useful when many threads check flags concurrently.
+    :param instrumentation: Optional UnleashClient.instrumentation.EvaluationInstrumentation.  Records how long flag checks take per feature and phase, and how often fallbacks are used.  Checks aren't timed when unset.
+    """
+
+    evaluation_cache: Optional[EvaluationCache] = None
+    connection_pool_size: int = CONNECTION_POOL_SIZE
+    request_compression_threshold: Optional[int] = None
+    state_publisher: Optional[SharedStatePublisher] = None
+    metrics_spool: Optional[MetricsSpool] = None
+    impression_dispatcher: Optional[ImpressionDispatcher] = None
+    impression_sampler: Optional[ImpressionSampler] = None
+    metrics_shards: Optional[MetricsShards] = None
+    instrumentation: Optional[EvaluationInstrumentation] = None
 
 
 def build_ready_callback(
@@ -98,7 +144,7 @@ def build_ready_callback(
         if event_callback:
             event = UnleashReadyEvent(
                 event_type=UnleashEventType.READY,
-                event_id=uuid.uuid4(),
+                event_id=None,
             )
             already_fired = True
             event_callback(event)
@@ -129,11 +175,12 @@ class UnleashClient:
     :param cache_directory: Location of the cache directory. When unset, FCache will determine the location.
     :param verbose_log_level: Numerical log level (https://docs.python.org/3/library/logging.html#logging-levels) for cases where checking a feature flag fails.
     :param cache: Custom cache implementation that extends UnleashClient.cache.BaseCache.  When unset, UnleashClient will use Fcache.
-    :param scheduler: Custom APScheduler object.  Use this if you want to customize jobstore or executors.  When unset, UnleashClient will create it's own scheduler.
+    :param scheduler: Custom APScheduler object.  Use this if you want to customize jobstore or executors.  When unset, UnleashClient will create it's own scheduler.  Pass an UnleashClient.scheduler.TimerScheduler to run background jobs on a single thread without importing APScheduler; it doesn't need a scheduler_executor.
     :param scheduler_executor: Name of APSCheduler executor to use if using a custom scheduler.
     :param multiple_instance_mode: Determines how multiple instances being instantiated is handled by the SDK, when set to InstanceAllowType.BLOCK, the client constructor will fail when more than one instance is detected, when set to InstanceAllowType.WARN, multiple instances will be allowed but log a warning, when set to InstanceAllowType.SILENTLY_ALLOW, no warning or failure will be raised when instantiating multiple instances of the client. Defaults to InstanceAllowType.WARN
     :param event_callback: Function to call if impression events are enabled.  WARNING: Depending on your event library, this may have performance implications!
-    :param experimental_mode: Optional dict to configure mode. Use {"type": "streaming"} to enable streaming or {"type": "polling"} (default).
+    :param experimental_mode: Optional dict to configure mode. Use {"type": "streaming"} to enable streaming or {"type": "polling"} (default).  Use {"type": "shared_state", "path": "/path/to/file"} to load features published by another process's state_publisher instead of fetching them.
+    :param performance: Optional PerformanceOptions with opt-in components that tune the client's performance, e.g. an evaluation cache, metrics shards or an impression dispatcher.  See :class:`PerformanceOptions`.
     """
 
     def __init__(
@@ -157,11 +204,12 @@ class UnleashClient:
         project_name: Optional[str] = None,
         verbose_log_level: int = 30,
         cache: Optional[BaseCache] = None,
-        scheduler: Optional[BaseScheduler] = None,
+        scheduler: Optional[Union["BaseScheduler", TimerScheduler]] = None,
         scheduler_executor: Optional[str] = None,
         multiple_instance_mode: InstanceAllowType = InstanceAllowType.WARN,
         event_callback: Optional[Callable[[BaseEvent], None]] = None,
         experimental_mode: Optional[ExperimentalMode] = None,
+        performance: Optional[PerformanceOptions] = None,
     ) -> None:
         custom_headers = custom_headers or {}
         custom_options = custom_options or {}
@@ -202,9 +250,12 @@ class UnleashClient:
         self._do_instance_check(multiple_instance_mode)
 
         # Class objects
-        self.fl_job: Job = None
-        self.metric_job: Job = None
+        self.fl_job: "Job" = None
+        self.metric_job: "Job" = None
         self.engine = UnleashEngine()
+        self._feature_index = FeatureIndex()
+        self._http_session: Optional["requests.Session"] = None
+        self._init_performance(performance or PerformanceOptions(), event_callback)
 
         self.cache = cache or FileCache(
             self.unleash_app_name, directory=cache_directory
@@ -226,15 +277,47 @@ class UnleashClient:
 
         # Bootstrapping
         if self.unleash_bootstrapped:
-            BootstrapConnector(
+            connectors.BootstrapConnector(
                 engine=self.engine,
                 cache=self.cache,
+                state_callback=self._handle_state_update,
+                prepare_callback=self._feature_index.invalidate,
             ).start()
 
-        self.connector: BaseConnector = None
+        self.connector: "BaseConnector" = None
+
+    def _init_performance(
+        self,
+        performance: PerformanceOptions,
+        event_callback: Optional[Callable[[BaseEvent], None]],
+    ) -> None:
+        """
+        Opt-in performance components
+        """
+        self.unleash_request_compression_threshold = (
+            performance.request_compression_threshold
+        )
+        self._connection_pool_size = performance.connection_pool_size
+        self._evaluation_cache = performance.evaluation_cache
+        self._state_publisher = performance.state_publisher
+        self._metrics_spool = performance.metrics_spool or MetricsSpool()
+        self._metrics_shards = performance.metrics_shards
+        self._metrics_counter: Union[UnleashEngine, MetricsShards] = (
+            self._metrics_shards if self._metrics_shards is not None else self.engine
+        )
+        self._instrumentation = performance.instrumentation
+        self._impression_dispatcher = performance.impression_dispatcher
+        self._impression_sampler = performance.impression_sampler
+        self._impression_sink: Optional[Callable[[BaseEvent], Any]] = (
+            self._impression_dispatcher.bind(event_callback)
+            if self._impression_dispatcher is not None
+            else event_callback
+        )
 
     def _init_scheduler(
-        self, scheduler: Optional[BaseScheduler], scheduler_executor: Optional[str]
+        self,
+        scheduler: Optional[Union["BaseScheduler", TimerScheduler]],
+        scheduler_executor: Optional[str],
     ) -> None:
         """
         Scheduler bootstrapping
@@ -242,7 +325,7 @@ class UnleashClient:
         # - Figure out the Unleash executor name.
         if scheduler and scheduler_executor:
             self.unleash_executor_name = scheduler_executor
-        elif scheduler and not scheduler_executor:
+        elif scheduler and not isinstance(scheduler, TimerScheduler):
             raise ValueError(
                 "If using a custom scheduler, you must specify a executor."
             )
@@ -258,9 +341,25 @@ class UnleashClient:
         if scheduler:
             self.unleash_scheduler = scheduler
         else:
+            # Only imported when needed, so TimerScheduler users never load APScheduler.
+            from apscheduler.executors.pool import ThreadPoolExecutor  # noqa: PLC0415
+            from apscheduler.schedulers.background import (  # noqa: PLC0415
+                BackgroundScheduler,
+            )
+
             executors = {self.unleash_executor_name: ThreadPoolExecutor()}
             self.unleash_scheduler = BackgroundScheduler(executors=executors)
 
+    @property
+    def _session(self) -> "requests.Session":
+        # Created on first use, so requests isn't imported by clients that never make requests.
+        with self._lifecycle_lock:
+            if self._http_session is None:
+                self._http_session = api.build_session(
+                    self.unleash_request_retries, self._connection_pool_size
+                )
+            return self._http_session
+
     @property
     def unleash_metrics_interval_str_millis(self) -> str:
         return str(self.unleash_metrics_interval * 1000)
@@ -308,18 +407,11 @@ class UnleashClient:
                 return
             try:
                 start_scheduler = False
-                base_headers = {
-                    **self.unleash_custom_headers,
-                    **APPLICATION_HEADERS,
-                    "unleash-connection-id": self.connection_id,
-                    "unleash-appname": self.unleash_app_name,
-                    "unleash-instanceid": self.unleash_instance_id,
-                    "unleash-sdk": f"{SDK_NAME}:{SDK_VERSION}",
-                }
+                base_headers = self._base_headers()
 
                 # Register app
                 if not self.unleash_disable_registration:
-                    register_client(
+                    api.register_client(
                         self.unleash_url,
                         self.unleash_app_name,
                         self.unleash_instance_id,
@@ -329,11 +421,27 @@ class UnleashClient:
                         self.unleash_custom_options,
                         self.strategy_mapping,
                         self.unleash_request_timeout,
+                        session=self._session,
+                        compression_threshold=self.unleash_request_compression_threshold,
                     )
                 mode = self.connector_mode.get("type", "polling")
 
-                if mode == "streaming" and fetch_toggles:
-                    self.connector = StreamingConnector(
+                if mode == "shared_state":
+                    start_scheduler = True
+                    self.connector = connectors.SharedStateConnector(
+                        engine=self.engine,
+                        cache=self.cache,
+                        scheduler=self.unleash_scheduler,
+                        path=self.connector_mode["path"],
+                        scheduler_executor=self.unleash_executor_name,
+                        refresh_interval=self.unleash_refresh_interval,
+                        refresh_jitter=self.unleash_refresh_jitter,
+                        ready_callback=self._ready_callback,
+                        state_callback=self._handle_state_update,
+                        prepare_callback=self._feature_index.invalidate,
+                    )
+                elif mode == "streaming" and fetch_toggles:
+                    self.connector = connectors.StreamingConnector(
                         engine=self.engine,
                         cache=self.cache,
                         url=self.unleash_url,
@@ -341,10 +449,12 @@ class UnleashClient:
                         request_timeout=self.unleash_request_timeout,
                         ready_callback=self._ready_callback,
                         custom_options=self.unleash_custom_options,
+                        state_callback=self._handle_state_update,
+                        prepare_callback=self._feature_index.invalidate,
                     )
                 elif fetch_toggles:
                     start_scheduler = True
-                    self.connector = PollingConnector(
+                    self.connector = connectors.PollingConnector(
                         engine=self.engine,
                         cache=self.cache,
                         scheduler=self.unleash_scheduler,
@@ -360,10 +470,13 @@ class UnleashClient:
                         refresh_interval=self.unleash_refresh_interval,
                         event_callback=self.unleash_event_callback,
                         ready_callback=self._ready_callback,
+                        state_callback=self._handle_state_update,
+                        prepare_callback=self._feature_index.invalidate,
+                        session=self._session,
                     )
                 else:
                     start_scheduler = True
-                    self.connector = OfflineConnector(
+                    self.connector = connectors.OfflineConnector(
                         engine=self.engine,
                         cache=self.cache,
                         scheduler=self.unleash_scheduler,
@@ -371,6 +484,8 @@ class UnleashClient:
                         refresh_interval=self.unleash_refresh_interval,
                         refresh_jitter=self.unleash_refresh_jitter,
                         ready_callback=self._ready_callback,
+                        state_callback=self._handle_state_update,
+                        prepare_callback=self._feature_index.invalidate,
                     )
 
                 self.connector.start()
@@ -384,25 +499,23 @@ class UnleashClient:
                         "unleash-interval": self.unleash_metrics_interval_str_millis,
                     }
 
-                    metrics_args = {
-                        "url": self.unleash_url,
-                        "app_name": self.unleash_app_name,
-                        "connection_id": self.connection_id,
-                        "instance_id": self.unleash_instance_id,
-                        "headers": self.metrics_headers,
-                        "custom_options": self.unleash_custom_options,
-                        "request_timeout": self.unleash_request_timeout,
-                        "engine": self.engine,
-                    }
+                    self.metric_job = add_interval_job(
+                        self.unleash_scheduler,
+                        periodic_tasks.aggregate_and_send_metrics,
+                        seconds=int(self.unleash_metrics_interval),
+                        jitter=self.unleash_metrics_jitter,
+                        executor=self.unleash_executor_name,
+                        kwargs=self._metrics_args(),
+                    )
 
-                    self.metric_job = self.unleash_scheduler.add_job(
-                        aggregate_and_send_metrics,
-                        trigger=IntervalTrigger(
-                            seconds=int(self.unleash_metrics_interval),
-                            jitter=self.unleash_metrics_jitter,
-                        ),
+                if self._summary_interval:
+                    if getattr(self.unleash_scheduler, "state", None) != STATE_RUNNING:
+                        start_scheduler = True
+                    add_interval_job(
+                        self.unleash_scheduler,
+                        self._emit_impression_summaries,
+                        seconds=self._summary_interval,
                         executor=self.unleash_executor_name,
-                        kwargs=metrics_args,
                     )
 
                 if start_scheduler:
@@ -416,6 +529,32 @@ class UnleashClient:
                 )
                 raise excep
 
+    def _base_headers(self) -> dict:
+        return {
+            **self.unleash_custom_headers,
+            **APPLICATION_HEADERS,
+            "unleash-connection-id": self.connection_id,
+            "unleash-appname": self.unleash_app_name,
+            "unleash-instanceid": self.unleash_instance_id,
+            "unleash-sdk": f"{SDK_NAME}:{constants.SDK_VERSION}",
+        }
+
+    def _metrics_args(self) -> dict:
+        return {
+            "url": self.unleash_url,
+            "app_name": self.unleash_app_name,
+            "connection_id": self.connection_id,
+            "instance_id": self.unleash_instance_id,
+            "headers": self.metrics_headers,
+            "custom_options": self.unleash_custom_options,
+            "request_timeout": self.unleash_request_timeout,
+            "engine": self.engine,
+            "session": self._session,
+            "compression_threshold": self.unleash_request_compression_threshold,
+            "spool": self._metrics_spool,
+            "shards": self._metrics_shards,
+        }
+
     def feature_definitions(self) -> dict:
         """
         Returns a dict containing all feature definitions known to the SDK at the time of calling.
@@ -438,55 +577,145 @@ class UnleashClient:
             for toggle in toggles
         }
 
-    def destroy(self) -> None:
+    def feature_context_fields(self) -> Dict[str, Optional[List[str]]]:
+        """
+        Returns a dict containing the context fields each known feature reads, as worked out from the
+        loaded feature definitions.  This includes fields read through segments, variants and parent
+        features.  Features that may read any field (e.g. because they use a custom strategy) map to
+        None.
+
+        Only these fields are sent to the evaluation engine.
+
+        Example response:
+
+        {
+            "feature1": ["environment", "userId"],
+            "feature2": None,
+        }
+        """
+        return {
+            name: None if fields is None else list(fields)
+            for name, fields in self._feature_index.all_context_fields().items()
+        }
+
+    def export_snapshot(self, path: str) -> None:
+        """
+        Writes the features currently loaded to a snapshot file, for :meth:`load_snapshot`.
+
+        :param path: Location of the snapshot file.
+        """
+        write_snapshot(path, self.engine.get_state(), self._feature_index)
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Loads features from a snapshot written by :meth:`export_snapshot` or
+        ``UnleashClient.snapshot.write_snapshot``, e.g. at cold start before calling
+        :meth:`initialize_client`.
+
+        The snapshot's payload is handed to the engine as is and the client's own analysis of it
+        is restored from the snapshot, so the features aren't parsed again in Python or written to
+        the cache.  Snapshots written for a different yggdrasil engine version are ignored.
+
+        :param path: Location of the snapshot file.
+        :return: True if the snapshot was loaded.
+        """
+        try:
+            snapshot = read_snapshot(path)
+        except (OSError, StateFileError) as exc:
+            LOGGER.warning("Unable to load feature snapshot %s: %s", path, exc)
+            return False
+
+        self._feature_index.invalidate()
+        parse_warnings = self.engine.take_state(snapshot.state)
+        if parse_warnings:
+            LOGGER.warning(
+                "Some features were not able to be parsed correctly, they may not evaluate as expected"
+            )
+            LOGGER.warning(parse_warnings)
+
+        self._feature_index.restore(snapshot.feature_index)
+        self._state_changed(snapshot.state)
+        self.unleash_bootstrapped = True
+        return True
+
+    def destroy(self, timeout: Optional[float] = None) -> None:
         """
         Gracefully shuts down the Unleash client by stopping jobs, stopping the scheduler, and deleting the cache.
 
         You shouldn't need this too much!
+
+        :param timeout: Total number of seconds shutdown may take, optional & defaults to no limit.
+            The budget is shared by stopping the connector, flushing metrics, stopping the
+            scheduler and destroying the cache.  Metrics that can't be sent in time are only kept
+            if the metrics spool has a cache, and running background jobs aren't waited for.
         """
         with self._lifecycle_lock:
             if self._closed.is_set():
                 return
             self._closed.set()
             self._run_state = _RunState.SHUTDOWN
+            deadline = Deadline(timeout)
             if self.connector:
-                self.connector.stop()
+                self.connector.stop(timeout=deadline.time_left())
+
+            if self._summary_interval:
+                self._emit_impression_summaries()
+            if self._impression_dispatcher is not None:
+                self._impression_dispatcher.stop(timeout=deadline.remaining(5))
 
             if self.metric_job:
                 # Flush metrics before shutting down.
-                aggregate_and_send_metrics(
-                    url=self.unleash_url,
-                    app_name=self.unleash_app_name,
-                    connection_id=self.connection_id,
-                    instance_id=self.unleash_instance_id,
-                    headers=self.metrics_headers,
-                    custom_options=self.unleash_custom_options,
-                    request_timeout=self.unleash_request_timeout,
-                    engine=self.engine,
-                )
+                self._flush_metrics(deadline)
                 try:
                     self.metric_job.remove()
-                except JobLookupError as exc:
+                except KeyError as exc:  # JobLookupError
                     LOGGER.info("Exception during connector teardown: %s", exc)
 
             try:
                 if hasattr(self, "unleash_scheduler") and self.unleash_scheduler:
                     self.unleash_scheduler.remove_all_jobs()
-                    self.unleash_scheduler.shutdown(wait=True)
+                    self.unleash_scheduler.shutdown(wait=timeout is None)
             except Exception as exc:
                 LOGGER.warning("Exception during scheduler teardown: %s", exc)
 
             try:
-                self.cache.destroy()
+                destroy_cache(self.cache, deadline.time_left())
             except Exception as exc:
                 LOGGER.warning("Exception during cache teardown: %s", exc)
 
+            if self._http_session is not None:
+                self._http_session.close()
+
+    def _flush_metrics(self, deadline: Deadline) -> None:
+        request_timeout = deadline.remaining(self.unleash_request_timeout)
+        if request_timeout <= 0:
+            if self._metrics_spool.cache is not None:
+                LOGGER.warning(
+                    "No time left to send metrics on shutdown, keeping them in the metrics spool."
+                )
+            else:
+                LOGGER.warning(
+                    "No time left to send metrics on shutdown, they will be lost."
+                )
+            self._metrics_spool.add(collect_metrics(self.engine, self._metrics_shards))
+            return
+
+        # The pooled session retries connection errors, which would overrun the shutdown budget,
+        # so the last submission is sent once without it.
+        periodic_tasks.aggregate_and_send_metrics(
+            **{
+                **self._metrics_args(),
+                "request_timeout": request_timeout,
+                "session": None,
+            }
+        )
+
     @staticmethod
     def _get_fallback_value(
         fallback_function: Callable, feature_name: str, context: dict
     ) -> bool:
         if fallback_function:
-            fallback_value = fallback_function(feature_name, context)
+            fallback_value = fallback_function(feature_name, callback_context(context))
         else:
             fallback_value = False
 
@@ -496,7 +725,7 @@ class UnleashClient:
     def is_enabled(
         self,
         feature_name: str,
-        context: Optional[dict] = None,
+        context: Union[dict, UnleashContext, None] = None,
         fallback_function: Callable = None,
     ) -> bool:
         """
@@ -507,33 +736,89 @@ class UnleashClient:
         * If client hasn't been initialized yet or an error occurs, flag will default to false.
 
         :param feature_name: Name of the feature
-        :param context: Dictionary with context (e.g. IPs, email) for feature toggle.
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or a pre-built :class:`UnleashContext`.
         :param fallback_function: Allows users to provide a custom function to set default value.
         :return: Feature flag result
         """
+        timer = (
+            self._instrumentation.timer(feature_name)
+            if self._instrumentation is not None
+            else None
+        )
         context = self._safe_context(context)
-        feature_enabled = self.engine.is_enabled(feature_name, context)
+        if timer:
+            timer.lap(CONTEXT)
+        return self._is_enabled(feature_name, context, fallback_function, timer)
+
+    def is_enabled_many(
+        self,
+        feature_names: Iterable[str],
+        context: Union[dict, UnleashContext, None] = None,
+        fallback_function: Callable = None,
+    ) -> Dict[str, bool]:
+        """
+        Checks several feature toggles against the same context.
+
+        The context is normalized once and shared by every check, which makes this
+        considerably cheaper than calling :meth:`is_enabled` in a loop.  Metrics and
+        impression events are recorded exactly as they would be for individual calls.
+        Duplicate feature names are only evaluated (and counted) once.
+
+        :param feature_names: Names of the features
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles, or a pre-built :class:`UnleashContext`.
+        :param fallback_function: Allows users to provide a custom function to set default value.
+        :return: Dictionary of feature name to feature flag result
+        """
+        context = self._safe_context(context)
+        instrumentation = self._instrumentation
+        return {
+            feature_name: self._is_enabled(
+                feature_name,
+                context,
+                fallback_function,
+                instrumentation.timer(feature_name) if instrumentation else None,
+            )
+            for feature_name in dict.fromkeys(feature_names)
+        }
+
+    def _is_enabled(
+        self,
+        feature_name: str,
+        context: dict,
+        fallback_function: Callable,
+        timer: Optional[EvaluationTimer] = None,
+    ) -> bool:
+        feature_enabled = self._evaluate(
+            "is_enabled", self.engine.is_enabled, feature_name, context
+        )
 
         if feature_enabled is None:
+            if self._instrumentation is not None:
+                self._instrumentation.record_fallback(feature_name)
             feature_enabled = self._get_fallback_value(
                 fallback_function, feature_name, context
             )
 
-        self.engine.count_toggle(feature_name, feature_enabled)
+        if timer:
+            timer.lap(ENGINE)
+        self._metrics_counter.count_toggle(feature_name, feature_enabled)
+        if timer:
+            timer.lap(METRICS)
         try:
             if (
-                self.unleash_event_callback
+                self._impression_sink
                 and self.engine.should_emit_impression_event(feature_name)
+                and self._sample_impression(feature_name, feature_enabled)
             ):
                 event = UnleashEvent(
                     event_type=UnleashEventType.FEATURE_FLAG,
-                    event_id=uuid.uuid4(),
-                    context=context,
+                    event_id=None,
+                    context=callback_context(context),
                     enabled=feature_enabled,
                     feature_name=feature_name,
                 )
 
-                self.unleash_event_callback(event)
+                self._impression_sink(event)
         except Exception as excep:
             LOGGER.log(
                 self.unleash_verbose_log_level,
@@ -541,10 +826,14 @@ class UnleashClient:
                 excep,
             )
 
+        if timer:
+            timer.lap(EVENTS)
         return feature_enabled
 
     # pylint: disable=broad-except
-    def get_variant(self, feature_name: str, context: Optional[dict] = None) -> dict:
+    def get_variant(
+        self, feature_name: str, context: Union[dict, UnleashContext, None] = None
+    ) -> dict:
         """
         Checks if a feature toggle is enabled.  If so, return variant.
 
@@ -553,10 +842,53 @@ class UnleashClient:
         * If client hasn't been initialized yet or an error occurs, flag will default to false.
 
         :param feature_name: Name of the feature
-        :param context: Dictionary with context (e.g. IPs, email) for feature toggle.
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggle, or a pre-built :class:`UnleashContext`.
         :return: Variant and feature flag status.
         """
+        timer = (
+            self._instrumentation.timer(feature_name)
+            if self._instrumentation is not None
+            else None
+        )
         context = self._safe_context(context)
+        if timer:
+            timer.lap(CONTEXT)
+        return self._get_variant(feature_name, context, timer)
+
+    def get_variants_many(
+        self,
+        feature_names: Iterable[str],
+        context: Union[dict, UnleashContext, None] = None,
+    ) -> Dict[str, dict]:
+        """
+        Resolves variants for several feature toggles against the same context.
+
+        Like :meth:`is_enabled_many`, the context is normalized once and duplicate
+        feature names are only evaluated once.  Each variant carries a
+        ``feature_enabled`` field, so this can replace a separate
+        :meth:`is_enabled_many` call for the same features.
+
+        :param feature_names: Names of the features
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles, or a pre-built :class:`UnleashContext`.
+        :return: Dictionary of feature name to variant and feature flag status.
+        """
+        context = self._safe_context(context)
+        instrumentation = self._instrumentation
+        return {
+            feature_name: self._get_variant(
+                feature_name,
+                context,
+                instrumentation.timer(feature_name) if instrumentation else None,
+            )
+            for feature_name in dict.fromkeys(feature_names)
+        }
+
+    def _get_variant(
+        self,
+        feature_name: str,
+        context: dict,
+        timer: Optional[EvaluationTimer] = None,
+    ) -> dict:
         variant = self._resolve_variant(feature_name, context)
 
         if not variant:
@@ -568,23 +900,31 @@ class UnleashClient:
                 )
             variant = DISABLED_VARIATION
 
-        self.engine.count_variant(feature_name, variant["name"])
-        self.engine.count_toggle(feature_name, variant["feature_enabled"])
-
-        if self.unleash_event_callback and self.engine.should_emit_impression_event(
-            feature_name
+        if timer:
+            timer.lap(ENGINE)
+        self._metrics_counter.count_variant(feature_name, variant["name"])
+        self._metrics_counter.count_toggle(feature_name, variant["feature_enabled"])
+        if timer:
+            timer.lap(METRICS)
+
+        if (
+            self._impression_sink
+            and self.engine.should_emit_impression_event(feature_name)
+            and self._sample_impression(
+                feature_name, bool(variant["enabled"]), str(variant["name"])
+            )
         ):
             try:
                 event = UnleashEvent(
                     event_type=UnleashEventType.VARIANT,
-                    event_id=uuid.uuid4(),
-                    context=context,
+                    event_id=None,
+                    context=callback_context(context),
                     enabled=bool(variant["enabled"]),
                     feature_name=feature_name,
                     variant=str(variant["name"]),
                 )
 
-                self.unleash_event_callback(event)
+                self._impression_sink(event)
             except Exception as excep:
                 LOGGER.log(
                     self.unleash_verbose_log_level,
@@ -592,53 +932,116 @@ class UnleashClient:
                     excep,
                 )
 
+        if timer:
+            timer.lap(EVENTS)
         return variant
 
-    def _safe_context(self, context) -> dict:
-        new_context: Dict[str, Any] = self.unleash_static_context.copy()
-        new_context.update(context or {})
-
-        if "currentTime" not in new_context:
-            new_context["currentTime"] = datetime.now(timezone.utc).isoformat()
+    def _sample_impression(
+        self, feature_name: str, enabled: bool, variant: str = ""
+    ) -> bool:
+        if self._impression_sampler is None:
+            return True
+        return self._impression_sampler.record(feature_name, enabled, variant)
 
-        safe_properties = self._extract_properties(new_context)
-        safe_properties = {
-            k: self._safe_context_value(v) for k, v in safe_properties.items()
-        }
-        safe_context = {
-            k: self._safe_context_value(v)
-            for k, v in new_context.items()
-            if k != "properties"
-        }
+    @property
+    def _summary_interval(self) -> Optional[float]:
+        if self._impression_sink is None or self._impression_sampler is None:
+            return None
+        return self._impression_sampler.aggregate_interval
 
-        safe_context["properties"] = safe_properties
+    def _emit_impression_summaries(self) -> None:
+        if self._impression_sink is None or self._impression_sampler is None:
+            return
+        for event in self._impression_sampler.summaries():
+            try:
+                self._impression_sink(event)
+            except Exception as excep:
+                LOGGER.log(
+                    self.unleash_verbose_log_level,
+                    "Error in event callback: %s",
+                    excep,
+                )
 
-        return safe_context
+    def build_context(self, context: Optional[dict] = None) -> UnleashContext:
+        """
+        Normalizes a context once so it can be reused across many evaluations.
 
-    def _extract_properties(self, context: dict) -> dict:
-        properties = context.get("properties", {})
-        extracted_fields = {
-            k: v for k, v in context.items() if k not in _BASE_CONTEXT_FIELDS
-        }
-        extracted_fields.update(properties)
-        return extracted_fields
+        :param context: Dictionary with context (e.g. IPs, email) for feature toggles.
+        :return: An immutable :class:`UnleashContext` that any evaluation method accepts.
+        """
+        return UnleashContext(context, self.unleash_static_context)
+
+    def _safe_context(self, context: Union[dict, UnleashContext, None]) -> dict:
+        # The engine only needs currentTime for date constraints and custom strategies, so
+        # it's only filled in when the loaded features contain any.  The result may be an
+        # UnleashContext's own fields, so user callbacks only ever get copies of it.
+        if isinstance(context, UnleashContext):
+            # pylint: disable=protected-access
+            safe_context = context._fields
+            if context.has_current_time or not self._feature_index.uses_current_time:
+                return safe_context
+            return {**safe_context, "currentTime": CLOCK.isoformat()}
+
+        safe_context = normalize_context(context, self.unleash_static_context)
+        if "currentTime" not in safe_context and self._feature_index.uses_current_time:
+            safe_context["currentTime"] = CLOCK.isoformat()
 
-    def _safe_context_value(self, value):
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if isinstance(value, (int, float)):
-            return str(value)
-        return str(value)
+        return safe_context
 
     def _resolve_variant(self, feature_name: str, context: dict) -> dict:
         """
         Resolves a feature variant.
         """
-        variant = self.engine.get_variant(feature_name, context)
+        variant = self._evaluate(
+            "get_variant", self.engine.get_variant, feature_name, context
+        )
         if variant:
             return {k: v for k, v in asdict(variant).items() if v is not None}
         return None
 
+    def _evaluate(
+        self,
+        kind: str,
+        evaluate: Callable[[str, dict], Any],
+        feature_name: str,
+        context: dict,
+    ) -> Any:
+        """
+        Calls into the engine with only the context fields the feature reads, going through the
+        evaluation cache when it's enabled.
+        """
+        fields = self._feature_index.context_fields(feature_name)
+        engine_context = context if fields is None else trim_context(context, fields)
+
+        if self._evaluation_cache is None:
+            return evaluate(feature_name, engine_context)
+
+        fingerprint = self._feature_index.fingerprint(feature_name, context)
+        if fingerprint is None:
+            return evaluate(feature_name, engine_context)
+
+        key = (kind, fingerprint)
+        result = self._evaluation_cache.get(key)
+        if result is MISSING:
+            result = evaluate(feature_name, engine_context)
+            self._evaluation_cache.set(key, result)
+
+        return result
+
+    def _handle_state_update(self, state: str) -> None:
+        self._feature_index.update(state)
+        self._state_changed()
+
+    def _state_changed(self, full_state: Optional[str] = None) -> None:
+        if self._evaluation_cache is not None:
+            self._evaluation_cache.clear()
+        if self._state_publisher is not None:
+            # Streaming updates may be deltas, so publish the engine's full state.
+            try:
+                self._state_publisher.publish(full_state or self.engine.get_state())
+            except Exception as exc:
+                LOGGER.warning("Unable to publish shared feature state: %s", exc)
+
     def _do_instance_check(self, multiple_instance_mode):
         identifier = self.__get_identifier()
         if identifier in INSTANCES:
@@ -1,4 +1,28 @@
 # ruff: noqa: F401
-from .features import get_feature_toggles
-from .metrics import send_metrics
-from .register import register_client
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .encoding import encode_json
+    from .features import get_feature_toggles
+    from .metrics import send_metrics
+    from .register import register_client
+    from .session import build_session
+
+# requests is only imported once one of these is used.
+_MODULES = {
+    "encode_json": ".encoding",
+    "get_feature_toggles": ".features",
+    "send_metrics": ".metrics",
+    "register_client": ".register",
+    "build_session": ".session",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
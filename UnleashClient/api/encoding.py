@@ -0,0 +1,28 @@
+import gzip
+import json
+from typing import Dict, Optional, Tuple
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Every content coding urllib3 can decode here: gzip and deflate, plus br and zstd when the
+# brotli / zstandard packages are installed (pip install UnleashClient[compression]).
+SUPPORTED_ENCODINGS = ACCEPT_ENCODING
+
+
+def encode_json(
+    payload: dict, compression_threshold: Optional[int] = None
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Serializes a request body, gzipping it if it's larger than the threshold.
+
+    :param payload: JSON-serializable request body.
+    :param compression_threshold: Size in bytes above which the body is gzipped.  None disables
+        compression.
+    :return: (Body, extra headers to send with it)
+    """
+    body = json.dumps(payload).encode("utf-8")
+
+    if compression_threshold is None or len(body) <= compression_threshold:
+        return body, {}
+
+    return gzip.compress(body, compresslevel=6, mtime=0), {"Content-Encoding": "gzip"}
@@ -1,12 +1,13 @@
 from typing import Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
 
 from UnleashClient.constants import FEATURES_URL
 from UnleashClient.utils import LOGGER, log_resp_info
 
+from .encoding import SUPPORTED_ENCODINGS
+from .session import build_session
+
 
 # pylint: disable=broad-except
 def get_feature_toggles(
@@ -19,6 +20,7 @@ def get_feature_toggles(
     request_retries: int,
     project: Optional[str] = None,
     cached_etag: str = "",
+    session: Optional[requests.Session] = None,
 ) -> Tuple[str, str]:
     """
     Retrieves feature flags from unleash central server.
@@ -36,12 +38,15 @@ def get_feature_toggles(
     :param request_retries:
     :param project:
     :param cached_etag:
+    :param session: Pooled session to send the request with.  When unset, a new session is created
+        (and closed) for this request.
     :return: (Feature flags, etag) if successful, ({},'') if not
     """
     try:
         LOGGER.info("Getting feature flag.")
 
         request_specific_headers = {
+            "Accept-Encoding": SUPPORTED_ENCODINGS,
             "UNLEASH-APPNAME": app_name,
             "UNLEASH-INSTANCEID": instance_id,
         }
@@ -55,12 +60,11 @@ def get_feature_toggles(
         if project:
             base_params = {"project": project}
 
-        adapter = HTTPAdapter(
-            max_retries=Retry(total=request_retries, status_forcelist=[500, 502, 504])
-        )
-        with requests.Session() as session:
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
+        owns_session = session is None
+        if session is None:
+            session = build_session(request_retries, pool_size=1)
+
+        try:
             resp = session.get(
                 base_url,
                 headers={**headers, **request_specific_headers},
@@ -68,6 +72,9 @@ def get_feature_toggles(
                 timeout=request_timeout,
                 **custom_options,
             )
+        finally:
+            if owns_session:
+                session.close()
 
         if resp.status_code not in [200, 304]:
             log_resp_info(resp)
@@ -1,10 +1,12 @@
-import json
+from typing import Optional
 
 import requests
 
 from UnleashClient.constants import APPLICATION_HEADERS, METRICS_URL
 from UnleashClient.utils import LOGGER, log_resp_info
 
+from .encoding import encode_json
+
 
 # pylint: disable=broad-except
 def send_metrics(
@@ -13,6 +15,8 @@ def send_metrics(
     headers: dict,
     custom_options: dict,
     request_timeout: int,
+    session: Optional[requests.Session] = None,
+    compression_threshold: Optional[int] = None,
 ) -> bool:
     """
     Attempts to send metrics to Unleash server
@@ -25,16 +29,19 @@ def send_metrics(
     :param headers:
     :param custom_options:
     :param request_timeout:
+    :param session: Pooled session to send the request with, optional.
+    :param compression_threshold: Size in bytes above which the request body is gzipped, optional.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     try:
         LOGGER.info("Sending messages to with unleash @ %s", url)
         LOGGER.info("unleash metrics information: %s", request_body)
 
-        resp = requests.post(
+        body, encoding_headers = encode_json(request_body, compression_threshold)
+        resp = (session or requests).post(
             url + METRICS_URL,
-            data=json.dumps(request_body),
-            headers={**headers, **APPLICATION_HEADERS},
+            data=body,
+            headers={**headers, **APPLICATION_HEADERS, **encoding_headers},
             timeout=request_timeout,
             **custom_options,
         )
@@ -1,6 +1,6 @@
-import json
 from datetime import datetime, timezone
 from platform import python_implementation, python_version
+from typing import Optional
 
 import requests
 import yggdrasil_engine
@@ -15,6 +15,8 @@ from UnleashClient.constants import (
 )
 from UnleashClient.utils import LOGGER, log_resp_info
 
+from .encoding import encode_json
+
 
 # pylint: disable=broad-except
 def register_client(
@@ -27,6 +29,8 @@ def register_client(
     custom_options: dict,
     supported_strategies: dict,
     request_timeout: int,
+    session: Optional[requests.Session] = None,
+    compression_threshold: Optional[int] = None,
 ) -> bool:
     """
     Attempts to register client with unleash server.
@@ -43,6 +47,8 @@ def register_client(
     :param custom_options:
     :param supported_strategies:
     :param request_timeout:
+    :param session: Pooled session to send the request with, optional.
+    :param compression_threshold: Size in bytes above which the request body is gzipped, optional.
     :return: true if registration successful, false if registration unsuccessful or exception.
     """
     registration_request = {
@@ -63,10 +69,13 @@ def register_client(
         LOGGER.info("Registering unleash client with unleash @ %s", url)
         LOGGER.info("Registration request information: %s", registration_request)
 
-        resp = requests.post(
+        body, encoding_headers = encode_json(
+            registration_request, compression_threshold
+        )
+        resp = (session or requests).post(
             url + REGISTER_URL,
-            data=json.dumps(registration_request),
-            headers={**headers, **APPLICATION_HEADERS},
+            data=body,
+            headers={**headers, **APPLICATION_HEADERS, **encoding_headers},
             timeout=request_timeout,
             **custom_options,
         )
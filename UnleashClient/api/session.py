@@ -0,0 +1,30 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from UnleashClient.constants import CONNECTION_POOL_SIZE, REQUEST_RETRIES
+
+
+def build_session(
+    request_retries: int = REQUEST_RETRIES, pool_size: int = CONNECTION_POOL_SIZE
+) -> requests.Session:
+    """
+    Builds a keep-alive session for talking to the Unleash server.
+
+    Connections are pooled per host, so repeated fetches, registrations and metrics submissions
+    reuse the same TCP/TLS connections instead of reconnecting every time.  Idempotent requests
+    are retried on connection errors and 500, 502 & 504 responses.
+
+    :param request_retries: Number of retries for requests to the Unleash server.
+    :param pool_size: Maximum number of connections kept open per host.
+    :return: A session the caller owns and must close.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=request_retries, status_forcelist=[500, 502, 504]),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
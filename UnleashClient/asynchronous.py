@@ -0,0 +1,312 @@
+import asyncio
+import functools
+import random
+import warnings
+from typing import Any, Callable, List, Optional
+
+from UnleashClient import UnleashClient, _RunState
+from UnleashClient.api import register_client
+from UnleashClient.cache import destroy_cache
+from UnleashClient.connectors import (
+    OfflineConnector,
+    PollingConnector,
+    SharedStateConnector,
+    StreamingConnector,
+)
+from UnleashClient.periodic_tasks import aggregate_and_send_metrics
+from UnleashClient.utils import LOGGER, Deadline
+
+
+async def _run_blocking(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+# pylint: disable=invalid-overridden-method
+class AsyncUnleashClient(UnleashClient):
+    """
+    An UnleashClient for asyncio applications.
+
+    Feature fetching and metrics submission run as tasks on the event loop that calls
+    :meth:`initialize_client` instead of on an APScheduler thread pool.  Blocking HTTP calls are
+    handed to the loop's default executor, so the loop itself never waits on the network.  In
+    streaming mode the server-sent events connection still runs on its own thread.
+
+    Evaluation methods (:meth:`is_enabled`, :meth:`get_variant` etc.) never do I/O and stay
+    synchronous, so they can be called directly from coroutines.  The constructor takes the same
+    arguments as :class:`UnleashClient`; ``scheduler`` and ``scheduler_executor`` are ignored.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient.asynchronous import AsyncUnleashClient
+
+        client = AsyncUnleashClient("https://my.unleash.server.com", "my-app")
+        await client.initialize_client()
+        await client.wait_until_ready(timeout=5)
+
+        client.is_enabled("my_toggle")
+
+        await client.destroy()
+
+    It can also be used as an async context manager, which initializes and destroys the client:
+
+    .. code-block:: python
+
+        async with AsyncUnleashClient("https://my.unleash.server.com", "my-app") as client:
+            client.is_enabled("my_toggle")
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._tasks: List[asyncio.Task] = []
+        self._ready: Optional[asyncio.Event] = None
+
+    def _init_scheduler(
+        self, scheduler: Any, scheduler_executor: Optional[str]
+    ) -> None:
+        # Background work runs as tasks on the event loop, so no scheduler (and no APScheduler
+        # import) is needed.
+        self.unleash_scheduler = None
+        self.unleash_executor_name = None
+
+    async def initialize_client(  # type: ignore[override]
+        self, fetch_toggles: bool = True
+    ) -> None:
+        """
+        Registers the client, loads features and starts background tasks on the running loop.
+
+        :param fetch_toggles: Whether to fetch features from the server.  When False, features
+            are only (re)loaded from the cache.
+        """
+        if self._closed.is_set() or self._run_state > _RunState.UNINITIALIZED:
+            warnings.warn(
+                "Attempted to initialize an Unleash Client instance that has already been initialized."
+            )
+            return
+
+        self._ready = asyncio.Event()
+        ready_callback = self._build_ready_callback(asyncio.get_running_loop())
+
+        try:
+            base_headers = self._base_headers()
+
+            if not self.unleash_disable_registration:
+                await _run_blocking(
+                    register_client,
+                    self.unleash_url,
+                    self.unleash_app_name,
+                    self.unleash_instance_id,
+                    self.connection_id,
+                    self.unleash_metrics_interval,
+                    base_headers,
+                    self.unleash_custom_options,
+                    self.strategy_mapping,
+                    self.unleash_request_timeout,
+                    session=self._session,
+                    compression_threshold=self.unleash_request_compression_threshold,
+                )
+            mode = self.connector_mode.get("type", "polling")
+
+            if mode == "shared_state":
+                self.connector = SharedStateConnector(
+                    engine=self.engine,
+                    cache=self.cache,
+                    scheduler=None,
+                    path=self.connector_mode["path"],
+                    ready_callback=ready_callback,
+                    state_callback=self._handle_state_update,
+                    prepare_callback=self._feature_index.invalidate,
+                )
+                if not await _run_blocking(self.connector.refresh):
+                    await _run_blocking(self.connector.load_features)
+                self._start_task(
+                    self.connector.refresh,
+                    self.unleash_refresh_interval,
+                    self.unleash_refresh_jitter,
+                )
+            elif mode == "streaming" and fetch_toggles:
+                self.connector = StreamingConnector(
+                    engine=self.engine,
+                    cache=self.cache,
+                    url=self.unleash_url,
+                    headers=base_headers,
+                    request_timeout=self.unleash_request_timeout,
+                    ready_callback=ready_callback,
+                    custom_options=self.unleash_custom_options,
+                    state_callback=self._handle_state_update,
+                    prepare_callback=self._feature_index.invalidate,
+                )
+                self.connector.start()
+            elif fetch_toggles:
+                self.connector = PollingConnector(
+                    engine=self.engine,
+                    cache=self.cache,
+                    scheduler=None,
+                    url=self.unleash_url,
+                    app_name=self.unleash_app_name,
+                    instance_id=self.unleash_instance_id,
+                    headers=base_headers,
+                    custom_options=self.unleash_custom_options,
+                    request_timeout=self.unleash_request_timeout,
+                    request_retries=self.unleash_request_retries,
+                    project=self.unleash_project_name,
+                    refresh_interval=self.unleash_refresh_interval,
+                    event_callback=self.unleash_event_callback,
+                    ready_callback=ready_callback,
+                    state_callback=self._handle_state_update,
+                    prepare_callback=self._feature_index.invalidate,
+                    session=self._session,
+                )
+                # pylint: disable=protected-access
+                fetch = self.connector._fetch_and_load
+                await _run_blocking(fetch)
+                self._start_task(
+                    fetch, self.unleash_refresh_interval, self.unleash_refresh_jitter
+                )
+            else:
+                self.connector = OfflineConnector(
+                    engine=self.engine,
+                    cache=self.cache,
+                    scheduler=None,
+                    refresh_interval=self.unleash_refresh_interval,
+                    refresh_jitter=self.unleash_refresh_jitter,
+                    ready_callback=ready_callback,
+                    state_callback=self._handle_state_update,
+                    prepare_callback=self._feature_index.invalidate,
+                )
+                await _run_blocking(self.connector.load_features)
+                ready_callback()
+                self._start_task(
+                    self.connector.load_features,
+                    self.unleash_refresh_interval,
+                    self.unleash_refresh_jitter,
+                )
+
+            if not self.unleash_disable_metrics:
+                self.metrics_headers = {
+                    **base_headers,
+                    "unleash-interval": self.unleash_metrics_interval_str_millis,
+                }
+                self._start_task(
+                    functools.partial(
+                        aggregate_and_send_metrics, **self._metrics_args()
+                    ),
+                    self.unleash_metrics_interval,
+                    self.unleash_metrics_jitter,
+                )
+
+            if self._summary_interval:
+                self._start_task(
+                    self._emit_impression_summaries, self._summary_interval
+                )
+
+            self._run_state = _RunState.INITIALIZED
+
+        except Exception as excep:
+            # Log exceptions during initialization.  is_initialized will remain false.
+            LOGGER.warning("Exception during UnleashClient initialization: %s", excep)
+            raise excep
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until features have been loaded for the first time.
+
+        :param timeout: Maximum number of seconds to wait, optional & defaults to waiting forever.
+        :return: True if the client is ready, False if it timed out or was never initialized.
+        """
+        if self._ready is None:
+            return False
+
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    async def destroy(  # type: ignore[override]
+        self, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Cancels background tasks, flushes metrics and releases the cache and HTTP session.
+
+        :param timeout: Total number of seconds shutdown may take, optional & defaults to no
+            limit.  Metrics that can't be sent in time are only kept if the metrics spool has a
+            cache.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        was_initialized = self._run_state == _RunState.INITIALIZED
+        self._run_state = _RunState.SHUTDOWN
+        deadline = Deadline(timeout)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self.connector:
+            await _run_blocking(self.connector.stop, timeout=deadline.time_left())
+
+        if self._summary_interval:
+            self._emit_impression_summaries()
+        if self._impression_dispatcher is not None:
+            await _run_blocking(
+                self._impression_dispatcher.stop, timeout=deadline.remaining(5)
+            )
+
+        if was_initialized and not self.unleash_disable_metrics:
+            # Flush metrics before shutting down.
+            await _run_blocking(self._flush_metrics, deadline)
+
+        try:
+            await _run_blocking(destroy_cache, self.cache, deadline.time_left())
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Exception during cache teardown: %s", exc)
+
+        if self._http_session is not None:
+            self._http_session.close()
+
+    def __enter__(self) -> "AsyncUnleashClient":
+        raise TypeError("Use 'async with' with AsyncUnleashClient.")
+
+    def __exit__(self, *args, **kwargs):
+        # Never reached, __enter__ raises.
+        return False
+
+    async def __aenter__(self) -> "AsyncUnleashClient":
+        await self.initialize_client()
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        await self.destroy()
+        return False
+
+    def _build_ready_callback(self, loop: asyncio.AbstractEventLoop) -> Callable:
+        # Connectors call this from executor or streaming threads.
+        ready = self._ready
+
+        def ready_callback() -> None:
+            if self._ready_callback:
+                self._ready_callback()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(ready.set)
+
+        return ready_callback
+
+    def _start_task(
+        self, func: Callable, interval: float, jitter: Optional[int] = None
+    ) -> None:
+        self._tasks.append(asyncio.ensure_future(self._every(func, interval, jitter)))
+
+    @staticmethod
+    async def _every(func: Callable, interval: float, jitter: Optional[int]) -> None:
+        while True:
+            await asyncio.sleep(interval + random.uniform(0, jitter or 0))
+            try:
+                await _run_blocking(func)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Exception in Unleash background task: %s", exc)
@@ -1,12 +1,20 @@
 import abc
+import inspect
 import json
+import mmap
+import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-import requests
-from fcache.cache import FileCache as _FileCache
-
-from UnleashClient.constants import FEATURES_URL, REQUEST_TIMEOUT
+from UnleashClient.constants import ETAG, FEATURES_URL, REQUEST_TIMEOUT
+from UnleashClient.shared_state import (
+    map_state_file,
+    payload_digest,
+    write_state_file,
+)
+from UnleashClient.utils import LOGGER, Deadline
 
 
 class BaseCache(abc.ABC):
@@ -38,50 +46,26 @@ class BaseCache(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def destroy(self):
-        pass
+    def destroy(self, timeout: Optional[float] = None):
+        """
+        :param timeout: Maximum number of seconds teardown may take, optional & defaults to no
+            limit.  Caches that don't wait on anything can ignore it.
+        """
 
 
-class FileCache(BaseCache):
+def destroy_cache(cache: BaseCache, timeout: Optional[float]) -> None:
     """
-    The default cache for UnleashClient.  Uses `fcache <https://pypi.org/project/fcache/>`_ behind the scenes.
-
-    You can boostrap the FileCache with initial configuration to improve resiliency on startup.  To do so:
-
-    - Create a new FileCache instance.
-    - Bootstrap the FileCache.
-    - Pass your FileCache instance to UnleashClient at initialization along with `boostrap=true`.
-
-    You can bootstrap from a dictionary, a json file, or from a URL.  In all cases, configuration should match the Unleash `/api/client/features <https://docs.getunleash.io/api/client/features>`_ endpoint.
-
-    Example:
-
-    .. code-block:: python
-
-        from pathlib import Path
-        from UnleashClient.cache import FileCache
-        from UnleashClient import UnleashClient
-
-        my_cache = FileCache("HAMSTER_API")
-        my_cache.bootstrap_from_file(Path("/path/to/boostrap.json"))
-        unleash_client = UnleashClient(
-            "https://my.unleash.server.com",
-            "HAMSTER_API",
-            cache=my_cache
-        )
-
-    :param name: Name of cache.
-    :param directory: Location to create cache.  If empty, will use filecache default.
+    Destroys a cache, passing ``timeout`` on if its ``destroy`` accepts one.  Custom caches
+    written before ``destroy`` took a timeout don't.
     """
+    if "timeout" in inspect.signature(cache.destroy).parameters:
+        cache.destroy(timeout=timeout)
+    else:
+        cache.destroy()
 
-    def __init__(
-        self,
-        name: str,
-        directory: Optional[str] = None,
-        request_timeout: int = REQUEST_TIMEOUT,
-    ):
-        self._cache = _FileCache(name, app_cache_dir=directory)
-        self.request_timeout = request_timeout
+
+class _BootstrappableCache(BaseCache):
+    request_timeout = REQUEST_TIMEOUT
 
     def bootstrap_from_dict(self, initial_config: dict) -> None:
         """
@@ -120,11 +104,57 @@ class FileCache(BaseCache):
         :param initial_configuration_url: Url that returns document containing initial configuration.  Must return JSON.
         :param headers: Headers to use when GETing the initial configuration URL.
         """
+        import requests  # noqa: PLC0415
+
         timeout = request_timeout if request_timeout else self.request_timeout
         response = requests.get(initial_config_url, headers=headers, timeout=timeout)
         self.set(FEATURES_URL, response.text)
         self.bootstrapped = True
 
+
+class FileCache(_BootstrappableCache):
+    """
+    The default cache for UnleashClient.  Uses `fcache <https://pypi.org/project/fcache/>`_ behind the scenes.
+
+    You can boostrap the FileCache with initial configuration to improve resiliency on startup.  To do so:
+
+    - Create a new FileCache instance.
+    - Bootstrap the FileCache.
+    - Pass your FileCache instance to UnleashClient at initialization along with `boostrap=true`.
+
+    You can bootstrap from a dictionary, a json file, or from a URL.  In all cases, configuration should match the Unleash `/api/client/features <https://docs.getunleash.io/api/client/features>`_ endpoint.
+
+    Example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+        from UnleashClient.cache import FileCache
+        from UnleashClient import UnleashClient
+
+        my_cache = FileCache("HAMSTER_API")
+        my_cache.bootstrap_from_file(Path("/path/to/boostrap.json"))
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            cache=my_cache
+        )
+
+    :param name: Name of cache.
+    :param directory: Location to create cache.  If empty, will use filecache default.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Optional[str] = None,
+        request_timeout: int = REQUEST_TIMEOUT,
+    ):
+        from fcache.cache import FileCache as _FileCache  # noqa: PLC0415
+
+        self._cache = _FileCache(name, app_cache_dir=directory)
+        self.request_timeout = request_timeout
+
     def set(self, key: str, value: Any):
         self._cache[key] = value
         self._cache.sync()
@@ -139,5 +169,295 @@ class FileCache(BaseCache):
     def exists(self, key: str):
         return key in self._cache
 
-    def destroy(self):
+    def destroy(self, timeout: Optional[float] = None):
         return self._cache.delete()
+
+
+class MmapCache(_BootstrappableCache):
+    """
+    A cache that stores the feature payload as raw bytes in a memory-mapped file.
+
+    Compared to FileCache, nothing is pickled and unchanged payloads are never written: the
+    payload's digest is compared before anything touches the disk.  New payloads are written to
+    a temporary file that's renamed into place, so a crash can't leave a half-written cache.  A
+    cache file found on startup is mapped rather than read, and decoded once on first use.
+
+    Other keys (e.g. the ETag or a metrics spool's pending metrics) are stored in the file's
+    header.  Setting one to a new value rewrites the file with the same payload and generation, so
+    processes loading features from it don't reload.  A file without a feature payload only holds
+    these keys.
+
+    The file uses the format from :mod:`UnleashClient.shared_state`, so other processes can load
+    features from it with ``experimental_mode={"type": "shared_state", "path": cache.path}``.
+    Replacing a mapped file requires a POSIX platform.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import UnleashClient
+        from UnleashClient.cache import MmapCache
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            cache=MmapCache("HAMSTER_API", directory="/var/cache/unleash"),
+        )
+
+    :param name: Name of cache.
+    :param directory: Location to create cache.  If empty, the system's temporary directory is used.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Optional[str] = None,
+        request_timeout: int = REQUEST_TIMEOUT,
+    ):
+        self.path = os.path.join(directory or tempfile.gettempdir(), f"{name}.unleash")
+        self.request_timeout = request_timeout
+        self._lock = threading.RLock()
+        self._values: Dict[str, Any] = {}
+        self._payload: Optional[str] = None
+        self._digest: Optional[bytes] = None
+        self._generation = 0
+        self._mapped: Optional[mmap.mmap] = None
+        self._payload_slice = slice(0, 0)
+
+        try:
+            self._map()
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Ignoring unreadable cache file %s: %s", self.path, exc)
+
+    def _map(self) -> None:
+        mapped_state = map_state_file(self.path)
+        if mapped_state is None:
+            return
+
+        self._values = {
+            key: value
+            for key, value in mapped_state.metadata.items()
+            if key != FEATURES_URL
+        }
+        self._generation = mapped_state.generation
+        if not mapped_state.payload_length:
+            # Only other keys were ever stored.
+            mapped_state.mapped.close()
+            return
+
+        self._mapped = mapped_state.mapped
+        self._payload_slice = slice(
+            mapped_state.payload_offset,
+            mapped_state.payload_offset + mapped_state.payload_length,
+        )
+        self._digest = mapped_state.digest
+
+    def _unmap(self) -> None:
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def _mapped_payload(self) -> Optional[str]:
+        # Decodes straight from the mapped pages, without an intermediate bytes copy.
+        with memoryview(self._mapped) as view, view[self._payload_slice] as payload:
+            if payload_digest(payload) != self._digest:
+                LOGGER.warning("Ignoring corrupt cache file %s", self.path)
+                return None
+            return str(payload, "utf-8")
+
+    def _set_payload(self, value: Any) -> bool:
+        # Called with the lock held.  Returns False if the payload is unchanged.
+        encoded = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+        digest = payload_digest(encoded)
+        if digest == self._digest:
+            return False
+
+        self._generation += 1
+        write_state_file(self.path, self._generation, encoded, self._values)
+        self._unmap()
+        self._payload = encoded.decode("utf-8") if isinstance(value, bytes) else value
+        self._digest = digest
+        return True
+
+    def _set_values(self, values: dict) -> bool:
+        # Called with the lock held.  Returns False if no value changed.
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in self._values or self._values[key] != value
+        }
+        self._values.update(changed)
+        return bool(changed)
+
+    def _write_values(self) -> None:
+        # Called with the lock held, after other keys changed but the payload didn't.
+        payload = self.get(FEATURES_URL)
+        encoded = b"" if payload is None else payload.encode("utf-8")
+        write_state_file(self.path, self._generation, encoded, self._values)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            if key == FEATURES_URL:
+                self._set_payload(value)
+            elif self._set_values({key: value}):
+                self._write_values()
+
+    def mset(self, data: dict):
+        with self._lock:
+            changed = self._set_values(
+                {key: value for key, value in data.items() if key != FEATURES_URL}
+            )
+            written = FEATURES_URL in data and self._set_payload(data[FEATURES_URL])
+            if changed and not written:
+                self._write_values()
+
+    def get(self, key: str, default: Optional[Any] = None):
+        if key != FEATURES_URL:
+            return self._values.get(key, default)
+
+        with self._lock:
+            if self._payload is None and self._mapped is not None:
+                self._payload = self._mapped_payload()
+                if self._payload is None:
+                    self._digest = None
+                self._unmap()
+            return default if self._payload is None else self._payload
+
+    def exists(self, key: str):
+        if key == FEATURES_URL:
+            return self._digest is not None
+        return key in self._values
+
+    def destroy(self, timeout: Optional[float] = None):
+        with self._lock:
+            self._unmap()
+            self._values.clear()
+            self._payload = None
+            self._digest = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class MemoryCache(_BootstrappableCache):
+    """
+    A cache that keeps everything in memory, optionally persisting features in the background.
+
+    Setting a value never touches the disk.  If a ``backing_cache`` is given, the latest feature
+    payload (and its ETag) is copied to it by a background thread at most every
+    ``flush_interval`` seconds, and features already in the backing cache are loaded on startup.
+    A payload set less than ``flush_interval`` seconds before the process exits may not be
+    persisted; call :meth:`flush` to write it immediately.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import UnleashClient
+        from UnleashClient.cache import FileCache, MemoryCache
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            cache=MemoryCache(backing_cache=FileCache("HAMSTER_API"), flush_interval=60),
+        )
+
+    :param backing_cache: Optional cache that features are persisted to.
+    :param flush_interval: Minimum number of seconds between writes to the backing cache.
+    """
+
+    def __init__(
+        self,
+        backing_cache: Optional[BaseCache] = None,
+        flush_interval: float = 30,
+        request_timeout: int = REQUEST_TIMEOUT,
+    ):
+        self.backing_cache = backing_cache
+        self.flush_interval = flush_interval
+        self.request_timeout = request_timeout
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self._dirty = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        if backing_cache is not None and backing_cache.exists(FEATURES_URL):
+            self._values[FEATURES_URL] = backing_cache.get(FEATURES_URL)
+            self._values[ETAG] = backing_cache.get(ETAG, "")
+
+    def _mark_dirty(self) -> None:
+        # Called with the lock held.
+        if self.backing_cache is None:
+            return
+
+        self._dirty = True
+        if self._flusher is None and not self._stop.is_set():
+            self._flusher = threading.Thread(
+                target=self._run, name="UnleashMemoryCacheFlusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Unable to persist cached features: %s", exc)
+
+    def flush(self) -> None:
+        """
+        Writes the latest feature payload to the backing cache, if it changed since the last flush.
+        """
+        with self._lock:
+            if not self._dirty or self.backing_cache is None:
+                return
+            snapshot = {
+                FEATURES_URL: self._values[FEATURES_URL],
+                ETAG: self._values.get(ETAG, ""),
+            }
+            self._dirty = False
+
+        self.backing_cache.mset(snapshot)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._values[key] = value
+            if key == FEATURES_URL:
+                self._mark_dirty()
+
+    def mset(self, data: dict):
+        with self._lock:
+            self._values.update(data)
+            if FEATURES_URL in data:
+                self._mark_dirty()
+
+    def get(self, key: str, default: Optional[Any] = None):
+        return self._values.get(key, default)
+
+    def exists(self, key: str):
+        return key in self._values
+
+    def destroy(self, timeout: Optional[float] = None):
+        """
+        Stops the background flusher and clears the cache and its backing cache.
+
+        :param timeout: Maximum number of seconds to wait for a flush in progress, optional &
+            defaults to no limit.  A flush that doesn't finish in time is abandoned.
+        """
+        deadline = Deadline(timeout)
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(deadline.time_left())
+            if self._flusher.is_alive():
+                LOGGER.warning(
+                    "Persisting cached features didn't finish in time, abandoning it."
+                )
+            self._flusher = None
+
+        with self._lock:
+            self._values.clear()
+            self._dirty = False
+
+        if self.backing_cache is not None:
+            destroy_cache(self.backing_cache, deadline.time_left())
@@ -1,13 +1,39 @@
-from .base_connector import BaseConnector
-from .bootstrap_connector import BootstrapConnector
-from .offline_connector import OfflineConnector
-from .polling_connector import PollingConnector
-from .streaming_connector import StreamingConnector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_connector import BaseConnector
+    from .bootstrap_connector import BootstrapConnector
+    from .offline_connector import OfflineConnector
+    from .polling_connector import PollingConnector
+    from .shared_state_connector import SharedStateConnector
+    from .streaming_connector import StreamingConnector
+
+# Connectors are imported on first use, so that e.g. the streaming client library is only loaded
+# in streaming mode.
+_MODULES = {
+    "BaseConnector": ".base_connector",
+    "BootstrapConnector": ".bootstrap_connector",
+    "OfflineConnector": ".offline_connector",
+    "PollingConnector": ".polling_connector",
+    "SharedStateConnector": ".shared_state_connector",
+    "StreamingConnector": ".streaming_connector",
+}
 
 __all__ = [
     "BaseConnector",
     "BootstrapConnector",
     "OfflineConnector",
     "PollingConnector",
+    "SharedStateConnector",
     "StreamingConnector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
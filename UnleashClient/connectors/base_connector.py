@@ -1,3 +1,4 @@
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
 
@@ -8,29 +9,63 @@ from UnleashClient.constants import FEATURES_URL
 from UnleashClient.utils import LOGGER
 
 
+def _digest(state: str) -> bytes:
+    return hashlib.blake2b(state.encode("utf-8"), digest_size=16).digest()
+
+
 class BaseConnector(ABC):
+    state_callback: Optional[Callable[[str], None]] = None
+    prepare_callback: Optional[Callable[[], None]] = None
+    # Digest of the cached payload the engine was last loaded from.
+    _loaded_digest: Optional[bytes] = None
+
     def __init__(
         self,
         engine: UnleashEngine,
         cache: BaseCache,
         ready_callback: Optional[Callable] = None,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
     ):
         """
         :param engine: Feature evaluation engine instance (UnleashEngine).
         :param cache: Should be the cache class variable from UnleashClient
         :param ready_callback: Optional function to call when features are successfully loaded.
+        :param state_callback: Optional function called with every payload handed to the engine.
+        :param prepare_callback: Optional function called right before a payload is handed to the
+            engine.
         """
         self.engine = engine
         self.cache = cache
         self.ready_callback = ready_callback
+        self.state_callback = state_callback
+        self.prepare_callback = prepare_callback
 
     @abstractmethod
     def start(self):
         pass
 
     @abstractmethod
-    def stop(self):
-        pass
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops background work.
+
+        :param timeout: Maximum number of seconds to wait for background threads, optional.
+        """
+
+    def take_state(self, state: str) -> Optional[str]:
+        """
+        Hands a feature payload to the engine and notifies the state callback.
+
+        :return: Parser warnings from the engine, if any.
+        """
+        self._loaded_digest = None
+        if self.prepare_callback:
+            self.prepare_callback()
+        warnings = self.engine.take_state(state)
+        if self.state_callback:
+            self.state_callback(state)
+        return warnings
 
     def load_features(self):
         feature_provisioning = self.cache.get(FEATURES_URL)
@@ -41,8 +76,18 @@ class BaseConnector(ABC):
             )
             return
 
+        digest = (
+            _digest(feature_provisioning)
+            if isinstance(feature_provisioning, str)
+            else None
+        )
+        if digest is not None and digest == self._loaded_digest:
+            LOGGER.debug("Cached features are unchanged, skipping reload.")
+            return
+
         try:
-            warnings = self.engine.take_state(feature_provisioning)
+            warnings = self.take_state(feature_provisioning)
+            self._loaded_digest = digest
             if self.ready_callback:
                 self.ready_callback()
             if warnings:
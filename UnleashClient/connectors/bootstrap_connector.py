@@ -1,3 +1,5 @@
+from typing import Callable, Optional
+
 from yggdrasil_engine.engine import UnleashEngine
 
 from UnleashClient.cache import BaseCache
@@ -10,8 +12,15 @@ class BootstrapConnector(BaseConnector):
         self,
         engine: UnleashEngine,
         cache: BaseCache,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
     ):
-        super().__init__(engine, cache)
+        super().__init__(
+            engine,
+            cache,
+            state_callback=state_callback,
+            prepare_callback=prepare_callback,
+        )
         self.engine = engine
         self.cache = cache
         self.job = None
@@ -19,5 +28,5 @@ class BootstrapConnector(BaseConnector):
     def start(self):
         self.load_features()
 
-    def stop(self):
+    def stop(self, timeout: Optional[float] = None):
         pass
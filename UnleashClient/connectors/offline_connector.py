@@ -1,28 +1,34 @@
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 from yggdrasil_engine.engine import UnleashEngine
 
 from UnleashClient.cache import BaseCache
+from UnleashClient.scheduler import add_interval_job
 
 from .base_connector import BaseConnector
 
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
 
 class OfflineConnector(BaseConnector):
     def __init__(
         self,
         engine: UnleashEngine,
         cache: BaseCache,
-        scheduler: BackgroundScheduler,
+        scheduler: "BackgroundScheduler",
         scheduler_executor: str = "default",
         refresh_interval: int = 15,
         refresh_jitter: int = None,
         ready_callback: Callable = None,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
     ):
         self.engine = engine
         self.cache = cache
         self.ready_callback = ready_callback
+        self.state_callback = state_callback
+        self.prepare_callback = prepare_callback
         self.scheduler = scheduler
         self.scheduler_executor = scheduler_executor
         self.refresh_interval = refresh_interval
@@ -32,18 +38,18 @@ class OfflineConnector(BaseConnector):
     def start(self):
         self.load_features()
 
-        self.job = self.scheduler.add_job(
+        self.job = add_interval_job(
+            self.scheduler,
             self.load_features,
-            trigger=IntervalTrigger(
-                seconds=self.refresh_interval, jitter=self.refresh_jitter
-            ),
+            seconds=self.refresh_interval,
+            jitter=self.refresh_jitter,
             executor=self.scheduler_executor,
         )
 
         if self.ready_callback:
             self.ready_callback()
 
-    def stop(self):
+    def stop(self, timeout: Optional[float] = None):
         if self.job:
             self.job.remove()
             self.job = None
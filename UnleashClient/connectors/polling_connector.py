@@ -1,25 +1,27 @@
-import uuid
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import requests
 from yggdrasil_engine.engine import UnleashEngine
 
 from UnleashClient.api import get_feature_toggles
 from UnleashClient.cache import BaseCache
 from UnleashClient.constants import ETAG, FEATURES_URL
 from UnleashClient.events import UnleashEventType, UnleashFetchedEvent
+from UnleashClient.scheduler import add_interval_job
 from UnleashClient.utils import LOGGER
 
 from .base_connector import BaseConnector
 
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
 
 class PollingConnector(BaseConnector):
     def __init__(
         self,
         engine: UnleashEngine,
         cache: BaseCache,
-        scheduler: BackgroundScheduler,
+        scheduler: "BackgroundScheduler",
         url: str,
         app_name: str,
         instance_id: str,
@@ -33,6 +35,9 @@ class PollingConnector(BaseConnector):
         refresh_jitter: int = None,
         event_callback: Optional[Callable] = None,
         ready_callback: Optional[Callable] = None,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
+        session: Optional[requests.Session] = None,
     ):
         self.engine = engine
         self.cache = cache
@@ -50,6 +55,9 @@ class PollingConnector(BaseConnector):
         self.refresh_jitter = refresh_jitter
         self.event_callback = event_callback
         self.ready_callback = ready_callback
+        self.state_callback = state_callback
+        self.prepare_callback = prepare_callback
+        self.session = session
         self.job = None
 
     def _fetch_and_load(self):
@@ -66,6 +74,7 @@ class PollingConnector(BaseConnector):
             request_retries=self.request_retries,
             project=self.project,
             cached_etag=self.cache.get(ETAG),
+            session=self.session,
         )
 
         if state:
@@ -84,7 +93,7 @@ class PollingConnector(BaseConnector):
             if self.event_callback:
                 event = UnleashFetchedEvent(
                     event_type=UnleashEventType.FETCHED,
-                    event_id=uuid.uuid4(),
+                    event_id=None,
                     raw_features=state,
                 )
                 self.event_callback(event)
@@ -94,16 +103,15 @@ class PollingConnector(BaseConnector):
     def start(self):
         self._fetch_and_load()
 
-        self.job = self.scheduler.add_job(
+        self.job = add_interval_job(
+            self.scheduler,
             self._fetch_and_load,
-            trigger=IntervalTrigger(
-                seconds=self.refresh_interval,
-                jitter=self.refresh_jitter,
-            ),
+            seconds=self.refresh_interval,
+            jitter=self.refresh_jitter,
             executor=self.scheduler_executor,
         )
 
-    def stop(self):
+    def stop(self, timeout: Optional[float] = None):
         if self.job:
             self.job.remove()
             self.job = None
@@ -0,0 +1,122 @@
+import os
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+from yggdrasil_engine.engine import UnleashEngine
+
+from UnleashClient.cache import BaseCache
+from UnleashClient.scheduler import add_interval_job
+from UnleashClient.shared_state import read_header, read_state_file
+from UnleashClient.utils import LOGGER
+
+from .base_connector import BaseConnector
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+
+class SharedStateConnector(BaseConnector):
+    """
+    Loads features from a state file published by another process's
+    :class:`~UnleashClient.shared_state.SharedStatePublisher`.
+
+    The file is checked every ``refresh_interval`` seconds, which usually costs a single
+    ``stat``.  The engine is only reloaded when the published generation or payload digest
+    changes, so a publisher that restarts from generation 1 is still picked up.  Until the file
+    exists, features are loaded from the cache.
+    """
+
+    def __init__(
+        self,
+        engine: UnleashEngine,
+        cache: BaseCache,
+        scheduler: "BackgroundScheduler",
+        path: str,
+        scheduler_executor: str = "default",
+        refresh_interval: int = 15,
+        refresh_jitter: int = None,
+        ready_callback: Optional[Callable] = None,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(
+            engine=engine,
+            cache=cache,
+            ready_callback=ready_callback,
+            state_callback=state_callback,
+            prepare_callback=prepare_callback,
+        )
+        self.scheduler = scheduler
+        self.path = path
+        self.scheduler_executor = scheduler_executor
+        self.refresh_interval = refresh_interval
+        self.refresh_jitter = refresh_jitter
+        self.generation: Optional[int] = None
+        self.digest: Optional[bytes] = None
+        self._file_id: Optional[Tuple[int, int, int]] = None
+        self.job = None
+
+    def refresh(self) -> bool:
+        """
+        Reloads the engine if new state has been published.
+
+        :return: True if new state was loaded.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+
+        # The publisher renames a new file into place, so an unchanged inode means unchanged state.
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_id == self._file_id:
+            return False
+
+        try:
+            header = read_header(self.path)
+            # A payload-less file is an MmapCache that only holds other keys so far.
+            if (
+                header is None
+                or not header[2]
+                or (header[0], header[3]) == (self.generation, self.digest)
+            ):
+                self._file_id = file_id
+                return False
+
+            shared_state = read_state_file(self.path)
+            if shared_state is None:
+                return False
+
+            warnings = self.take_state(shared_state.payload.decode("utf-8"))
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Unable to load shared feature state: %s", exc)
+            return False
+
+        if warnings:
+            LOGGER.warning(
+                "Some features were not able to be parsed correctly, they may not evaluate as expected"
+            )
+            LOGGER.warning(warnings)
+
+        self.generation = shared_state.generation
+        self.digest = shared_state.digest
+        self._file_id = file_id
+        if self.ready_callback:
+            self.ready_callback()
+        return True
+
+    def start(self):
+        if not self.refresh():
+            self.load_features()
+
+        self.job = add_interval_job(
+            self.scheduler,
+            self.refresh,
+            seconds=self.refresh_interval,
+            jitter=self.refresh_jitter,
+            executor=self.scheduler_executor,
+        )
+
+    def stop(self, timeout: Optional[float] = None):
+        if self.job:
+            self.job.remove()
+            self.job = None
@@ -1,5 +1,7 @@
+import json
+import queue
 import threading
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 
 from ld_eventsource import SSEClient
 from ld_eventsource.config import ConnectStrategy, ErrorStrategy, RetryDelayStrategy
@@ -8,7 +10,7 @@ from yggdrasil_engine.engine import UnleashEngine
 from UnleashClient.cache import BaseCache
 from UnleashClient.connectors.base_connector import BaseConnector
 from UnleashClient.constants import APPLICATION_HEADERS, FEATURES_URL, STREAMING_URL
-from UnleashClient.utils import LOGGER
+from UnleashClient.utils import LOGGER, Deadline
 
 
 class StreamingConnector(BaseConnector):
@@ -25,8 +27,25 @@ class StreamingConnector(BaseConnector):
         backoff_multiplier: float = 2.0,
         backoff_jitter: Optional[float] = 0.5,
         custom_options: Optional[dict] = None,
+        state_callback: Optional[Callable[[str], None]] = None,
+        prepare_callback: Optional[Callable[[], None]] = None,
+        persist_delay: float = 5.0,
     ) -> None:
-        super().__init__(engine=engine, cache=cache, ready_callback=ready_callback)
+        """
+        Received events are applied on a separate thread.  Delta events that queue up while the
+        engine is busy are merged and applied with a single ``take_state`` call, because the engine
+        rebuilds every feature whenever it takes new state.
+
+        :param persist_delay: Number of seconds to wait after an update before writing the state
+            to the cache, so that a burst of updates is only persisted once.
+        """
+        super().__init__(
+            engine=engine,
+            cache=cache,
+            ready_callback=ready_callback,
+            state_callback=state_callback,
+            prepare_callback=prepare_callback,
+        )
         self._base_url = url.rstrip("/") + STREAMING_URL
         self._headers = {
             **headers,
@@ -41,6 +60,14 @@ class StreamingConnector(BaseConnector):
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._client: Optional[SSEClient] = None
+        self._events: "queue.SimpleQueue[Optional[Tuple[str, str]]]" = (
+            queue.SimpleQueue()
+        )
+        self._applier: Optional[threading.Thread] = None
+        self._persist_delay = persist_delay
+        self._persist_lock = threading.Lock()
+        self._persist_timer: Optional[threading.Timer] = None
+        self._dirty = False
         base_options = custom_options or {}
         if self._timeout is not None and "timeout" not in base_options:
             base_options = {"timeout": self._timeout, **base_options}
@@ -50,12 +77,17 @@ class StreamingConnector(BaseConnector):
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._applier = threading.Thread(
+            target=self._apply_queued, name="UnleashStreamingApplier", daemon=True
+        )
+        self._applier.start()
         self._thread = threading.Thread(
             target=self._run, name="UnleashStreaming", daemon=True
         )
         self._thread.start()
 
-    def stop(self):
+    def stop(self, timeout: Optional[float] = None):
+        deadline = Deadline(timeout)
         self._stop.set()
         try:
             if self._client:
@@ -63,7 +95,104 @@ class StreamingConnector(BaseConnector):
         except Exception:
             pass
         if self._thread:
-            self._thread.join(timeout=5)
+            self._thread.join(timeout=deadline.remaining(5))
+        if self._applier:
+            self._events.put(None)
+            self._applier.join(timeout=deadline.remaining(5))
+            self._applier = None
+        self._persist()
+
+    def _persist_payload(self, payload: str) -> None:
+        # Connect events carry the complete state, so they can be cached as received.
+        with self._persist_lock:
+            self._cancel_persist()
+            self.cache.set(FEATURES_URL, payload)
+
+    def _schedule_persist(self) -> None:
+        with self._persist_lock:
+            self._dirty = True
+            if self._persist_timer is None:
+                self._persist_timer = threading.Timer(
+                    self._persist_delay, self._persist
+                )
+                self._persist_timer.daemon = True
+                self._persist_timer.start()
+
+    def _cancel_persist(self) -> None:
+        # Called with the persist lock held.
+        self._dirty = False
+        if self._persist_timer is not None:
+            self._persist_timer.cancel()
+            self._persist_timer = None
+
+    def _persist(self) -> None:
+        with self._persist_lock:
+            if not self._dirty:
+                return
+            self._cancel_persist()
+            try:
+                self.cache.set(FEATURES_URL, self.engine.get_state())
+            except Exception:
+                LOGGER.warning("Unable to cache streamed features", exc_info=True)
+
+    def _apply_event(self, event_type: str, data: str) -> None:
+        try:
+            self.take_state(data)
+            if event_type != "unleash-connected":
+                self._schedule_persist()
+                return
+
+            self._persist_payload(data)
+            if self.ready_callback:
+                try:
+                    self.ready_callback()
+                except Exception:
+                    LOGGER.debug("Ready callback failed", exc_info=True)
+        except Exception:
+            LOGGER.error("Error applying streaming state", exc_info=True)
+            self.load_features()
+
+    def _apply_queued(self) -> None:
+        while True:
+            batch = [self._events.get()]
+            while True:
+                try:
+                    batch.append(self._events.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [event for event in batch if event is not None]
+            if events:
+                self._apply_events(events)
+            if len(events) < len(batch):
+                return
+
+    def _apply_events(self, events: List[Tuple[str, str]]) -> None:
+        # A connect event carries the complete state, so anything received before it is stale.
+        for index in range(len(events) - 1, -1, -1):
+            if events[index][0] == "unleash-connected":
+                events = events[index:]
+                break
+
+        pending: List[Tuple[str, list]] = []
+        for event_type, data in events:
+            delta = _delta_events(data) if event_type == "unleash-updated" else None
+            if delta is not None:
+                pending.append((data, delta))
+                continue
+
+            self._apply_deltas(pending)
+            pending = []
+            self._apply_event(event_type, data)
+        self._apply_deltas(pending)
+
+    def _apply_deltas(self, deltas: List[Tuple[str, list]]) -> None:
+        if len(deltas) == 1:
+            self._apply_event("unleash-updated", deltas[0][0])
+        elif deltas:
+            LOGGER.debug("Applying %d queued streaming updates at once", len(deltas))
+            merged = [event for _, delta in deltas for event in delta]
+            self._apply_event("unleash-updated", json.dumps({"events": merged}))
 
     def _run(self):
         try:
@@ -98,18 +227,7 @@ class StreamingConnector(BaseConnector):
                     continue
 
                 if event.event in ("unleash-connected", "unleash-updated"):
-                    try:
-                        self.engine.take_state(event.data)
-                        self.cache.set(FEATURES_URL, self.engine.get_state())
-
-                        if event.event == "unleash-connected" and self.ready_callback:
-                            try:
-                                self.ready_callback()
-                            except Exception:
-                                LOGGER.debug("Ready callback failed", exc_info=True)
-                    except Exception:
-                        LOGGER.error("Error applying streaming state", exc_info=True)
-                        self.load_features()
+                    self._events.put((event.event, event.data))
                 else:
                     LOGGER.debug("Ignoring SSE event type: %s", event.event)
 
@@ -123,3 +241,11 @@ class StreamingConnector(BaseConnector):
                     self._client.close()
             except Exception:
                 pass
+
+
+def _delta_events(data: str) -> Optional[list]:
+    try:
+        events = json.loads(data).get("events")
+    except Exception:
+        return None
+    return events if isinstance(events, list) else None
@@ -1,10 +1,10 @@
-from importlib_metadata import version
+from typing import Any
 
 # Library
 SDK_NAME = "unleash-python-sdk"
-SDK_VERSION = version("UnleashClient")
 REQUEST_TIMEOUT = 30
 REQUEST_RETRIES = 3
+CONNECTION_POOL_SIZE = 10
 METRIC_LAST_SENT_TIME = "mlst"
 CLIENT_SPEC_VERSION = "5.2.2"
 
@@ -13,7 +13,11 @@ APPLICATION_HEADERS = {
     "Content-Type": "application/json",
     "Unleash-Client-Spec": CLIENT_SPEC_VERSION,
 }
-DISABLED_VARIATION = {"name": "disabled", "enabled": False, "feature_enabled": False}
+DISABLED_VARIATION: dict = {
+    "name": "disabled",
+    "enabled": False,
+    "feature_enabled": False,
+}
 
 # Paths
 REGISTER_URL = "/client/register"
@@ -24,3 +28,15 @@ STREAMING_URL = "/client/streaming"
 # Cache keys
 FAILED_STRATEGIES = "failed_strategies"
 ETAG = "etag"
+PENDING_METRICS = "pending_metrics"
+
+
+def __getattr__(name: str) -> Any:
+    # Reading package metadata is slow, so SDK_VERSION is only looked up when first used.
+    if name != "SDK_VERSION":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib_metadata import version  # noqa: PLC0415
+
+    value = globals()["SDK_VERSION"] = version("UnleashClient")
+    return value
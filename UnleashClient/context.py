@@ -0,0 +1,168 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+BASE_CONTEXT_FIELDS = [
+    "userId",
+    "sessionId",
+    "environment",
+    "appName",
+    "currentTime",
+    "remoteAddress",
+    "properties",
+]
+
+
+def _extract_properties(context: dict) -> dict:
+    properties = context.get("properties", {})
+    extracted_fields = {
+        k: v for k, v in context.items() if k not in BASE_CONTEXT_FIELDS
+    }
+    extracted_fields.update(properties)
+    return extracted_fields
+
+
+def _safe_context_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class CoarseClock:
+    """
+    Produces the current UTC time as an ISO 8601 string, formatting at most once per millisecond.
+    """
+
+    __slots__ = ("_cached",)
+
+    def __init__(self) -> None:
+        self._cached: Tuple[int, str] = (-1, "")
+
+    def isoformat(self) -> str:
+        now_millis = time.time_ns() // 1_000_000
+        cached = self._cached
+        if cached[0] == now_millis:
+            return cached[1]
+
+        value = datetime.fromtimestamp(now_millis / 1000, timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
+        self._cached = (now_millis, value)
+        return value
+
+
+CLOCK = CoarseClock()
+
+
+def normalize_context(
+    context: Optional[dict], static_context: Optional[dict] = None
+) -> Dict[str, Any]:
+    """
+    Merges a context with the static context and converts it to the shape expected by the engine.
+
+    Custom fields in the root of the context are moved into ``properties`` and every value is
+    converted to a string.  ``currentTime`` is left untouched; it's filled in at evaluation time.
+    """
+    new_context: Dict[str, Any] = dict(static_context or {})
+    new_context.update(context or {})
+
+    safe_properties = {
+        k: _safe_context_value(v) for k, v in _extract_properties(new_context).items()
+    }
+    safe_context: Dict[str, Any] = {
+        k: _safe_context_value(v) for k, v in new_context.items() if k != "properties"
+    }
+    safe_context["properties"] = safe_properties
+
+    return safe_context
+
+
+def trim_context(context: dict, fields: Iterable[str]) -> dict:
+    """
+    Keeps only the given fields of a normalized context.  Custom fields are only kept in
+    ``properties``, which is where the engine reads them from.
+    """
+    properties = context["properties"]
+    trimmed = {
+        field: context[field]
+        for field in fields
+        if field in context and field in BASE_CONTEXT_FIELDS
+    }
+    trimmed["properties"] = {
+        field: properties[field] for field in fields if field in properties
+    }
+    return trimmed
+
+
+def copy_context(context: dict) -> dict:
+    """
+    Copies a normalized context, including its ``properties``, so it can be handed to user code
+    without exposing a context that's shared between evaluations.
+    """
+    return {**context, "properties": dict(context["properties"])}
+
+
+def callback_context(context: dict) -> dict:
+    """
+    Copies a normalized context for fallback functions and impression events.  ``currentTime`` is
+    only passed to the engine when it's needed, so it's filled in here if it's missing.
+    """
+    copied = copy_context(context)
+    if "currentTime" not in copied:
+        copied["currentTime"] = CLOCK.isoformat()
+    return copied
+
+
+class UnleashContext:  # noqa: PLW1641
+    """
+    A pre-normalized, immutable context that can be passed to any evaluation method on UnleashClient.
+
+    Normalizing a context (merging in the static context, moving custom fields into
+    ``properties`` and converting values to strings) happens once, when the object is created,
+    instead of on every flag check.  Build it with :meth:`UnleashClient.build_context` so that the
+    client's ``appName`` and ``environment`` are included.
+
+    Example:
+
+    .. code-block:: python
+
+        context = client.build_context({"userId": "123", "plan": "premium"})
+        client.is_enabled("my_toggle", context)
+        client.get_variant("my_variant_toggle", context)
+
+    :param context: Dictionary with context (e.g. IPs, email) for feature toggles.
+    :param static_context: Fields shared by every evaluation, e.g. ``appName`` and ``environment``.
+    """
+
+    __slots__ = ("_fields",)
+
+    _fields: Dict[str, Any]
+
+    def __init__(
+        self, context: Optional[dict] = None, static_context: Optional[dict] = None
+    ) -> None:
+        object.__setattr__(self, "_fields", normalize_context(context, static_context))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("UnleashContext is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("UnleashContext is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UnleashContext):
+            return NotImplemented
+        return self._fields == other._fields
+
+    def __repr__(self) -> str:
+        return f"UnleashContext({self._fields!r})"
+
+    @property
+    def has_current_time(self) -> bool:
+        return "currentTime" in self._fields
+
+    def to_dict(self) -> dict:
+        """
+        Returns a copy of the normalized context.
+        """
+        return copy_context(self._fields)
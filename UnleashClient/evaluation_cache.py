@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+MISSING = object()
+
+
+class EvaluationCache:
+    """
+    Bounded LRU cache for feature evaluation results, with an optional time to live.
+
+    Pass an instance to UnleashClient to memoize engine results.  Keys include the feature state
+    revision, so entries from a previous feature set are never returned; the client also clears
+    the cache whenever the feature set changes.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.evaluation_cache import EvaluationCache
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(
+                evaluation_cache=EvaluationCache(maxsize=10000, ttl=60)
+            ),
+        )
+
+    :param maxsize: Maximum number of results to keep.
+    :param ttl: Optional number of seconds after which a result expires.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("Evaluation cache size must be a positive integer.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        :return: The cached value, or ``MISSING`` if there's no live entry for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+
+            value, expires_at = entry
+            if self.ttl is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,9 +1,13 @@
+import uuid
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from json import loads
-from typing import Optional
+from typing import Any, Optional, TypeVar
 from uuid import UUID
 
+EventClass = TypeVar("EventClass", bound=type)
+
 
 class UnleashEventType(Enum):
     """
@@ -14,18 +18,69 @@ class UnleashEventType(Enum):
     VARIANT = "variant"
     FETCHED = "fetched"
     READY = "ready"
+    IMPRESSION_SUMMARY = "impression_summary"
+
+
+def _get_event_id(self: Any) -> UUID:
+    if self._event_id is None:
+        self._event_id = uuid.uuid4()
+    return self._event_id
+
+
+def _set_event_id(self: Any, event_id: Optional[UUID]) -> None:
+    self._event_id = event_id
 
 
+def _getstate(self: Any) -> tuple:
+    # Copies and unpickled events keep the same event_id.
+    _get_event_id(self)
+    slots = {
+        name
+        for cls in type(self).__mro__
+        for name in cls.__dict__.get("__slots__", ())
+        if hasattr(self, name)
+    }
+    return None, {name: getattr(self, name) for name in slots}
+
+
+def _slotted(cls: EventClass) -> EventClass:
+    """
+    Recreates a dataclass with ``__slots__``, like ``dataclass(slots=True)`` does on Python 3.10+.
+    The ``event_id`` field is stored in a private slot and generated when it's first read.
+    """
+    fields = tuple(cls.__dict__.get("__annotations__", {}))
+    extra_slots = tuple(cls.__dict__.get("__slots__", ()))
+    namespace = {
+        name: value
+        for name, value in cls.__dict__.items()
+        if name not in fields + extra_slots + ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = (
+        tuple("_event_id" if name == "event_id" else name for name in fields)
+        + extra_slots
+    )
+    if "event_id" in fields:
+        namespace["event_id"] = property(_get_event_id, _set_event_id)
+        namespace["__getstate__"] = _getstate
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)  # type: ignore[return-value]
+
+
+@_slotted
 @dataclass
 class BaseEvent:
     """
     Base event type for all events in the Unleash client.
+
+    Events are created with an ``event_id`` of None when it isn't known yet; a random UUID is then
+    generated the first time ``event_id`` is read.
     """
 
     event_type: UnleashEventType
-    event_id: UUID
+    event_id: Optional[UUID]
 
 
+@_slotted
 @dataclass
 class UnleashEvent(BaseEvent):
     """
@@ -38,6 +93,23 @@ class UnleashEvent(BaseEvent):
     variant: Optional[str] = ""
 
 
+@_slotted
+@dataclass
+class UnleashImpressionSummaryEvent(BaseEvent):
+    """
+    Dataclass counting the feature flag or variant checks of a feature with the same result over
+    an interval.
+    """
+
+    feature_name: str
+    enabled: bool
+    variant: str
+    count: int
+    start: datetime
+    stop: datetime
+
+
+@_slotted
 @dataclass
 class UnleashReadyEvent(BaseEvent):
     """
@@ -47,12 +119,15 @@ class UnleashReadyEvent(BaseEvent):
     pass
 
 
+@_slotted
 @dataclass
 class UnleashFetchedEvent(BaseEvent):
     """
     Event indicating that the Unleash client has fetched feature flags.
     """
 
+    __slots__ = ("_parsed_payload",)
+
     raw_features: str
 
     @property
@@ -0,0 +1,442 @@
+import json
+import threading
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+
+from UnleashClient.utils import LOGGER
+
+DATE_OPERATORS = frozenset(["DATE_AFTER", "DATE_BEFORE"])
+
+# Context fields read by the built-in strategies, excluding stickiness.
+_STRATEGY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "default": (),
+    "userWithId": ("userId",),
+    "gradualRolloutUserId": ("userId",),
+    "gradualRolloutSessionId": ("sessionId",),
+    "gradualRolloutRandom": (),
+    "flexibleRollout": (),
+    "remoteAddress": ("remoteAddress",),
+}
+_RANDOM_STRATEGIES = frozenset(["gradualRolloutRandom"])
+
+# "default" stickiness falls back to a random value when none of these are set.  This holds
+# for variants too: the engine doesn't use remoteAddress for their default stickiness.
+_DEFAULT_STICKINESS = frozenset(["userId", "sessionId"])
+
+
+class _FeatureInfo(NamedTuple):
+    fields: FrozenSet[str]
+    segments: Tuple[int, ...]
+    dependencies: Tuple[str, ...]
+    deterministic: bool
+    identity: Optional[FrozenSet[str]]
+    custom: bool
+    required: FrozenSet[str]
+
+
+class _Resolved(NamedTuple):
+    fields: Optional[Tuple[str, ...]]
+    deterministic: bool
+    identity: Optional[FrozenSet[str]]
+    required: FrozenSet[str]
+
+
+def _constraint_fields(constraints: Iterable[dict]) -> Set[str]:
+    fields = set()
+    for constraint in constraints:
+        if constraint.get("operator") in DATE_OPERATORS:
+            fields.add("currentTime")
+        if constraint.get("contextName"):
+            fields.add(constraint["contextName"])
+    return fields
+
+
+def _merge_identity(
+    identity: Optional[FrozenSet[str]], other: Optional[FrozenSet[str]]
+) -> Optional[FrozenSet[str]]:
+    # The stricter requirement (fewer acceptable fields) wins.
+    if identity is None:
+        return other
+    if other is None:
+        return identity
+    return identity & other
+
+
+class _StickinessCollector:
+    def __init__(self) -> None:
+        self.fields: Set[str] = set()
+        self.deterministic = True
+        self.identity: Optional[FrozenSet[str]] = None
+        # Custom stickiness fields that must be set for variants to be deterministic.
+        self.required: Set[str] = set()
+
+    def add(self, stickiness: Optional[str]) -> None:
+        if not stickiness or stickiness == "default":
+            self.fields.update(_DEFAULT_STICKINESS)
+            self.identity = _merge_identity(self.identity, _DEFAULT_STICKINESS)
+        elif stickiness == "random":
+            self.deterministic = False
+        else:
+            self.fields.add(stickiness)
+
+    def add_variants(self, variants: Iterable[dict]) -> None:
+        for variant in variants:
+            stickiness = variant.get("stickiness")
+            self.add(stickiness)
+            if stickiness and stickiness not in ("default", "random"):
+                # Variants are assigned randomly when the stickiness field is missing.
+                self.required.add(stickiness)
+            for override in variant.get("overrides") or []:
+                if override.get("contextName"):
+                    self.fields.add(override["contextName"])
+
+
+def _analyze_feature(feature: dict) -> _FeatureInfo:
+    collector = _StickinessCollector()
+    segments: Set[int] = set()
+    custom = False
+
+    for strategy in feature.get("strategies") or []:
+        name = strategy.get("name")
+        parameters = strategy.get("parameters") or {}
+
+        if name not in _STRATEGY_FIELDS:
+            # Custom strategies may read anything from the context, including currentTime.
+            custom = True
+            collector.deterministic = False
+            collector.fields.add("currentTime")
+        elif name in _RANDOM_STRATEGIES:
+            collector.deterministic = False
+        else:
+            collector.fields.update(_STRATEGY_FIELDS[name])
+
+        if name == "flexibleRollout":
+            collector.add(parameters.get("stickiness"))
+
+        collector.fields.update(_constraint_fields(strategy.get("constraints") or []))
+        segments.update(strategy.get("segments") or [])
+        collector.add_variants(strategy.get("variants") or [])
+
+    collector.add_variants(feature.get("variants") or [])
+
+    return _FeatureInfo(
+        fields=frozenset(collector.fields),
+        segments=tuple(sorted(segments)),
+        dependencies=tuple(
+            dependency["feature"] for dependency in feature.get("dependencies") or []
+        ),
+        deterministic=collector.deterministic,
+        identity=collector.identity,
+        custom=custom,
+        required=frozenset(collector.required),
+    )
+
+
+def _analyze_segment(segment: dict) -> FrozenSet[str]:
+    return frozenset(_constraint_fields(segment.get("constraints") or []))
+
+
+class FeatureIndex:
+    """
+    Summarizes what the feature set loaded into the engine needs from the evaluation context.
+
+    Connectors pass every payload they hand to the engine to :meth:`update`.  Both full feature
+    responses and streaming delta events are understood.  If a payload can't be analyzed the
+    index falls back to assuming every context field is needed, until a full payload (or a
+    hydration event) has been analyzed again.
+
+    ``revision`` is incremented on every update, so it can be used to tell results computed
+    against different feature sets apart.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._features: Dict[str, _FeatureInfo] = {}
+        self._segments: Dict[int, FrozenSet[str]] = {}
+        self._time_features: Set[str] = set()
+        self._time_segments: Set[int] = set()
+        self._resolved: Dict[str, Optional[_Resolved]] = {}
+        # Set when a payload couldn't be analyzed, so features may be missing from the index.
+        self._degraded = False
+        self._invalidated = False
+        self.uses_current_time = False
+        self.revision = 0
+
+    def update(self, state: str) -> None:
+        """
+        Updates the index from a payload that was just handed to the engine.
+
+        :param state: Raw feature payload or streaming delta, as passed to ``UnleashEngine.take_state``.
+        """
+        with self._lock:
+            self._invalidated = False
+            try:
+                if self._apply(json.loads(state)):
+                    # Only a full feature set makes up for payloads that failed to analyze.
+                    self._degraded = False
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Unable to analyze feature payload: %s", exc)
+                self._degraded = True
+            self._refresh()
+
+    def invalidate(self) -> None:
+        """
+        Treats every feature as reading the full context until the next :meth:`update` or
+        :meth:`restore`.  Call this before the engine takes new state, so that features it adds
+        aren't evaluated with a context trimmed for the previous feature set.
+        """
+        with self._lock:
+            self._invalidated = True
+            self._refresh()
+
+    def export(self) -> dict:
+        """
+        Serializes the analyzed feature set, so it can be restored without the original payload.
+        """
+        with self._lock:
+            return {
+                "features": {
+                    name: [
+                        sorted(info.fields),
+                        list(info.segments),
+                        list(info.dependencies),
+                        info.deterministic,
+                        None if info.identity is None else sorted(info.identity),
+                        info.custom,
+                        sorted(info.required),
+                    ]
+                    for name, info in self._features.items()
+                },
+                "segments": [
+                    [segment_id, sorted(fields)]
+                    for segment_id, fields in self._segments.items()
+                ],
+                "degraded": self._degraded or self._invalidated,
+            }
+
+    def restore(self, data: dict) -> None:
+        """
+        Replaces the index with one produced by :meth:`export`.
+        """
+        with self._lock:
+            self._invalidated = False
+            try:
+                features = {
+                    name: _FeatureInfo(
+                        frozenset(fields),
+                        tuple(segments),
+                        tuple(dependencies),
+                        deterministic,
+                        None if identity is None else frozenset(identity),
+                        custom,
+                        # Exports from before required fields were tracked lack them.
+                        frozenset(required[0] if required else ()),
+                    )
+                    for name, (
+                        fields,
+                        segments,
+                        dependencies,
+                        deterministic,
+                        identity,
+                        custom,
+                        *required,
+                    ) in data["features"].items()
+                }
+                segments = {
+                    segment_id: frozenset(fields)
+                    for segment_id, fields in data["segments"]
+                }
+                self._degraded = data["degraded"]
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Unable to restore feature index: %s", exc)
+                features, segments = {}, {}
+                self._degraded = True
+
+            self._replace(features, segments)
+            self._refresh()
+
+    def context_fields(self, feature_name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Lists the context fields that can influence a feature's evaluation, including fields read
+        through segments and parent features.
+
+        :return: Sorted field names, or None if the feature is unknown or may read any field
+            (e.g. because it uses a custom strategy).
+        """
+        resolved = self._resolve(feature_name)
+        if resolved is None:
+            return None
+        return resolved.fields
+
+    def all_context_fields(self) -> Dict[str, Optional[Tuple[str, ...]]]:
+        """
+        Lists the context fields read by every known feature.  See :meth:`context_fields`.
+        """
+        return {name: self.context_fields(name) for name in list(self._features)}
+
+    def fingerprint(self, feature_name: str, context: dict) -> Optional[tuple]:
+        """
+        Reduces a normalized context to the values that can influence a feature's evaluation.
+
+        :return: A hashable fingerprint that includes the state revision, or None if the result
+            for this feature and context isn't deterministic (e.g. custom strategies, random
+            stickiness, date constraints or a missing custom stickiness field).
+        """
+        revision = self.revision
+        resolved = self._resolve(feature_name)
+        if resolved is None or resolved.fields is None or not resolved.deterministic:
+            return None
+
+        if resolved.identity and not any(context.get(f) for f in resolved.identity):
+            return None
+
+        properties = context.get("properties") or {}
+        if resolved.required and not all(
+            context.get(f) or properties.get(f) for f in resolved.required
+        ):
+            return None
+
+        return (revision, feature_name) + tuple(
+            (context.get(field), properties.get(field)) for field in resolved.fields
+        )
+
+    def _resolve(self, feature_name: str) -> Optional[_Resolved]:
+        # Keep a reference to the map so that a concurrent update can't have results computed
+        # from the previous feature set written into the new map.
+        resolved_map = self._resolved
+        try:
+            return resolved_map[feature_name]
+        except KeyError:
+            pass
+
+        resolved = (
+            None
+            if self._degraded or self._invalidated
+            else self._resolve_uncached(feature_name, ())
+        )
+        resolved_map[feature_name] = resolved
+        return resolved
+
+    def _resolve_uncached(
+        self, feature_name: str, seen: Tuple[str, ...]
+    ) -> Optional[_Resolved]:
+        info = self._features.get(feature_name)
+        if info is None or feature_name in seen:
+            return None
+
+        fields = set(info.fields)
+        deterministic = info.deterministic
+        identity = info.identity
+        custom = info.custom
+        required = set(info.required)
+
+        for segment_id in info.segments:
+            segment_fields = self._segments.get(segment_id)
+            if segment_fields is None:
+                return None
+            fields.update(segment_fields)
+
+        for dependency in info.dependencies:
+            parent = self._resolve_uncached(dependency, seen + (feature_name,))
+            if parent is None:
+                # Unknown parents evaluate to false; the engine reports them as a warning.
+                deterministic = False
+                continue
+            if parent.fields is None:
+                custom = True
+            else:
+                fields.update(parent.fields)
+            deterministic = deterministic and parent.deterministic
+            identity = _merge_identity(identity, parent.identity)
+            required.update(parent.required)
+
+        if "currentTime" in fields:
+            deterministic = False
+
+        return _Resolved(
+            None if custom else tuple(sorted(fields)),
+            deterministic,
+            identity,
+            frozenset(required),
+        )
+
+    def _apply(self, payload: dict) -> bool:
+        if "events" not in payload:
+            self._hydrate(payload.get("features") or [], payload.get("segments") or [])
+            return True
+
+        hydrated = False
+        for event in payload["events"]:
+            event_type = event.get("type")
+            if event_type == "hydration":
+                self._hydrate(event.get("features") or [], event.get("segments") or [])
+                hydrated = True
+            elif event_type == "feature-updated":
+                self._set_feature(event["feature"])
+            elif event_type == "feature-removed":
+                self._remove_feature(event["featureName"])
+            elif event_type == "segment-updated":
+                self._set_segment(event["segment"])
+            elif event_type == "segment-removed":
+                self._remove_segment(event["segmentId"])
+        return hydrated
+
+    def _hydrate(self, features: Iterable[dict], segments: Iterable[dict]) -> None:
+        feature_infos = {
+            feature["name"]: _analyze_feature(feature) for feature in features
+        }
+        segment_fields = {
+            segment["id"]: _analyze_segment(segment) for segment in segments
+        }
+        self._replace(feature_infos, segment_fields)
+
+    def _replace(
+        self,
+        feature_infos: Dict[str, _FeatureInfo],
+        segment_fields: Dict[int, FrozenSet[str]],
+    ) -> None:
+        self._features = feature_infos
+        self._segments = segment_fields
+        self._time_features = {
+            name for name, info in feature_infos.items() if "currentTime" in info.fields
+        }
+        self._time_segments = {
+            segment_id
+            for segment_id, fields in segment_fields.items()
+            if "currentTime" in fields
+        }
+
+    def _set_feature(self, feature: dict) -> None:
+        name = feature["name"]
+        info = _analyze_feature(feature)
+        self._features[name] = info
+        if "currentTime" in info.fields:
+            self._time_features.add(name)
+        else:
+            self._time_features.discard(name)
+
+    def _remove_feature(self, name: str) -> None:
+        self._features.pop(name, None)
+        self._time_features.discard(name)
+
+    def _set_segment(self, segment: dict) -> None:
+        segment_id = segment["id"]
+        fields = _analyze_segment(segment)
+        self._segments[segment_id] = fields
+        if "currentTime" in fields:
+            self._time_segments.add(segment_id)
+        else:
+            self._time_segments.discard(segment_id)
+
+    def _remove_segment(self, segment_id: int) -> None:
+        self._segments.pop(segment_id, None)
+        self._time_segments.discard(segment_id)
+
+    def _refresh(self) -> None:
+        self._resolved = {}
+        self.uses_current_time = bool(
+            self._degraded
+            or self._invalidated
+            or self._time_features
+            or self._time_segments
+        )
+        self.revision += 1
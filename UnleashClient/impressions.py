@@ -0,0 +1,279 @@
+import random
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from UnleashClient.events import (
+    BaseEvent,
+    UnleashEventType,
+    UnleashImpressionSummaryEvent,
+)
+from UnleashClient.utils import LOGGER
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class ImpressionDispatcher:
+    """
+    Delivers impression events to the client's ``event_callback`` on a background thread, so the
+    callback doesn't run on the thread that checks the flag.
+
+    Events are queued in a bounded queue and delivered in batches by a single worker thread, which
+    is started when the first event arrives.  When the queue is full, ``overflow`` decides what
+    happens:
+
+    * ``"drop_oldest"``: the oldest queued event is discarded to make room.
+    * ``"drop_newest"``: the new event is discarded.
+    * ``"block"``: the flag check waits until there's room.
+
+    Discarded events are counted in ``dropped``.  Pending events are delivered when the client is
+    destroyed.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.impressions import ImpressionDispatcher
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            event_callback=send_to_analytics,
+            performance=PerformanceOptions(
+                impression_dispatcher=ImpressionDispatcher(max_queue_size=10000)
+            ),
+        )
+
+    :param max_queue_size: Maximum number of events waiting to be delivered.
+    :param overflow: What to do with new events when the queue is full.
+    :param batch_size: Maximum number of events taken from the queue at once.
+    :param batch_callback: Optional function called with each batch (a list of events) instead of
+        calling ``event_callback`` once per event.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        overflow: str = DROP_OLDEST,
+        batch_size: int = 100,
+        batch_callback: Optional[Callable[[List[BaseEvent]], None]] = None,
+    ) -> None:
+        if max_queue_size <= 0 or batch_size <= 0:
+            raise ValueError("Queue and batch sizes must be positive integers.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}, use one of {OVERFLOW_POLICIES}."
+            )
+
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.batch_callback = batch_callback
+        self.callback: Optional[Callable[[BaseEvent], None]] = None
+        self.dropped = 0
+        self.delivered = 0
+        self._queue: Deque[BaseEvent] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def bind(
+        self, callback: Optional[Callable[[BaseEvent], None]]
+    ) -> Optional[Callable[[BaseEvent], bool]]:
+        """
+        Sets the callback events are delivered to.
+
+        :return: The function to hand events to, or None if nothing would receive them.
+        """
+        self.callback = callback
+        if callback is None and self.batch_callback is None:
+            return None
+        return self.submit
+
+    def submit(self, event: BaseEvent) -> bool:
+        """
+        Queues an event for delivery.
+
+        :return: False if the event was dropped.
+        """
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size and not self._make_room():
+                self.dropped += 1
+                return False
+            if self._stopped:
+                self.dropped += 1
+                return False
+
+            self._queue.append(event)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="UnleashImpressions", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return True
+
+    def _make_room(self) -> bool:
+        # Called with the condition held.
+        if self.overflow == DROP_NEWEST:
+            return False
+        if self.overflow == DROP_OLDEST:
+            self._queue.popleft()
+            self.dropped += 1
+            return True
+
+        while len(self._queue) >= self.max_queue_size and not self._stopped:
+            self._condition.wait()
+        return not self._stopped
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Delivers queued events and stops the worker thread.  Events that can't be delivered within
+        ``timeout`` seconds are dropped.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        with self._condition:
+            if self._queue:
+                LOGGER.warning(
+                    "Dropping %d undelivered impression events.", len(self._queue)
+                )
+                self.dropped += len(self._queue)
+                self._queue.clear()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                # Wake up flag checks waiting for room.
+                self._condition.notify_all()
+
+            self._deliver(batch)
+
+    def _deliver(self, batch: List[BaseEvent]) -> None:
+        if self.batch_callback is not None:
+            try:
+                self.batch_callback(batch)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Error in impression batch callback: %s", exc)
+        elif self.callback is not None:
+            for event in batch:
+                try:
+                    self.callback(event)
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.warning("Error in event callback: %s", exc)
+
+        with self._condition:
+            self.delivered += len(batch)
+
+
+class ImpressionSampler:
+    """
+    Reduces the number of impression events for flags that are checked very often.
+
+    Full impression events, each carrying the context of the check, are only built for a fraction
+    of the checks of a flag.  Optionally, every check is also counted per feature, variant and
+    result, and the counts are emitted as :class:`~UnleashClient.events.UnleashImpressionSummaryEvent`
+    every ``aggregate_interval`` seconds.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.impressions import ImpressionSampler
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            event_callback=send_to_analytics,
+            performance=PerformanceOptions(
+                impression_sampler=ImpressionSampler(
+                    rates={"checkout-flow": 0.01}, aggregate_interval=60
+                )
+            ),
+        )
+
+    :param rates: Fraction of checks that produce a full event, by feature name.
+    :param default_rate: Fraction used for features not in ``rates``.  Use 0 with
+        ``aggregate_interval`` to only emit summaries.
+    :param aggregate_interval: Number of seconds between summary events, optional & defaults to
+        None (no summaries).
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        default_rate: float = 1.0,
+        aggregate_interval: Optional[float] = None,
+    ) -> None:
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        if not all(0 <= rate <= 1 for rate in (default_rate, *self.rates.values())):
+            raise ValueError("Sampling rates must be between 0 and 1.")
+        if aggregate_interval is not None and aggregate_interval <= 0:
+            raise ValueError("aggregate_interval must be a positive number of seconds.")
+
+        self.aggregate_interval = aggregate_interval
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, str, bool], int] = {}
+        self._start = datetime.now(timezone.utc)
+
+    def record(self, feature_name: str, enabled: bool, variant: str = "") -> bool:
+        """
+        Records a check of a feature that has impression data enabled.
+
+        :return: Whether a full impression event should be emitted for this check.
+        """
+        if self.aggregate_interval is not None:
+            key = (feature_name, variant, enabled)
+            with self._lock:
+                self._counts[key] = self._counts.get(key, 0) + 1
+
+        rate = self.rates.get(feature_name, self.default_rate)
+        return rate >= 1 or random.random() < rate
+
+    def summaries(self) -> List[UnleashImpressionSummaryEvent]:
+        """
+        Returns a summary event for every combination of feature, variant and result checked since
+        the last call, and starts a new interval.
+        """
+        stop = datetime.now(timezone.utc)
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            start, self._start = self._start, stop
+
+        return [
+            UnleashImpressionSummaryEvent(
+                event_type=UnleashEventType.IMPRESSION_SUMMARY,
+                event_id=None,
+                feature_name=feature_name,
+                enabled=enabled,
+                variant=variant,
+                count=count,
+                start=start,
+                stop=stop,
+            )
+            for (feature_name, variant, enabled), count in counts.items()
+        ]
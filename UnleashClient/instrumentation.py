@@ -0,0 +1,184 @@
+import bisect
+import math
+import threading
+from time import perf_counter
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from UnleashClient.utils import LOGGER
+
+# Phases of a flag check.  Context normalization is only recorded for is_enabled and get_variant;
+# the *_many methods normalize the context once for all flags.
+CONTEXT = "context"
+ENGINE = "engine"
+METRICS = "metrics"
+EVENTS = "events"
+
+# Upper bounds of the latency buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.01,
+)
+
+
+class Histogram:
+    """
+    Counts observations in buckets with fixed upper bounds, like a Prometheus histogram.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict:
+        """
+        :return: Count and sum of the observations, and the cumulative count for each upper bound
+            (including ``math.inf``).
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*self.bounds, math.inf), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class EvaluationTimer:
+    """
+    Times the phases of a single flag check.  Created by :meth:`EvaluationInstrumentation.timer`.
+    """
+
+    __slots__ = ("_instrumentation", "feature_name", "_last")
+
+    def __init__(
+        self, instrumentation: "EvaluationInstrumentation", feature_name: str
+    ) -> None:
+        self._instrumentation = instrumentation
+        self.feature_name = feature_name
+        self._last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """
+        Records the time since the timer was created or since the previous phase ended.
+        """
+        now = perf_counter()
+        self._instrumentation.record(self.feature_name, phase, now - self._last)
+        self._last = now
+
+
+class EvaluationInstrumentation:
+    """
+    Records how long flag checks take, per feature and per phase, and how often fallbacks are used.
+
+    A check is split into the phases ``"context"`` (normalizing the context), ``"engine"``
+    (evaluating the flag, including the fallback function), ``"metrics"`` (counting the check) and
+    ``"events"`` (impression events).  Results are available from :meth:`snapshot` and can also be
+    forwarded to a metrics library as they're recorded:
+
+    .. code-block:: python
+
+        from prometheus_client import Histogram
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.instrumentation import EvaluationInstrumentation
+
+        latency = Histogram("unleash_check_seconds", "Flag check latency", ["feature", "phase"])
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(
+                instrumentation=EvaluationInstrumentation(
+                    latency_callback=lambda feature, phase, seconds: latency.labels(
+                        feature, phase
+                    ).observe(seconds)
+                )
+            ),
+        )
+
+    :param buckets: Upper bounds of the latency buckets in seconds, in increasing order.
+    :param latency_callback: Optional function called with the feature name, phase and duration in
+        seconds of every recorded phase, e.g. to record an OpenTelemetry histogram.
+    :param fallback_callback: Optional function called with the feature name whenever a check
+        falls back because the flag couldn't be evaluated.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        latency_callback: Optional[Callable[[str, str, float], None]] = None,
+        fallback_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.latency_callback = latency_callback
+        self.fallback_callback = fallback_callback
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._fallbacks: Dict[str, int] = {}
+
+    def timer(self, feature_name: str) -> EvaluationTimer:
+        return EvaluationTimer(self, feature_name)
+
+    def record(self, feature_name: str, phase: str, seconds: float) -> None:
+        key = (feature_name, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+        if self.latency_callback is not None:
+            try:
+                self.latency_callback(feature_name, phase, seconds)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Error in latency callback: %s", exc)
+
+    def record_fallback(self, feature_name: str) -> None:
+        with self._lock:
+            self._fallbacks[feature_name] = self._fallbacks.get(feature_name, 0) + 1
+
+        if self.fallback_callback is not None:
+            try:
+                self.fallback_callback(feature_name)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Error in fallback callback: %s", exc)
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        Returns everything recorded so far:
+
+        .. code-block:: python
+
+            {
+                "latency": {"my_toggle": {"engine": {"count": 2, "sum": 0.00003, "buckets": {...}}}},
+                "fallbacks": {"missing_toggle": 1},
+            }
+
+        :param reset: Whether to start over after taking the snapshot.
+        """
+        latency: Dict[str, dict] = {}
+        with self._lock:
+            for (feature_name, phase), histogram in self._histograms.items():
+                latency.setdefault(feature_name, {})[phase] = histogram.to_dict()
+            fallbacks = dict(self._fallbacks)
+            if reset:
+                self._histograms = {}
+                self._fallbacks = {}
+
+        return {"latency": latency, "fallbacks": fallbacks}
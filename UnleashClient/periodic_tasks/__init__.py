@@ -1,2 +1,21 @@
 # ruff: noqa: F401
-from .send_metrics import aggregate_and_send_metrics
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .metrics_shards import MetricsShards, collect_metrics
+from .metrics_spool import MetricsSpool, merge_buckets
+
+if TYPE_CHECKING:
+    from .send_metrics import aggregate_and_send_metrics
+
+
+def __getattr__(name: str) -> Any:
+    # Sending metrics needs requests, which is only imported when metrics are first sent.
+    if name != "aggregate_and_send_metrics":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = importlib.import_module(
+        ".send_metrics", __name__
+    ).aggregate_and_send_metrics
+    globals()[name] = value
+    return value
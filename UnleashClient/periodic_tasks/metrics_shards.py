@@ -0,0 +1,134 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from yggdrasil_engine.engine import UnleashEngine
+
+from .metrics_spool import merge_buckets
+
+
+def _timestamp() -> str:
+    # Same format as the engine's buckets, so merged buckets compare timestamps correctly.
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f000Z")
+
+
+class _Shard:
+    __slots__ = ("thread", "toggles", "variants", "_seen_toggles", "_seen_variants")
+
+    def __init__(self) -> None:
+        self.thread = threading.current_thread()
+        # Only written by the owning thread.  The counts only grow; collect() reports the
+        # difference to what it saw last time, so no lock is needed.
+        self.toggles: Dict[Tuple[str, bool], int] = {}
+        self.variants: Dict[Tuple[str, str], int] = {}
+        self._seen_toggles: Dict[Tuple[str, bool], int] = {}
+        self._seen_variants: Dict[Tuple[str, str], int] = {}
+
+    def collect(self, toggles: Dict[str, dict]) -> bool:
+        # dict.copy() is atomic, so the owning thread can keep counting meanwhile.
+        current_toggles, current_variants = self.toggles.copy(), self.variants.copy()
+        changed = False
+
+        for (feature_name, enabled), count in current_toggles.items():
+            delta = count - self._seen_toggles.get((feature_name, enabled), 0)
+            if delta:
+                toggle = toggles.setdefault(
+                    feature_name, {"yes": 0, "no": 0, "variants": {}}
+                )
+                toggle["yes" if enabled else "no"] += delta
+                changed = True
+
+        for (feature_name, variant), count in current_variants.items():
+            delta = count - self._seen_variants.get((feature_name, variant), 0)
+            if delta:
+                variants = toggles.setdefault(
+                    feature_name, {"yes": 0, "no": 0, "variants": {}}
+                )["variants"]
+                variants[variant] = variants.get(variant, 0) + delta
+                changed = True
+
+        self._seen_toggles, self._seen_variants = current_toggles, current_variants
+        return changed
+
+
+class MetricsShards:
+    """
+    Counts feature flag and variant checks in per-thread shards instead of in the engine.
+
+    Each check is then a single increment of a dictionary owned by the calling thread, without
+    calling into the engine or taking a lock.  The shards are combined into a metrics bucket when
+    metrics are sent.  This helps applications that check flags from many threads at once.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.periodic_tasks import MetricsShards
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(metrics_shards=MetricsShards()),
+        )
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._start = _timestamp()
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard()
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def count_toggle(self, feature_name: str, enabled: bool) -> None:
+        try:
+            counts = self._local.shard.toggles
+        except AttributeError:
+            counts = self._new_shard().toggles
+        key = (feature_name, enabled)
+        counts[key] = counts.get(key, 0) + 1
+
+    def count_variant(self, feature_name: str, variant: str) -> None:
+        try:
+            counts = self._local.shard.variants
+        except AttributeError:
+            counts = self._new_shard().variants
+        key = (feature_name, variant)
+        counts[key] = counts.get(key, 0) + 1
+
+    def drain(self) -> Optional[dict]:
+        """
+        Returns the checks counted since the last call as a metrics bucket, or None if there were
+        none.
+        """
+        stop = _timestamp()
+        toggles: Dict[str, dict] = {}
+        with self._lock:
+            start, self._start = self._start, stop
+            for shard in list(self._shards):
+                alive = shard.thread.is_alive()
+                if not shard.collect(toggles) and not alive:
+                    # The thread is gone and everything it counted has been reported.
+                    self._shards.remove(shard)
+
+        if not toggles:
+            return None
+        return {"start": start, "stop": stop, "toggles": toggles}
+
+
+def collect_metrics(
+    engine: UnleashEngine, shards: Optional[MetricsShards] = None
+) -> Optional[dict]:
+    """
+    Returns the metrics counted by the engine and, if given, the shards as a single bucket.
+    """
+    bucket = engine.get_metrics()
+    if shards is not None:
+        bucket = merge_buckets(bucket, shards.drain())
+    return bucket
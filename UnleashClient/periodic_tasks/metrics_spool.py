@@ -0,0 +1,153 @@
+import threading
+from typing import Optional
+
+from UnleashClient.cache import BaseCache
+from UnleashClient.constants import PENDING_METRICS
+from UnleashClient.utils import LOGGER
+
+
+def merge_buckets(bucket: Optional[dict], other: Optional[dict]) -> Optional[dict]:
+    """
+    Combines two metrics buckets by summing their yes, no and variant counts.  The result covers
+    the time span of both buckets.
+    """
+    if not bucket:
+        return other
+    if not other:
+        return bucket
+
+    toggles = {
+        name: {
+            "yes": counts.get("yes", 0),
+            "no": counts.get("no", 0),
+            "variants": dict(counts.get("variants") or {}),
+        }
+        for name, counts in bucket.get("toggles", {}).items()
+    }
+    for name, counts in other.get("toggles", {}).items():
+        merged = toggles.setdefault(name, {"yes": 0, "no": 0, "variants": {}})
+        merged["yes"] += counts.get("yes", 0)
+        merged["no"] += counts.get("no", 0)
+        for variant, count in (counts.get("variants") or {}).items():
+            merged["variants"][variant] = merged["variants"].get(variant, 0) + count
+
+    # The engine formats both timestamps identically, so they compare as strings.
+    return {
+        "start": min(bucket["start"], other["start"]),
+        "stop": max(bucket["stop"], other["stop"]),
+        "toggles": toggles,
+    }
+
+
+class MetricsSpool:
+    """
+    Keeps metrics that couldn't be sent so they can be retried with the next submission.
+
+    Failed buckets are merged into a single pending bucket, so memory use grows with the number of
+    features rather than with the length of an outage.  After each consecutive failure one more
+    submission interval is skipped, up to ``max_backoff`` intervals, to avoid flooding the server
+    when it recovers.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.cache import FileCache
+        from UnleashClient.periodic_tasks import MetricsSpool
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(
+                metrics_spool=MetricsSpool(cache=FileCache("HAMSTER_API-metrics"))
+            ),
+        )
+
+    :param cache: Optional cache that pending metrics are persisted to, so they survive a restart.
+        Don't use the client's own cache for this; ``destroy()`` deletes it.
+    :param max_backoff: Maximum number of submission intervals to skip after failures.
+    """
+
+    def __init__(self, cache: Optional[BaseCache] = None, max_backoff: int = 9) -> None:
+        self.cache = cache
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self._skip = 0
+        self._lock = threading.Lock()
+        self._pending: Optional[dict] = None
+        self._persisted = False
+
+        if cache is not None:
+            try:
+                self._pending = cache.get(PENDING_METRICS) or None
+                self._persisted = self._pending is not None
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Unable to load pending metrics from cache: %s", exc)
+
+    @property
+    def pending(self) -> Optional[dict]:
+        return self._pending
+
+    def take(self, bucket: Optional[dict]) -> Optional[dict]:
+        """
+        Adds a fresh bucket to the pending metrics.
+
+        :return: Everything pending, or None if nothing should be sent this interval.  Returned
+            metrics are no longer pending; pass them to :meth:`failed` if they can't be sent.
+        """
+        with self._lock:
+            pending = merge_buckets(self._pending, bucket)
+            if self._skip > 0:
+                self._skip -= 1
+                self._store(pending)
+                LOGGER.debug("Backing off metrics submission after failures.")
+                return None
+
+            self._pending = None
+            return pending
+
+    def add(self, bucket: Optional[dict]) -> None:
+        """
+        Keeps metrics for a later submission without sending them now, e.g. during shutdown.
+        """
+        if not bucket:
+            return
+        with self._lock:
+            self._store(merge_buckets(self._pending, bucket))
+
+    def failed(self, bucket: dict) -> None:
+        """
+        Returns metrics that couldn't be sent to the spool and backs off further submissions.
+        """
+        with self._lock:
+            self.failures += 1
+            self._skip = min(self.failures, self.max_backoff)
+            self._store(merge_buckets(bucket, self._pending))
+        LOGGER.info(
+            "Keeping unsent metrics, next submission in %d interval(s).", self._skip + 1
+        )
+
+    def succeeded(self) -> None:
+        """
+        Resets the backoff and clears persisted metrics once a submission went through.
+        """
+        with self._lock:
+            self.failures = 0
+            self._skip = 0
+            if self._pending is None and self._persisted:
+                self._persist(None)
+
+    def _store(self, pending: Optional[dict]) -> None:
+        # Called with the lock held.
+        self._pending = pending
+        self._persist(pending)
+
+    def _persist(self, pending: Optional[dict]) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(PENDING_METRICS, pending)
+            self._persisted = pending is not None
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Unable to persist pending metrics: %s", exc)
@@ -1,5 +1,7 @@
 from platform import python_implementation, python_version
+from typing import Optional
 
+import requests
 import yggdrasil_engine
 from yggdrasil_engine.engine import UnleashEngine
 
@@ -7,6 +9,9 @@ from UnleashClient.api import send_metrics
 from UnleashClient.constants import CLIENT_SPEC_VERSION
 from UnleashClient.utils import LOGGER
 
+from .metrics_shards import MetricsShards, collect_metrics
+from .metrics_spool import MetricsSpool
+
 
 def aggregate_and_send_metrics(
     url: str,
@@ -17,8 +22,14 @@ def aggregate_and_send_metrics(
     custom_options: dict,
     request_timeout: int,
     engine: UnleashEngine,
+    session: Optional[requests.Session] = None,
+    compression_threshold: Optional[int] = None,
+    spool: Optional[MetricsSpool] = None,
+    shards: Optional[MetricsShards] = None,
 ) -> None:
-    metrics_bucket = engine.get_metrics()
+    metrics_bucket = collect_metrics(engine, shards)
+    if spool is not None:
+        metrics_bucket = spool.take(metrics_bucket)
 
     metrics_request = {
         "appName": app_name,
@@ -32,6 +43,19 @@ def aggregate_and_send_metrics(
     }
 
     if metrics_bucket:
-        send_metrics(url, metrics_request, headers, custom_options, request_timeout)
+        sent = send_metrics(
+            url,
+            metrics_request,
+            headers,
+            custom_options,
+            request_timeout,
+            session=session,
+            compression_threshold=compression_threshold,
+        )
+        if spool is not None:
+            if sent:
+                spool.succeeded()
+            else:
+                spool.failed(metrics_bucket)
     else:
         LOGGER.debug("No feature flags with metrics, skipping metrics submission.")
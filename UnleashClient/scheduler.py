@@ -0,0 +1,185 @@
+import random
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from UnleashClient.utils import LOGGER
+
+# Same values as APScheduler's scheduler states.
+STATE_STOPPED = 0
+STATE_RUNNING = 1
+
+
+class JobLookupError(KeyError):
+    """
+    Raised when removing a job that isn't scheduled.
+    """
+
+
+class IntervalSchedule(NamedTuple):
+    seconds: float
+    jitter: Optional[float] = None
+
+    def delay(self) -> float:
+        return self.seconds + random.uniform(0, self.jitter or 0)
+
+
+class TimerJob:
+    def __init__(
+        self,
+        scheduler: "TimerScheduler",
+        func: Callable,
+        schedule: IntervalSchedule,
+        kwargs: dict,
+    ) -> None:
+        self.func = func
+        self.schedule = schedule
+        self.kwargs = kwargs
+        self.next_run = time.monotonic() + schedule.delay()
+        self._scheduler = scheduler
+
+    def remove(self) -> None:
+        self._scheduler.remove_job(self)
+
+
+class TimerScheduler:
+    """
+    A minimal scheduler that runs jobs at fixed, optionally jittered intervals on a single thread.
+
+    It can be passed to UnleashClient instead of an APScheduler scheduler.  It only supports the
+    interval jobs the client schedules, but doesn't need APScheduler to be imported and only starts
+    one thread.  Jobs run one at a time; a run that's late because another job was still running
+    isn't repeated.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import UnleashClient
+        from UnleashClient.scheduler import TimerScheduler
+
+        unleash_client = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            scheduler=TimerScheduler(),
+        )
+    """
+
+    def __init__(self) -> None:
+        self.state = STATE_STOPPED
+        self._condition = threading.Condition()
+        self._jobs: List[TimerJob] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def add_job(
+        self,
+        func: Callable,
+        trigger: IntervalSchedule,
+        executor: Optional[str] = None,  # pylint: disable=unused-argument
+        kwargs: Optional[dict] = None,
+    ) -> TimerJob:
+        """
+        Schedules ``func`` to run every ``trigger.seconds`` seconds, plus up to
+        ``trigger.jitter`` seconds.  ``executor`` is accepted for compatibility and ignored.
+        """
+        job = TimerJob(self, func, trigger, kwargs or {})
+        with self._condition:
+            self._jobs.append(job)
+            self._condition.notify()
+        return job
+
+    def remove_job(self, job: TimerJob) -> None:
+        with self._condition:
+            try:
+                self._jobs.remove(job)
+            except ValueError:
+                raise JobLookupError(job) from None
+            self._condition.notify()
+
+    def remove_all_jobs(self) -> None:
+        with self._condition:
+            self._jobs.clear()
+            self._condition.notify()
+
+    def start(self) -> None:
+        with self._condition:
+            if self.state == STATE_RUNNING:
+                return
+            self.state = STATE_RUNNING
+            self._thread = threading.Thread(
+                target=self._run, name="UnleashScheduler", daemon=True
+            )
+            self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the scheduler thread.
+
+        :param wait: Whether to wait for a running job to finish.
+        """
+        with self._condition:
+            self.state = STATE_STOPPED
+            self._condition.notify()
+
+        thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _next_due(self) -> Optional[TimerJob]:
+        # Called with the condition held.  Waits until a job is due or the scheduler stops.
+        while self.state == STATE_RUNNING:
+            if not self._jobs:
+                self._condition.wait()
+                continue
+
+            job = min(self._jobs, key=lambda job: job.next_run)
+            now = time.monotonic()
+            if job.next_run > now:
+                self._condition.wait(job.next_run - now)
+                continue
+
+            job.next_run += job.schedule.delay()
+            if job.next_run <= now:
+                job.next_run = now + job.schedule.delay()
+            return job
+
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                job = self._next_due()
+            if job is None:
+                return
+
+            try:
+                job.func(**job.kwargs)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Exception in Unleash background job")
+
+
+def add_interval_job(
+    scheduler: Any,
+    func: Callable,
+    seconds: float,
+    jitter: Optional[float] = None,
+    executor: str = "default",
+    kwargs: Optional[dict] = None,
+) -> Any:
+    """
+    Schedules an interval job on either a :class:`TimerScheduler` or an APScheduler scheduler.
+    APScheduler is only imported in the latter case.
+    """
+    if isinstance(scheduler, TimerScheduler):
+        return scheduler.add_job(
+            func, trigger=IntervalSchedule(seconds, jitter), kwargs=kwargs
+        )
+
+    from apscheduler.triggers.interval import IntervalTrigger  # noqa: PLC0415
+
+    return scheduler.add_job(
+        func,
+        trigger=IntervalTrigger(seconds=seconds, jitter=jitter),
+        executor=executor,
+        kwargs=kwargs,
+    )
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Tuple, Union
+
+from UnleashClient.utils import LOGGER
+
+MAGIC = b"UNLS"
+FORMAT_VERSION = 1
+
+# magic, format version, reserved, generation, metadata length, payload length, payload digest
+_HEADER = struct.Struct("<4sHHQIQ16s")
+
+
+class StateFileError(Exception):
+    """
+    Raised when a shared state file is malformed.
+    """
+
+
+class SharedState(NamedTuple):
+    generation: int
+    metadata: dict
+    payload: bytes
+    digest: bytes
+
+
+class MappedState(NamedTuple):
+    generation: int
+    metadata: dict
+    digest: bytes
+    mapped: mmap.mmap
+    payload_offset: int
+    payload_length: int
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} can't be stored in a state file.")
+
+
+def _decode_value(value: dict) -> Any:
+    if value.keys() == {"$datetime"}:
+        return datetime.fromisoformat(value["$datetime"])
+    return value
+
+
+def payload_digest(payload: Union[bytes, memoryview]) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def read_header(path: str) -> Optional[Tuple[int, int, int, bytes]]:
+    """
+    Reads the header of a state file without touching the payload.
+
+    :return: (Generation, metadata length, payload length, payload digest), or None if the file
+        doesn't exist.
+    """
+    try:
+        with open(path, "rb") as state_file:
+            header = state_file.read(_HEADER.size)
+    except FileNotFoundError:
+        return None
+
+    return _unpack_header(header)
+
+
+def _unpack_header(header: bytes) -> Tuple[int, int, int, bytes]:
+    if len(header) < _HEADER.size:
+        raise StateFileError("State file is truncated.")
+
+    magic, version, _, generation, metadata_length, payload_length, digest = (
+        _HEADER.unpack_from(header)
+    )
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise StateFileError("Not an Unleash state file, or unsupported version.")
+
+    return generation, metadata_length, payload_length, digest
+
+
+def map_state_file(path: str) -> Optional[MappedState]:
+    """
+    Memory maps a state file without copying its payload.  The caller must close ``mapped``.
+
+    :return: The mapped file, or None if the file doesn't exist.
+    """
+    try:
+        state_file = open(path, "rb")  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        return None
+
+    with state_file:
+        if os.fstat(state_file.fileno()).st_size < _HEADER.size:
+            raise StateFileError("State file is truncated.")
+        mapped = mmap.mmap(state_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        generation, metadata_length, payload_length, digest = _unpack_header(
+            mapped[: _HEADER.size]
+        )
+        payload_offset = _HEADER.size + metadata_length
+        if len(mapped) < payload_offset + payload_length:
+            raise StateFileError("State file is truncated.")
+
+        metadata = json.loads(
+            mapped[_HEADER.size : payload_offset] or b"{}", object_hook=_decode_value
+        )
+    except Exception:
+        mapped.close()
+        raise
+
+    return MappedState(
+        generation, metadata, digest, mapped, payload_offset, payload_length
+    )
+
+
+def read_state_file(path: str) -> Optional[SharedState]:
+    """
+    Reads a state file through a read-only memory map.
+
+    :return: The file's contents, or None if the file doesn't exist.
+    """
+    mapped_state = map_state_file(path)
+    if mapped_state is None:
+        return None
+
+    with mapped_state.mapped as mapped:
+        payload_end = mapped_state.payload_offset + mapped_state.payload_length
+        payload = mapped[mapped_state.payload_offset : payload_end]
+
+    if payload_digest(payload) != mapped_state.digest:
+        raise StateFileError("State file payload doesn't match its digest.")
+
+    return SharedState(
+        mapped_state.generation, mapped_state.metadata, payload, mapped_state.digest
+    )
+
+
+def write_state_file(
+    path: str, generation: int, payload: bytes, metadata: Optional[dict] = None
+) -> None:
+    """
+    Atomically replaces a state file.
+
+    The new contents are written to a temporary file in the same directory and renamed over the
+    old file, so readers only ever see a complete file.
+    """
+    encoded_metadata = json.dumps(metadata or {}, default=_encode_value).encode("utf-8")
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        generation,
+        len(encoded_metadata),
+        len(payload),
+        payload_digest(payload),
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory, prefix=".unleash-state-"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(header)
+            temporary_file.write(encoded_metadata)
+            temporary_file.write(payload)
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+class SharedStatePublisher:
+    """
+    Publishes feature state to a file that other processes can load it from.
+
+    Pass an instance in the ``PerformanceOptions`` of the one UnleashClient that fetches features.
+    Every time its feature set changes, the full state is written to ``path`` together with an
+    increasing generation number.  Worker processes attach to the same file with
+    ``experimental_mode={"type": "shared_state", "path": path}`` and only reload their engine
+    when the published state changes.
+
+    Placing the file on a memory-backed filesystem such as ``/dev/shm`` keeps it off disk.
+
+    Example:
+
+    .. code-block:: python
+
+        from UnleashClient import PerformanceOptions, UnleashClient
+        from UnleashClient.shared_state import SharedStatePublisher
+
+        # In the fetching process (or sidecar)
+        fetcher = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            performance=PerformanceOptions(
+                state_publisher=SharedStatePublisher("/dev/shm/unleash-hamster.state")
+            ),
+        )
+
+        # In every worker process
+        worker = UnleashClient(
+            "https://my.unleash.server.com",
+            "HAMSTER_API",
+            experimental_mode={"type": "shared_state", "path": "/dev/shm/unleash-hamster.state"},
+        )
+
+    :param path: Location of the shared state file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def publish(self, state: str) -> bool:
+        """
+        Writes a new generation of the state file, unless it already holds this state.
+
+        :param state: Full feature payload, as accepted by ``UnleashEngine.take_state``.
+        :return: True if a new generation was written.
+        """
+        payload = state.encode("utf-8")
+        with self._lock:
+            try:
+                header = read_header(self.path)
+            except StateFileError as exc:
+                LOGGER.warning("Replacing unreadable shared state file: %s", exc)
+                header = None
+
+            if header is not None and header[3] == payload_digest(payload):
+                return False
+
+            generation = header[0] + 1 if header is not None else 1
+            write_state_file(self.path, generation, payload)
+            return True
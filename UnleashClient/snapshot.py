@@ -0,0 +1,100 @@
+from typing import NamedTuple, Optional
+
+import yggdrasil_engine
+from yggdrasil_engine.engine import UnleashEngine
+
+from UnleashClient import constants
+from UnleashClient.feature_index import FeatureIndex
+from UnleashClient.shared_state import (
+    StateFileError,
+    read_state_file,
+    write_state_file,
+)
+from UnleashClient.utils import LOGGER
+
+# Version of the snapshot metadata, stored in the metadata itself.  Snapshots aren't shared
+# state, so the state file's generation is always 0.
+SNAPSHOT_FORMAT = 1
+
+
+class SnapshotVersionError(StateFileError):
+    """
+    Raised when a snapshot was written for a different version of the evaluation engine.
+    """
+
+
+class Snapshot(NamedTuple):
+    state: str
+    feature_index: dict
+    yggdrasil_version: str
+    sdk_version: str
+
+
+def write_snapshot(
+    path: str, state: str, feature_index: Optional[FeatureIndex] = None
+) -> None:
+    """
+    Writes a feature payload to a snapshot file that :meth:`UnleashClient.load_snapshot` can
+    load at startup.
+
+    The payload is validated and normalized by the engine, and the analysis the client would
+    otherwise do on startup is stored alongside it.
+
+    :param path: Location of the snapshot file.
+    :param state: Feature payload, e.g. the response of the client features API or
+        ``UnleashEngine.get_state()``.
+    :param feature_index: Index that already describes ``state``, optional.  Built from ``state``
+        when not given.
+    """
+    engine = UnleashEngine()
+    parse_warnings = engine.take_state(state)
+    if parse_warnings:
+        LOGGER.warning("Some features in the snapshot may not evaluate as expected")
+        LOGGER.warning(parse_warnings)
+
+    if feature_index is None:
+        feature_index = FeatureIndex()
+        feature_index.update(state)
+
+    write_state_file(
+        path,
+        0,
+        engine.get_state().encode("utf-8"),
+        metadata={
+            "snapshotFormat": SNAPSHOT_FORMAT,
+            "yggdrasilVersion": yggdrasil_engine.__yggdrasil_core_version__,
+            "sdkVersion": constants.SDK_VERSION,
+            "index": feature_index.export(),
+        },
+    )
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """
+    Reads a snapshot file.
+
+    :raises FileNotFoundError: If the file doesn't exist.
+    :raises StateFileError: If the file isn't a valid snapshot.
+    :raises SnapshotVersionError: If the snapshot was written for another engine version.
+    """
+    shared_state = read_state_file(path)
+    if shared_state is None:
+        raise FileNotFoundError(path)
+
+    metadata = shared_state.metadata
+    if metadata.get("snapshotFormat") != SNAPSHOT_FORMAT or "index" not in metadata:
+        raise StateFileError("Not an Unleash snapshot, or unsupported version.")
+
+    core_version = yggdrasil_engine.__yggdrasil_core_version__
+    if metadata.get("yggdrasilVersion") != core_version:
+        raise SnapshotVersionError(
+            f"Snapshot was written for yggdrasil {metadata.get('yggdrasilVersion')}, "
+            f"but {core_version} is installed."
+        )
+
+    return Snapshot(
+        state=shared_state.payload.decode("utf-8"),
+        feature_index=metadata["index"],
+        yggdrasil_version=metadata["yggdrasilVersion"],
+        sdk_version=metadata.get("sdkVersion", ""),
+    )
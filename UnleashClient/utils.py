@@ -1,10 +1,13 @@
 import logging
+import time
 from enum import Enum
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import mmh3  # pylint: disable=import-error
-from requests import Response
+
+if TYPE_CHECKING:
+    from requests import Response
 
 LOGGER = logging.getLogger("UnleashClient")
 
@@ -39,6 +42,33 @@ class InstanceCounter:
                 self.instances[key] = 1
 
 
+class Deadline:
+    """
+    A time budget shared by several steps, e.g. of a shutdown.
+
+    :param timeout: Total number of seconds available, or None for no limit.
+    """
+
+    def __init__(self, timeout: Optional[float]) -> None:
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self, default: float) -> float:
+        """
+        :return: Seconds left in the budget, capped at ``default``.  ``default`` if there's no limit.
+        """
+        if self.expires_at is None:
+            return default
+        return max(0.0, min(default, self.expires_at - time.monotonic()))
+
+    def time_left(self) -> Optional[float]:
+        """
+        :return: Seconds left in the budget, or None if there's no limit.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+
 def normalized_hash(
     identifier: str, activation_group: str, normalizer: int = 100, seed: int = 0
 ) -> int:
@@ -63,7 +93,7 @@ def get_identifier(context_key_name: str, context: dict) -> Any:
     return value
 
 
-def log_resp_info(resp: Response) -> None:
+def log_resp_info(resp: "Response") -> None:
     LOGGER.debug("HTTP status code: %s", resp.status_code)
     LOGGER.debug("HTTP headers: %s", resp.headers)
     LOGGER.debug("HTTP content: %s", resp.text)
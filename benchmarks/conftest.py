@@ -0,0 +1,19 @@
+"""
+Benchmarks for the evaluation hot path.  Run with ``make benchmark``; see DEVELOPMENT.md.
+"""
+
+import pytest
+
+from benchmarks.payloads import build_client, build_payload
+
+
+@pytest.fixture(scope="module")
+def payload_1k() -> dict:
+    return build_payload(1000)
+
+
+@pytest.fixture(scope="module")
+def client(payload_1k):
+    unleash_client = build_client(payload_1k)
+    yield unleash_client
+    unleash_client.destroy()
@@ -0,0 +1,78 @@
+"""
+Measures how long ``import UnleashClient`` takes, using ``python -X importtime``.
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 10] [--top 15] [--max-ms 150]
+
+Prints the median import time over several fresh interpreters and the modules that took the most
+time in the slowest run.  With ``--max-ms`` the script exits with an error if the median exceeds
+the limit, so it can be used in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Imports ``module`` in a fresh interpreter.
+
+    :return: (Module name, self time, cumulative time) for every imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="UnleashClient")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    totals = []
+    slowest: List[Tuple[str, int, int]] = []
+    for _ in range(args.runs):
+        timings = measure(args.module)
+        total = next(cum for name, _, cum in timings if name == args.module)
+        if not totals or total > max(totals):
+            slowest = timings
+        totals.append(total)
+
+    median_ms = statistics.median(totals) / 1000
+    print(
+        f"import {args.module}: median {median_ms:.1f} ms, "
+        f"min {min(totals) / 1000:.1f} ms, max {max(totals) / 1000:.1f} ms "
+        f"over {args.runs} runs"
+    )
+    print("\nSlowest modules (self time, slowest run):")
+    for name, self_us, cumulative_us in sorted(slowest, key=lambda t: -t[1])[
+        : args.top
+    ]:
+        print(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"\nMedian import time exceeds {args.max_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
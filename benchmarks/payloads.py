@@ -0,0 +1,108 @@
+"""
+Deterministic feature payloads and clients for the benchmarks, so results are comparable between
+runs and commits.
+"""
+
+import functools
+import json
+import uuid
+
+from UnleashClient import UnleashClient
+from UnleashClient.cache import MemoryCache
+
+CONTEXT = {
+    "userId": "user-1234",
+    "sessionId": "session-5678",
+    "remoteAddress": "10.0.0.1",
+    "region": "eu",
+    "plan": "premium",
+}
+
+
+def build_feature(index: int) -> dict:
+    """
+    Builds one of a few representative feature shapes.
+    """
+    name = f"feature-{index}"
+    kind = index % 4
+    if kind == 0:
+        strategies = [{"name": "default", "parameters": {}}]
+    elif kind == 1:
+        strategies = [
+            {
+                "name": "flexibleRollout",
+                "parameters": {
+                    "rollout": "50",
+                    "stickiness": "default",
+                    "groupId": name,
+                },
+                "constraints": [
+                    {"contextName": "region", "operator": "IN", "values": ["eu", "us"]}
+                ],
+            }
+        ]
+    elif kind == 2:
+        strategies = [
+            {
+                "name": "userWithId",
+                "parameters": {"userIds": ",".join(f"user-{i}" for i in range(50))},
+            }
+        ]
+    else:
+        strategies = [
+            {
+                "name": "flexibleRollout",
+                "parameters": {"rollout": "100", "stickiness": "userId"},
+                "segments": [index % 10],
+            }
+        ]
+
+    return {
+        "name": name,
+        "type": "release",
+        "enabled": True,
+        "impressionData": False,
+        "strategies": strategies,
+        "variants": [
+            {"name": "blue", "weight": 500, "stickiness": "default"},
+            {"name": "red", "weight": 500, "stickiness": "default"},
+        ],
+    }
+
+
+def build_payload(feature_count: int, impression_data: bool = False) -> dict:
+    features = [build_feature(index) for index in range(feature_count)]
+    for feature in features:
+        feature["impressionData"] = impression_data
+
+    return {
+        "version": 2,
+        "features": features,
+        "segments": [
+            {
+                "id": segment_id,
+                "constraints": [
+                    {"contextName": "plan", "operator": "IN", "values": ["premium"]}
+                ],
+            }
+            for segment_id in range(10)
+        ],
+    }
+
+
+def build_client(payload: dict, **kwargs) -> UnleashClient:
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(payload)
+    return UnleashClient(
+        "http://localhost:4242/api",
+        f"benchmark-{uuid.uuid4()}",
+        cache=cache,
+        disable_metrics=True,
+        disable_registration=True,
+        **kwargs,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def serialized_payload(feature_count: int) -> str:
+    return json.dumps(build_payload(feature_count))
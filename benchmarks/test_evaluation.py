@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from benchmarks.payloads import CONTEXT, build_client, build_payload
+from UnleashClient import PerformanceOptions
+from UnleashClient.periodic_tasks import MetricsShards
+
+pytest.importorskip("pytest_benchmark")
+
+THREAD_ITERATIONS = 2000
+
+
+class AlwaysOn:
+    def apply(self, parameters: dict, context: dict = None) -> bool:
+        return context.get("userId") is not None
+
+
+def test_is_enabled(benchmark, client):
+    assert benchmark(client.is_enabled, "feature-1", CONTEXT) in (True, False)
+
+
+def test_is_enabled_prebuilt_context(benchmark, client):
+    context = client.build_context(CONTEXT)
+    benchmark(client.is_enabled, "feature-1", context)
+
+
+def test_is_enabled_unknown_feature(benchmark, client):
+    assert not benchmark(client.is_enabled, "missing-feature", CONTEXT)
+
+
+def test_get_variant(benchmark, client):
+    assert benchmark(client.get_variant, "feature-1", CONTEXT)["name"]
+
+
+def test_safe_context(benchmark, client):
+    benchmark(client._safe_context, CONTEXT)
+
+
+def test_impression_event(benchmark):
+    events = []
+    unleash_client = build_client(
+        build_payload(100, impression_data=True), event_callback=events.append
+    )
+
+    benchmark(unleash_client.is_enabled, "feature-0", CONTEXT)
+
+    assert events
+    unleash_client.destroy()
+
+
+def test_custom_strategy(benchmark):
+    payload = build_payload(100)
+    payload["features"][0]["strategies"] = [{"name": "alwaysOn", "parameters": {}}]
+    unleash_client = build_client(payload, custom_strategies={"alwaysOn": AlwaysOn()})
+
+    assert benchmark(unleash_client.is_enabled, "feature-0", CONTEXT)
+    unleash_client.destroy()
+
+
+@pytest.mark.parametrize("thread_count", [1, 4, 16])
+def test_is_enabled_contention(benchmark, client, thread_count):
+    """
+    Time for ``thread_count`` threads to each check a flag THREAD_ITERATIONS times.
+    """
+    _contention(benchmark, client, thread_count)
+
+
+@pytest.mark.parametrize("thread_count", [1, 4, 16])
+def test_is_enabled_contention_metrics_shards(benchmark, payload_1k, thread_count):
+    unleash_client = build_client(
+        payload_1k, performance=PerformanceOptions(metrics_shards=MetricsShards())
+    )
+    _contention(benchmark, unleash_client, thread_count)
+    unleash_client.destroy()
+
+
+def _contention(benchmark, client, thread_count):
+
+    def check_flags():
+        for _ in range(THREAD_ITERATIONS):
+            client.is_enabled("feature-1", CONTEXT)
+
+    def run():
+        threads = [threading.Thread(target=check_flags) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    benchmark.extra_info["checks"] = thread_count * THREAD_ITERATIONS
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
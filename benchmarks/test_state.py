@@ -0,0 +1,25 @@
+import pytest
+from yggdrasil_engine.engine import UnleashEngine
+
+from benchmarks.payloads import serialized_payload
+from UnleashClient.feature_index import FeatureIndex
+
+pytest.importorskip("pytest_benchmark")
+
+FEATURE_COUNTS = [100, 1000, 10000]
+
+
+@pytest.mark.parametrize("feature_count", FEATURE_COUNTS)
+def test_take_state(benchmark, feature_count):
+    payload = serialized_payload(feature_count)
+    engine = UnleashEngine()
+
+    benchmark.pedantic(engine.take_state, args=(payload,), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("feature_count", FEATURE_COUNTS)
+def test_feature_index_update(benchmark, feature_count):
+    payload = serialized_payload(feature_count)
+    index = FeatureIndex()
+
+    benchmark.pedantic(index.update, args=(payload,), rounds=5, warmup_rounds=1)
@@ -0,0 +1,18 @@
+import gzip
+import json
+
+from UnleashClient.api import encode_json
+
+PAYLOAD = {"appName": "pytest", "bucket": {"toggles": {"a" * 100: {"yes": 1}}}}
+
+
+def test_encode_json_uncompressed():
+    assert encode_json(PAYLOAD) == (json.dumps(PAYLOAD).encode("utf-8"), {})
+    assert encode_json(PAYLOAD, compression_threshold=10_000)[1] == {}
+
+
+def test_encode_json_gzips_large_bodies():
+    body, headers = encode_json(PAYLOAD, compression_threshold=10)
+
+    assert headers == {"Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(body)) == PAYLOAD
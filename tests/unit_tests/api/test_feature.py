@@ -158,3 +158,23 @@ def test_get_feature_toggle_retries():
     assert len(responses.calls) == 2
     assert len(json.loads(result)["features"]) == 1
     assert etag == ETAG_VALUE
+
+
+@responses.activate
+def test_get_feature_toggle_accepts_compressed_responses():
+    responses.add(
+        responses.GET, FULL_FEATURE_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+
+    get_feature_toggles(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        REQUEST_TIMEOUT,
+        REQUEST_RETRIES,
+    )
+
+    accept_encoding = responses.calls[0].request.headers["Accept-Encoding"]
+    assert "gzip" in accept_encoding.split(",")
@@ -1,3 +1,4 @@
+import gzip
 import json
 
 import responses
@@ -44,3 +45,22 @@ def test_send_metrics(payload, status, expected):
     assert expected(result)
 
     assert request["connectionId"] == MOCK_METRICS_REQUEST.get("connectionId")
+
+
+@responses.activate
+def test_send_metrics_compressed():
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=202)
+
+    result = send_metrics(
+        URL,
+        MOCK_METRICS_REQUEST,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        REQUEST_TIMEOUT,
+        compression_threshold=0,
+    )
+
+    request = responses.calls[0].request
+    assert result
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.body)) == MOCK_METRICS_REQUEST
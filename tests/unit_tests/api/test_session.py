@@ -0,0 +1,58 @@
+import responses
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.mocks.mock_metrics import MOCK_METRICS_REQUEST
+from tests.utilities.testing_constants import (
+    APP_NAME,
+    CUSTOM_HEADERS,
+    CUSTOM_OPTIONS,
+    INSTANCE_ID,
+    REQUEST_RETRIES,
+    REQUEST_TIMEOUT,
+    URL,
+)
+from UnleashClient.api import build_session, get_feature_toggles, send_metrics
+from UnleashClient.constants import FEATURES_URL, METRICS_URL
+
+
+def test_build_session_configures_pool_and_retries():
+    with build_session(request_retries=2, pool_size=4) as session:
+        for prefix in ("http://", "https://"):
+            adapter = session.get_adapter(prefix + "localhost")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 4
+            assert adapter.max_retries.total == 2
+
+
+@responses.activate
+def test_api_calls_share_session(mocker):
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+
+    with build_session() as session:
+        send = mocker.spy(session, "send")
+
+        result, _ = get_feature_toggles(
+            URL,
+            APP_NAME,
+            INSTANCE_ID,
+            CUSTOM_HEADERS,
+            CUSTOM_OPTIONS,
+            REQUEST_TIMEOUT,
+            REQUEST_RETRIES,
+            session=session,
+        )
+        sent = send_metrics(
+            URL,
+            MOCK_METRICS_REQUEST,
+            CUSTOM_HEADERS,
+            CUSTOM_OPTIONS,
+            REQUEST_TIMEOUT,
+            session=session,
+        )
+
+    assert result
+    assert sent
+    assert send.call_count == 2
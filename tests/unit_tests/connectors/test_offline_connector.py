@@ -3,7 +3,10 @@ import json
 from apscheduler.schedulers.background import BackgroundScheduler
 from yggdrasil_engine.engine import UnleashEngine
 
-from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURE_RESPONSE_PROJECT,
+)
 from UnleashClient.connectors import OfflineConnector
 from UnleashClient.constants import FEATURES_URL
 
@@ -71,3 +74,52 @@ def test_offline_connector_ready_callback(cache_empty):
     connector.start()
     assert callback_called
     connector.stop()
+
+
+def test_offline_connector_skips_unchanged_state(cache_empty, mocker):
+    engine = UnleashEngine()
+    take_state = mocker.spy(engine, "take_state")
+    temp_cache = cache_empty
+    temp_cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+
+    connector = OfflineConnector(
+        engine=engine,
+        cache=temp_cache,
+        scheduler=BackgroundScheduler(),
+    )
+
+    connector.load_features()
+    connector.load_features()
+    assert take_state.call_count == 1
+
+    temp_cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    connector.load_features()
+    assert take_state.call_count == 2
+    assert not engine.is_enabled("testFlag", {})
+
+    # State handed to the engine directly (e.g. a streaming delta) forces the next reload.
+    connector.take_state(json.dumps(MOCK_FEATURE_RESPONSE))
+    connector.load_features()
+    assert take_state.call_count == 4
+    assert not engine.is_enabled("testFlag", {})
+
+
+def test_offline_connector_state_callbacks_wrap_engine_update(cache_empty):
+    engine = UnleashEngine()
+    calls = []
+    cache_empty.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+
+    connector = OfflineConnector(
+        engine=engine,
+        cache=cache_empty,
+        scheduler=BackgroundScheduler(),
+        prepare_callback=lambda: calls.append(
+            ("prepare", engine.is_enabled("testFlag", {}))
+        ),
+        state_callback=lambda state: calls.append(
+            ("state", engine.is_enabled("testFlag", {}))
+        ),
+    )
+    connector.load_features()
+
+    assert calls == [("prepare", None), ("state", True)]
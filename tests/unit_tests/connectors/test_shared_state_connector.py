@@ -0,0 +1,83 @@
+import json
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from yggdrasil_engine.engine import UnleashEngine
+
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURE_RESPONSE_PROJECT,
+)
+from UnleashClient.connectors import SharedStateConnector
+from UnleashClient.constants import FEATURES_URL
+from UnleashClient.shared_state import SharedStatePublisher
+
+
+def test_shared_state_connector_refresh(cache_empty, tmp_path, mocker):
+    path = str(tmp_path / "unleash.state")
+    engine = UnleashEngine()
+    take_state = mocker.spy(engine, "take_state")
+    publisher = SharedStatePublisher(path)
+    connector = SharedStateConnector(
+        engine=engine,
+        cache=cache_empty,
+        scheduler=BackgroundScheduler(),
+        path=path,
+    )
+
+    assert not connector.refresh()
+
+    publisher.publish(json.dumps(MOCK_FEATURE_RESPONSE))
+    assert connector.refresh()
+    assert connector.generation == 1
+    assert engine.is_enabled("testFlag", {})
+
+    assert not connector.refresh()
+    assert take_state.call_count == 1
+
+    publisher.publish(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    assert connector.refresh()
+    assert connector.generation == 2
+    assert not engine.is_enabled("testFlag", {})
+
+
+def test_shared_state_connector_reloads_after_publisher_restart(cache_empty, tmp_path):
+    path = tmp_path / "unleash.state"
+    engine = UnleashEngine()
+    connector = SharedStateConnector(
+        engine=engine,
+        cache=cache_empty,
+        scheduler=BackgroundScheduler(),
+        path=str(path),
+    )
+
+    SharedStatePublisher(str(path)).publish(json.dumps(MOCK_FEATURE_RESPONSE))
+    assert connector.refresh()
+
+    # A new publisher starts again at generation 1 when the file is gone.
+    path.unlink()
+    SharedStatePublisher(str(path)).publish(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    assert connector.refresh()
+    assert connector.generation == 1
+    assert not engine.is_enabled("testFlag", {})
+
+
+def test_shared_state_connector_falls_back_to_cache(cache_empty, tmp_path):
+    engine = UnleashEngine()
+    scheduler = BackgroundScheduler()
+    scheduler.start()
+    cache_empty.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+
+    connector = SharedStateConnector(
+        engine=engine,
+        cache=cache_empty,
+        scheduler=scheduler,
+        path=str(tmp_path / "missing.state"),
+    )
+    connector.start()
+
+    assert engine.is_enabled("testFlag", {})
+    assert connector.job is not None
+
+    connector.stop()
+    assert connector.job is None
+    scheduler.shutdown()
@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+
+from yggdrasil_engine.engine import UnleashEngine
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from UnleashClient.connectors import StreamingConnector
+from UnleashClient.constants import FEATURES_URL
+
+UPDATE = {
+    "events": [
+        {
+            "type": "feature-updated",
+            "eventId": 2,
+            "feature": {
+                "name": "testFlag",
+                "enabled": False,
+                "strategies": [{"name": "default"}],
+            },
+        }
+    ]
+}
+
+
+def build_connector(cache, persist_delay=60):
+    return StreamingConnector(
+        engine=UnleashEngine(),
+        cache=cache,
+        url="http://localhost:4242/api",
+        headers={},
+        request_timeout=30,
+        persist_delay=persist_delay,
+    )
+
+
+def test_streaming_connector_caches_connect_payload(cache_empty, mocker):
+    connector = build_connector(cache_empty)
+    get_state = mocker.spy(connector.engine, "get_state")
+    payload = json.dumps(MOCK_FEATURE_RESPONSE)
+
+    connector._apply_event("unleash-connected", payload)
+
+    assert cache_empty.get(FEATURES_URL) == payload
+    assert get_state.call_count == 0
+
+
+def test_streaming_connector_coalesces_updates(cache_empty, mocker):
+    connector = build_connector(cache_empty)
+    connector._apply_event("unleash-connected", json.dumps(MOCK_FEATURE_RESPONSE))
+    cache_set = mocker.spy(cache_empty, "set")
+
+    for _ in range(3):
+        connector._apply_event("unleash-updated", json.dumps(UPDATE))
+    assert cache_set.call_count == 0
+    assert not connector.engine.is_enabled("testFlag", {})
+
+    connector.stop()
+    connector.stop()
+
+    assert cache_set.call_count == 1
+    engine = UnleashEngine()
+    engine.take_state(cache_empty.get(FEATURES_URL))
+    assert not engine.is_enabled("testFlag", {})
+
+
+def test_streaming_connector_persists_after_delay(cache_empty):
+    connector = build_connector(cache_empty, persist_delay=0.2)
+    connector._apply_event("unleash-connected", json.dumps(MOCK_FEATURE_RESPONSE))
+    connector._apply_event("unleash-updated", json.dumps(UPDATE))
+
+    timer = connector._persist_timer
+    timer.join(timeout=5)
+
+    assert connector._persist_timer is None
+    engine = UnleashEngine()
+    engine.take_state(cache_empty.get(FEATURES_URL))
+    assert not engine.is_enabled("testFlag", {})
+
+
+def build_update(name, enabled):
+    return json.dumps(
+        {
+            "events": [
+                {
+                    "type": "feature-updated",
+                    "eventId": 3,
+                    "feature": {
+                        "name": name,
+                        "enabled": enabled,
+                        "strategies": [{"name": "default"}],
+                    },
+                }
+            ]
+        }
+    )
+
+
+def test_streaming_connector_merges_queued_updates(cache_empty, mocker):
+    connector = build_connector(cache_empty)
+    take_state = mocker.spy(connector.engine, "take_state")
+
+    connector._apply_events(
+        [
+            ("unleash-updated", build_update("stale", True)),
+            ("unleash-connected", json.dumps(MOCK_FEATURE_RESPONSE)),
+            ("unleash-updated", build_update("testFlag", False)),
+            ("unleash-updated", build_update("newFlag", True)),
+        ]
+    )
+
+    assert take_state.call_count == 2
+    assert not connector.engine.is_enabled("testFlag", {})
+    assert connector.engine.is_enabled("newFlag", {})
+    assert not connector.engine.is_enabled("stale", {})
+
+
+def test_streaming_connector_applies_queue_in_background(cache_empty):
+    connector = build_connector(cache_empty)
+    connector._applier = threading.Thread(target=connector._apply_queued)
+    connector._applier.start()
+
+    connector._events.put(("unleash-connected", json.dumps(MOCK_FEATURE_RESPONSE)))
+    connector._events.put(("unleash-updated", build_update("testFlag", False)))
+    connector.stop()
+
+    assert not connector._applier
+    assert not connector.engine.is_enabled("testFlag", {})
+
+
+def test_streaming_connector_stop_respects_timeout(cache_empty):
+    connector = build_connector(cache_empty)
+    connector._thread = threading.Thread(target=time.sleep, args=(1,), daemon=True)
+    connector._thread.start()
+
+    started = time.monotonic()
+    connector.stop(timeout=0.1)
+
+    assert time.monotonic() - started < 0.5
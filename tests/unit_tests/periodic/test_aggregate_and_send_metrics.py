@@ -15,8 +15,13 @@ from tests.utilities.testing_constants import (
 from UnleashClient.constants import (
     CLIENT_SPEC_VERSION,
     METRICS_URL,
+    PENDING_METRICS,
+)
+from UnleashClient.periodic_tasks import (
+    MetricsShards,
+    MetricsSpool,
+    aggregate_and_send_metrics,
 )
-from UnleashClient.periodic_tasks import aggregate_and_send_metrics
 
 FULL_METRICS_URL = URL + METRICS_URL
 print(FULL_METRICS_URL)
@@ -67,3 +72,73 @@ def test_metrics_metadata_is_sent():
     assert request["specVersion"] == CLIENT_SPEC_VERSION
     assert request["platformName"] is not None
     assert request["platformVersion"] is not None
+
+
+@responses.activate
+def test_failed_metrics_are_retried_with_spool(cache_empty):
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=500)
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=202)
+
+    engine = UnleashEngine()
+    spool = MetricsSpool(cache=cache_empty)
+    args = (
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CONNECTION_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        REQUEST_TIMEOUT,
+        engine,
+    )
+
+    engine.count_toggle("testFlag", True)
+    aggregate_and_send_metrics(*args, spool=spool)
+    assert cache_empty.get(PENDING_METRICS)["toggles"]["testFlag"]["yes"] == 1
+
+    # The interval after a failure is skipped.
+    engine.count_toggle("testFlag", False)
+    aggregate_and_send_metrics(*args, spool=spool)
+    assert len(responses.calls) == 1
+
+    engine.count_toggle("testFlag", True)
+    aggregate_and_send_metrics(*args, spool=spool)
+
+    assert len(responses.calls) == 2
+    request = json.loads(responses.calls[1].request.body)
+    assert request["bucket"]["toggles"]["testFlag"] == {
+        "yes": 2,
+        "no": 1,
+        "variants": {},
+    }
+    assert cache_empty.get(PENDING_METRICS) is None
+    assert spool.failures == 0
+
+
+@responses.activate
+def test_metrics_from_shards_are_sent():
+    responses.add(responses.POST, FULL_METRICS_URL, json={}, status=202)
+
+    engine = UnleashEngine()
+    shards = MetricsShards()
+    shards.count_toggle("testFlag", True)
+    shards.count_variant("testFlag", "VarA")
+
+    aggregate_and_send_metrics(
+        URL,
+        APP_NAME,
+        INSTANCE_ID,
+        CONNECTION_ID,
+        CUSTOM_HEADERS,
+        CUSTOM_OPTIONS,
+        REQUEST_TIMEOUT,
+        engine,
+        shards=shards,
+    )
+
+    request = json.loads(responses.calls[0].request.body)
+    assert request["bucket"]["toggles"]["testFlag"] == {
+        "yes": 1,
+        "no": 0,
+        "variants": {"VarA": 1},
+    }
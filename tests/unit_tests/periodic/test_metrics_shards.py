@@ -0,0 +1,65 @@
+import threading
+
+from yggdrasil_engine.engine import UnleashEngine
+
+from UnleashClient.periodic_tasks import MetricsShards, collect_metrics
+
+
+def test_shards_count_per_thread():
+    shards = MetricsShards()
+
+    def check_flags():
+        for _ in range(1000):
+            shards.count_toggle("testFlag", True)
+            shards.count_variant("testFlag", "VarA")
+        shards.count_toggle("testFlag", False)
+
+    threads = [threading.Thread(target=check_flags) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    bucket = shards.drain()
+
+    assert bucket["toggles"] == {
+        "testFlag": {"yes": 4000, "no": 4, "variants": {"VarA": 4000}}
+    }
+    assert bucket["start"] <= bucket["stop"]
+    assert shards.drain() is None
+    # Shards of finished threads are dropped once everything they counted was reported.
+    assert shards._shards == []
+
+
+def test_shards_only_report_new_counts():
+    shards = MetricsShards()
+    shards.count_toggle("testFlag", True)
+    first = shards.drain()
+    shards.count_toggle("testFlag", True)
+    shards.count_toggle("otherFlag", False)
+
+    second = shards.drain()
+
+    assert first["toggles"] == {"testFlag": {"yes": 1, "no": 0, "variants": {}}}
+    assert second["toggles"] == {
+        "testFlag": {"yes": 1, "no": 0, "variants": {}},
+        "otherFlag": {"yes": 0, "no": 1, "variants": {}},
+    }
+    assert second["start"] == first["stop"]
+
+
+def test_collect_metrics_merges_engine_and_shards():
+    engine = UnleashEngine()
+    shards = MetricsShards()
+    engine.count_toggle("testFlag", True)
+    shards.count_toggle("testFlag", False)
+    shards.count_variant("testFlag", "VarA")
+
+    bucket = collect_metrics(engine, shards)
+
+    assert bucket["toggles"]["testFlag"] == {
+        "yes": 1,
+        "no": 1,
+        "variants": {"VarA": 1},
+    }
+    assert collect_metrics(engine, shards) is None
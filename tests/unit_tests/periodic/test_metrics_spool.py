@@ -0,0 +1,89 @@
+from UnleashClient.cache import MmapCache
+from UnleashClient.periodic_tasks import MetricsSpool, merge_buckets
+
+
+def build_bucket(start, stop, toggles):
+    return {"start": start, "stop": stop, "toggles": toggles}
+
+
+def test_merge_buckets_sums_counts():
+    bucket = build_bucket(
+        "2024-01-01T00:01:00Z",
+        "2024-01-01T00:02:00Z",
+        {"a": {"yes": 1, "no": 2, "variants": {"red": 1}}},
+    )
+    other = build_bucket(
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:01:00Z",
+        {
+            "a": {"yes": 3, "no": 0, "variants": {"red": 2, "blue": 1}},
+            "b": {"yes": 0, "no": 1, "variants": {}},
+        },
+    )
+
+    merged = merge_buckets(bucket, other)
+
+    assert merged == build_bucket(
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:02:00Z",
+        {
+            "a": {"yes": 4, "no": 2, "variants": {"red": 3, "blue": 1}},
+            "b": {"yes": 0, "no": 1, "variants": {}},
+        },
+    )
+    assert bucket["toggles"]["a"]["variants"] == {"red": 1}
+    assert merge_buckets(None, other) is other
+
+
+def test_metrics_spool_backs_off_and_stays_bounded():
+    spool = MetricsSpool(max_backoff=2)
+    bucket = build_bucket(
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:01:00Z",
+        {"a": {"yes": 1, "no": 0, "variants": {}}},
+    )
+
+    sent_intervals = []
+    for interval in range(12):
+        taken = spool.take(bucket)
+        if taken is not None:
+            sent_intervals.append(interval)
+            spool.failed(taken)
+
+    # Skips grow by one interval per failure, up to max_backoff.
+    assert sent_intervals == [0, 2, 5, 8, 11]
+    assert spool.pending["toggles"] == {"a": {"yes": 12, "no": 0, "variants": {}}}
+
+    taken = spool.take(None)
+    assert taken is None
+    spool.take(None)
+    taken = spool.take(None)
+    spool.succeeded()
+
+    assert taken["toggles"]["a"]["yes"] == 12
+    assert spool.pending is None
+    assert spool.take(bucket) == bucket
+
+
+def test_metrics_spool_loads_persisted_metrics(cache_empty):
+    bucket = build_bucket(
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:01:00Z",
+        {"a": {"yes": 1, "no": 0, "variants": {}}},
+    )
+    MetricsSpool(cache=cache_empty).failed(bucket)
+
+    assert MetricsSpool(cache=cache_empty).take(None) == bucket
+
+
+def test_metrics_spool_persists_to_mmap_cache(tmp_path):
+    bucket = build_bucket(
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T00:01:00Z",
+        {"a": {"yes": 1, "no": 0, "variants": {}}},
+    )
+
+    MetricsSpool(cache=MmapCache("metrics", directory=str(tmp_path))).add(bucket)
+
+    restored = MetricsSpool(cache=MmapCache("metrics", directory=str(tmp_path)))
+    assert restored.pending == bucket
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+import responses
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.testing_constants import APP_NAME, URL
+from UnleashClient import INSTANCES
+from UnleashClient.asynchronous import AsyncUnleashClient
+from UnleashClient.cache import FileCache
+from UnleashClient.constants import FEATURES_URL, METRICS_URL, REGISTER_URL
+
+
+@pytest.fixture(autouse=True)
+def before_each():
+    INSTANCES._reset()
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return FileCache(APP_NAME, directory=tmpdir.dirname)
+
+
+@responses.activate
+def test_async_client_lifecycle(cache):
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+
+    async def run():
+        unleash_client = AsyncUnleashClient(URL, APP_NAME, cache=cache)
+        assert not await unleash_client.wait_until_ready(timeout=0)
+
+        await unleash_client.initialize_client()
+        assert await unleash_client.wait_until_ready(timeout=1)
+        assert unleash_client.is_initialized
+        assert unleash_client.is_enabled("testFlag")
+        assert len(unleash_client._tasks) == 2
+
+        await unleash_client.destroy()
+        assert not unleash_client._tasks
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+
+    assert [call.request.url for call in responses.calls] == [
+        URL + REGISTER_URL,
+        URL + FEATURES_URL,
+        URL + METRICS_URL,
+    ]
+    metrics = json.loads(responses.calls[2].request.body)
+    assert metrics["bucket"]["toggles"]["testFlag"]["yes"] == 1
+
+
+def test_async_client_offline(cache):
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+
+    async def run():
+        unleash_client = AsyncUnleashClient(
+            URL,
+            APP_NAME,
+            cache=cache,
+            disable_metrics=True,
+            disable_registration=True,
+        )
+        await unleash_client.initialize_client(fetch_toggles=False)
+        assert await unleash_client.wait_until_ready(timeout=1)
+        assert unleash_client.is_enabled("testFlag")
+        assert len(unleash_client._tasks) == 1
+
+        await unleash_client.destroy()
+        assert not unleash_client._tasks
+
+    asyncio.run(run())
+
+
+def test_async_client_context_manager(cache):
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = AsyncUnleashClient(
+        URL, APP_NAME, cache=cache, disable_metrics=True, disable_registration=True
+    )
+
+    with pytest.raises(TypeError):
+        with unleash_client:
+            pass
+
+    async def run():
+        async with unleash_client as client:
+            assert client is unleash_client
+            assert client.is_initialized
+            assert client.is_enabled("testFlag")
+        assert not unleash_client._tasks
+
+    asyncio.run(run())
+    assert unleash_client._closed.is_set()
+
+
+def test_async_client_does_not_create_a_scheduler(cache):
+    unleash_client = AsyncUnleashClient(URL, APP_NAME, cache=cache)
+
+    assert unleash_client.unleash_scheduler is None
+    assert unleash_client.unleash_executor_name is None
+
+
+def test_async_client_does_not_import_apscheduler():
+    code = (
+        "import sys\n"
+        "from UnleashClient.asynchronous import AsyncUnleashClient\n"
+        "AsyncUnleashClient('http://localhost:4242/api', 'app', disable_metrics=True)\n"
+        "assert 'apscheduler' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
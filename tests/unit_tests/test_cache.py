@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURE_RESPONSE_PROJECT,
+)
+from UnleashClient import cache as cache_module
+from UnleashClient.cache import MemoryCache, MmapCache, destroy_cache
+from UnleashClient.constants import (
+    ETAG,
+    FEATURES_URL,
+    METRIC_LAST_SENT_TIME,
+    PENDING_METRICS,
+)
+from UnleashClient.shared_state import read_state_file
+
+
+def test_mmap_cache_round_trip(tmp_path):
+    last_sent = datetime.now(timezone.utc)
+    cache = MmapCache("pytest", directory=str(tmp_path))
+    assert not cache.exists(FEATURES_URL)
+    assert cache.get(FEATURES_URL) is None
+
+    cache.mset({METRIC_LAST_SENT_TIME: last_sent, ETAG: ""})
+    cache.set(ETAG, "W/123")
+    cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+
+    assert cache.get(ETAG) == "W/123"
+    assert json.loads(cache.get(FEATURES_URL)) == MOCK_FEATURE_RESPONSE
+
+    reopened = MmapCache("pytest", directory=str(tmp_path))
+    assert reopened.exists(FEATURES_URL)
+    assert reopened.get(ETAG) == "W/123"
+    assert reopened.get(METRIC_LAST_SENT_TIME) == last_sent
+    assert reopened.get(FEATURES_URL) == cache.get(FEATURES_URL)
+
+    reopened.destroy()
+    assert not os.path.exists(reopened.path)
+    assert reopened.get(FEATURES_URL, "default") == "default"
+
+
+def test_mmap_cache_skips_unchanged_payloads(tmp_path, mocker):
+    write_state_file = mocker.spy(cache_module, "write_state_file")
+    cache = MmapCache("pytest", directory=str(tmp_path))
+
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    assert write_state_file.call_count == 1
+
+    cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    assert write_state_file.call_count == 2
+    assert read_state_file(cache.path).generation == 2
+    cache.destroy()
+
+
+def test_mmap_cache_ignores_corrupt_files(tmp_path):
+    cache = MmapCache("pytest", directory=str(tmp_path))
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+
+    with open(cache.path, "r+b") as cache_file:
+        cache_file.seek(-2, os.SEEK_END)
+        cache_file.write(b"!!")
+    assert MmapCache("pytest", directory=str(tmp_path)).get(FEATURES_URL) is None
+
+    with open(cache.path, "wb") as cache_file:
+        cache_file.write(b"garbage")
+    assert MmapCache("pytest", directory=str(tmp_path)).get(FEATURES_URL) is None
+
+
+def test_mmap_cache_persists_other_keys(tmp_path, mocker):
+    write_state_file = mocker.spy(cache_module, "write_state_file")
+    cache = MmapCache("pytest", directory=str(tmp_path))
+
+    # e.g. a metrics spool's cache, which never holds features
+    cache.set(PENDING_METRICS, {"toggles": {}})
+    cache.set(PENDING_METRICS, {"toggles": {}})
+    assert write_state_file.call_count == 1
+
+    reopened = MmapCache("pytest", directory=str(tmp_path))
+    assert reopened.get(PENDING_METRICS) == {"toggles": {}}
+    assert not reopened.exists(FEATURES_URL)
+    assert reopened.get(FEATURES_URL) is None
+
+    cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+    cache.mset({FEATURES_URL: json.dumps(MOCK_FEATURE_RESPONSE), ETAG: "W/1"})
+    assert write_state_file.call_count == 3
+    assert read_state_file(cache.path).generation == 1
+
+    reopened = MmapCache("pytest", directory=str(tmp_path))
+    assert reopened.get(ETAG) == "W/1"
+    assert json.loads(reopened.get(FEATURES_URL)) == MOCK_FEATURE_RESPONSE
+    cache.destroy()
+
+
+def test_memory_cache():
+    cache = MemoryCache()
+    cache.mset({ETAG: "W/123"})
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+
+    assert cache.bootstrapped
+    assert cache.exists(FEATURES_URL)
+    assert cache.get(ETAG) == "W/123"
+    assert cache.get("missing", "default") == "default"
+
+    cache.destroy()
+    assert not cache.exists(FEATURES_URL)
+
+
+def test_memory_cache_write_behind(tmp_path, mocker):
+    backing_cache = MmapCache("pytest", directory=str(tmp_path))
+    mset = mocker.spy(backing_cache, "mset")
+    cache = MemoryCache(backing_cache=backing_cache, flush_interval=60)
+
+    cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE))
+    cache.set(ETAG, "W/1")
+    cache.set(FEATURES_URL, json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    cache.set(ETAG, "W/2")
+    assert mset.call_count == 0
+
+    cache.flush()
+    cache.flush()
+    assert mset.call_count == 1
+    assert json.loads(backing_cache.get(FEATURES_URL)) == MOCK_FEATURE_RESPONSE_PROJECT
+    assert backing_cache.get(ETAG) == "W/2"
+
+    restored = MemoryCache(backing_cache=MmapCache("pytest", directory=str(tmp_path)))
+    assert restored.get(FEATURES_URL) == cache.get(FEATURES_URL)
+    assert restored.get(ETAG) == "W/2"
+
+    cache.destroy()
+    assert not os.path.exists(backing_cache.path)
+
+
+def test_memory_cache_flushes_in_background(tmp_path):
+    backing_cache = MmapCache("pytest", directory=str(tmp_path))
+    cache = MemoryCache(backing_cache=backing_cache, flush_interval=0.01)
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+
+    deadline = time.monotonic() + 5
+    while not backing_cache.exists(FEATURES_URL) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert backing_cache.exists(FEATURES_URL)
+    cache.destroy()
+
+
+def test_memory_cache_destroy_abandons_slow_flush(tmp_path, caplog):
+    backing_cache = MmapCache("pytest", directory=str(tmp_path))
+    flushing = threading.Event()
+    release = threading.Event()
+
+    def slow_mset(data):
+        flushing.set()
+        release.wait(5)
+
+    backing_cache.mset = slow_mset
+    cache = MemoryCache(backing_cache=backing_cache, flush_interval=0.01)
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    assert flushing.wait(5)
+
+    started = time.monotonic()
+    cache.destroy(timeout=0.1)
+    release.set()
+
+    assert time.monotonic() - started < 1
+    assert "abandoning it" in caplog.text
+
+
+def test_destroy_cache_supports_caches_without_timeout(mocker):
+    class LegacyCache(MemoryCache):
+        def destroy(self):  # type: ignore[override]
+            super().destroy()
+
+    legacy = LegacyCache()
+    legacy.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    destroy_cache(legacy, 1)
+    assert not legacy.exists(FEATURES_URL)
+
+    cache = MemoryCache()
+    destroy = mocker.spy(cache, "destroy")
+    destroy_cache(cache, 1)
+    destroy.assert_called_once_with(timeout=1)
@@ -1,5 +1,7 @@
 import json
+import os
 import re
+import socket
 import threading
 import time
 import uuid
@@ -42,10 +44,14 @@ from tests.utilities.testing_constants import (
     REQUEST_TIMEOUT,
     URL,
 )
-from UnleashClient import INSTANCES, UnleashClient
-from UnleashClient.cache import FileCache
+from UnleashClient import INSTANCES, PerformanceOptions, UnleashClient
+from UnleashClient.cache import FileCache, MemoryCache, MmapCache
+from UnleashClient.connectors import BootstrapConnector
 from UnleashClient.constants import FEATURES_URL, METRICS_URL, REGISTER_URL
+from UnleashClient.evaluation_cache import EvaluationCache
 from UnleashClient.events import BaseEvent, UnleashEvent, UnleashEventType
+from UnleashClient.periodic_tasks import MetricsShards, MetricsSpool
+from UnleashClient.shared_state import SharedStatePublisher
 from UnleashClient.utils import InstanceAllowType
 
 
@@ -511,6 +517,137 @@ def test_uc_not_initialized_isenabled():
     unleash_client.destroy()
 
 
+def test_uc_destroy_closes_session(mocker):
+    unleash_client = UnleashClient(URL, APP_NAME)
+    close = mocker.spy(unleash_client._session, "close")
+
+    unleash_client.destroy()
+
+    close.assert_called_once()
+
+
+@responses.activate
+def test_uc_destroy_with_timeout_keeps_unsent_metrics(mocker):
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+    spool = MetricsSpool()
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        metrics_interval=METRICS_INTERVAL,
+        performance=PerformanceOptions(metrics_spool=spool),
+    )
+    unleash_client.initialize_client()
+    assert unleash_client.is_enabled("testFlag")
+    shutdown = mocker.spy(unleash_client.unleash_scheduler, "shutdown")
+
+    unleash_client.destroy(timeout=0)
+
+    assert not [call for call in responses.calls if METRICS_URL in call.request.url]
+    assert spool.pending["toggles"]["testFlag"]["yes"] == 1
+    shutdown.assert_called_once_with(wait=False)
+
+
+@responses.activate
+def test_uc_destroy_with_timeout_shares_budget_with_slow_connector(mocker):
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+    spool = MetricsSpool()
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        metrics_interval=METRICS_INTERVAL,
+        performance=PerformanceOptions(metrics_spool=spool),
+    )
+    unleash_client.initialize_client()
+    assert unleash_client.is_enabled("testFlag")
+
+    def slow_stop(timeout=None):
+        time.sleep(timeout)
+
+    stop = mocker.patch.object(unleash_client.connector, "stop", side_effect=slow_stop)
+    destroy_cache = mocker.spy(unleash_client.cache, "destroy")
+
+    start = time.monotonic()
+    unleash_client.destroy(timeout=0.2)
+
+    assert time.monotonic() - start < 1
+    assert 0 < stop.call_args.kwargs["timeout"] <= 0.2
+    assert destroy_cache.call_args.kwargs["timeout"] == 0
+    assert not [call for call in responses.calls if METRICS_URL in call.request.url]
+    assert spool.pending["toggles"]["testFlag"]["yes"] == 1
+
+
+def test_uc_destroy_with_timeout_unresponsive_server():
+    # A listening socket whose accept backlog is full never completes new connections.
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(0)
+    port = server.getsockname()[1]
+    backlog = []
+    for _ in range(3):
+        client = socket.socket()
+        client.setblocking(False)
+        client.connect_ex(("127.0.0.1", port))
+        backlog.append(client)
+
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        f"http://127.0.0.1:{port}",
+        APP_NAME,
+        cache=cache,
+        disable_registration=True,
+        metrics_interval=METRICS_INTERVAL,
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+    assert unleash_client.is_enabled("testFlag")
+
+    try:
+        start = time.monotonic()
+        unleash_client.destroy(timeout=1)
+        # The shutdown submission isn't retried.
+        assert time.monotonic() - start < 2
+    finally:
+        for client in backlog:
+            client.close()
+        server.close()
+
+
+@responses.activate
+def test_uc_metrics_shards():
+    responses.add(responses.POST, URL + REGISTER_URL, json={}, status=202)
+    responses.add(
+        responses.GET, URL + FEATURES_URL, json=MOCK_FEATURE_RESPONSE, status=200
+    )
+    responses.add(responses.POST, URL + METRICS_URL, json={}, status=202)
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        metrics_interval=METRICS_INTERVAL,
+        performance=PerformanceOptions(metrics_shards=MetricsShards()),
+    )
+    unleash_client.initialize_client()
+
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.get_variant("testVariations", {"userId": "2"})
+    assert unleash_client.engine.get_metrics() is None
+    unleash_client.destroy()
+
+    metrics_request = [
+        call for call in responses.calls if METRICS_URL in call.request.url
+    ][0].request
+    toggles = json.loads(metrics_request.body)["bucket"]["toggles"]
+    assert toggles["testFlag"]["yes"] == 1
+    assert sum(toggles["testVariations"]["variants"].values()) == 1
+
+
 def test_uc_dependency(unleash_client_bootstrap_dependencies):
     unleash_client = unleash_client_bootstrap_dependencies
     assert unleash_client.is_enabled("Child")
@@ -584,6 +721,211 @@ def test_uc_not_initialized_getvariant():
     unleash_client.destroy()
 
 
+def test_uc_is_enabled_many():
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+    )
+
+    results = unleash_client.is_enabled_many(
+        ["testFlag", "testVariations", "testFlag", "ThisFlagDoesn'tExist"],
+        context={"userId": "2"},
+        fallback_function=lambda feature_name, context: True,
+    )
+
+    assert results == {
+        "testFlag": True,
+        "testVariations": True,
+        "ThisFlagDoesn'tExist": True,
+    }
+
+    metrics = unleash_client.engine.get_metrics()["toggles"]
+    assert metrics["testFlag"]["yes"] == 1
+    assert metrics["testVariations"]["yes"] == 1
+    unleash_client.destroy()
+
+
+def test_uc_get_variants_many():
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+    )
+
+    variants = unleash_client.get_variants_many(
+        ["testVariations", "testFlag", "ThisFlagDoesn'tExist"],
+        context={"userId": "2"},
+    )
+
+    assert variants["testVariations"]["name"] == "VarA"
+    assert variants["testVariations"]["feature_enabled"]
+    assert variants["testFlag"]["name"] == "disabled"
+    assert variants["testFlag"]["feature_enabled"]
+    assert not variants["ThisFlagDoesn'tExist"]["feature_enabled"]
+
+    metrics = unleash_client.engine.get_metrics()["toggles"]
+    assert metrics["testVariations"]["variants"]["VarA"] == 1
+    assert metrics["testFlag"]["yes"] == 1
+    unleash_client.destroy()
+
+
+def test_uc_evaluation_cache(mocker):
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+        performance=PerformanceOptions(evaluation_cache=EvaluationCache(maxsize=100)),
+    )
+    is_enabled = mocker.spy(unleash_client.engine, "is_enabled")
+    get_variant = mocker.spy(unleash_client.engine, "get_variant")
+
+    for _ in range(3):
+        assert unleash_client.is_enabled("testVariations", {"userId": "2"})
+        assert unleash_client.get_variant("testVariations", {"userId": "2"})["enabled"]
+    assert not unleash_client.is_enabled("testVariations", {"userId": "3"})
+
+    assert is_enabled.call_count == 2
+    assert get_variant.call_count == 1
+    metrics = unleash_client.engine.get_metrics()["toggles"]
+    assert metrics["testVariations"]["yes"] == 6
+    assert metrics["testVariations"]["variants"]["VarA"] == 3
+
+    unleash_client._handle_state_update(
+        json.dumps(MOCK_FEATURE_WITH_DEPENDENCIES_RESPONSE)
+    )
+    unleash_client.is_enabled("testVariations", {"userId": "2"})
+    assert is_enabled.call_count == 3
+    unleash_client.destroy()
+
+
+@pytest.mark.parametrize("evaluation_cache", [None, EvaluationCache(maxsize=100)])
+def test_uc_evaluation_cache_keeps_remote_address_variants_random(evaluation_cache):
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(
+        {
+            "version": 1,
+            "features": [
+                {
+                    "name": "f",
+                    "enabled": True,
+                    "strategies": [{"name": "default"}],
+                    "variants": [
+                        {"name": name, "weight": 250, "stickiness": "default"}
+                        for name in "abcd"
+                    ],
+                }
+            ],
+        }
+    )
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+        performance=PerformanceOptions(evaluation_cache=evaluation_cache),
+    )
+
+    # The engine doesn't use remoteAddress for default stickiness, so these are random.
+    variants = {
+        unleash_client.get_variant("f", {"remoteAddress": "1.2.3.4"})["name"]
+        for _ in range(100)
+    }
+
+    assert len(variants) > 1
+    unleash_client.destroy()
+
+
+def test_uc_sends_only_referenced_context_fields(mocker):
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_WITH_CUSTOM_CONTEXT_REQUIREMENTS)
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+    )
+    is_enabled = mocker.spy(unleash_client.engine, "is_enabled")
+
+    assert unleash_client.feature_context_fields() == {
+        "customContextToggle": ["myContext"]
+    }
+    assert unleash_client.is_enabled(
+        "customContextToggle", {"userId": "1", "myContext": "1234", "plan": "free"}
+    )
+    is_enabled.assert_called_once_with(
+        "customContextToggle", {"properties": {"myContext": "1234"}}
+    )
+    unleash_client.destroy()
+
+
+def test_uc_mmap_cache(tmp_path):
+    cache = MmapCache(APP_NAME, directory=str(tmp_path))
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+    )
+
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.destroy()
+    assert not os.path.exists(cache.path)
+
+
+def test_uc_shared_state(tmp_path):
+    path = str(tmp_path / "unleash.state")
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    fetcher = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+        performance=PerformanceOptions(state_publisher=SharedStatePublisher(path)),
+    )
+
+    worker = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=FileCache("MOCK_CACHE_WORKER", directory=str(tmp_path)),
+        experimental_mode={"type": "shared_state", "path": path},
+    )
+    worker.initialize_client()
+
+    assert worker.is_enabled("testFlag")
+    assert worker.connector.generation == 1
+
+    fetcher.engine.take_state(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    fetcher._handle_state_update(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    worker.connector.refresh()
+
+    assert not worker.is_enabled("testFlag")
+    assert worker.is_enabled("ivan-project")
+    worker.destroy()
+    fetcher.destroy()
+
+
 @responses.activate
 def test_uc_metrics(readyable_unleash_client):
     unleash_client, ready_signal, _ = readyable_unleash_client
@@ -1268,6 +1610,82 @@ def test_context_adds_current_time_if_not_set():
     unleash_client.destroy()
 
 
+def test_context_only_adds_current_time_for_date_constraints():
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_WITH_CUSTOM_CONTEXT_REQUIREMENTS)
+
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+        environment="default",
+    )
+    assert "currentTime" not in unleash_client._safe_context({"userId": "1"})
+
+    unleash_client.connector = BootstrapConnector(
+        engine=unleash_client.engine,
+        cache=cache,
+        state_callback=unleash_client._feature_index.update,
+    )
+    cache.bootstrap_from_dict(MOCK_FEATURE_WITH_DATE_AFTER_CONSTRAINT)
+    unleash_client.connector.start()
+
+    assert "currentTime" in unleash_client._safe_context({"userId": "1"})
+    assert "currentTime" in unleash_client._safe_context(
+        unleash_client.build_context({"userId": "1"})
+    )
+    assert unleash_client.is_enabled("DateConstraint")
+    unleash_client.destroy()
+
+
+def test_context_always_passes_current_time_to_user_code(mocker):
+    strategy = mocker.Mock()
+    strategy.apply.return_value = True
+    fallback = mocker.Mock(return_value=True)
+    events = []
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(
+        {
+            "version": 1,
+            "features": [
+                {
+                    "name": "customFlag",
+                    "enabled": True,
+                    "impressionData": True,
+                    "strategies": [{"name": "recordContext", "parameters": {}}],
+                },
+                {
+                    "name": "defaultFlag",
+                    "enabled": True,
+                    "impressionData": True,
+                    "strategies": [{"name": "default"}],
+                },
+            ],
+        }
+    )
+    unleash_client = UnleashClient(
+        url=URL,
+        app_name=APP_NAME,
+        disable_metrics=True,
+        disable_registration=True,
+        cache=cache,
+        custom_strategies={"recordContext": strategy},
+        event_callback=events.append,
+    )
+
+    assert unleash_client.is_enabled("customFlag", {"userId": "1"})
+    assert unleash_client.is_enabled("defaultFlag", {"userId": "1"})
+    assert unleash_client.is_enabled("missingFlag", fallback_function=fallback)
+
+    assert "currentTime" in strategy.apply.call_args[0][1]
+    assert "currentTime" in fallback.call_args[0][1]
+    assert all("currentTime" in event.context for event in events)
+    assert len(events) == 2
+    unleash_client.destroy()
+
+
 def test_context_moves_properties_fields_to_properties():
     unleash_client = UnleashClient(
         URL,
@@ -1327,6 +1745,61 @@ def test_is_enabled_works_with_properties_field_in_the_context_root():
     unleash_client.destroy()
 
 
+def test_build_context_is_reusable_across_evaluations():
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_WITH_CUSTOM_CONTEXT_REQUIREMENTS)
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        disable_metrics=True,
+        cache=cache,
+        disable_registration=True,
+    )
+
+    context = unleash_client.build_context({"myContext": "1234"})
+
+    assert context.to_dict()["appName"] == APP_NAME
+    assert unleash_client.is_enabled("customContextToggle", context)
+    assert unleash_client.is_enabled_many(["customContextToggle"], context) == {
+        "customContextToggle": True
+    }
+    assert unleash_client.get_variant("customContextToggle", context)["feature_enabled"]
+    assert not context.has_current_time
+    unleash_client.destroy()
+
+
+def test_build_context_is_not_exposed_to_callbacks():
+    cache = FileCache("MOCK_CACHE")
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    events = []
+
+    def fallback_function(feature_name, context):
+        context["userId"] = "changed"
+        context["properties"]["plan"] = "changed"
+        return True
+
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        disable_metrics=True,
+        cache=cache,
+        disable_registration=True,
+        event_callback=events.append,
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+    context = unleash_client.build_context({"userId": "2", "plan": "free"})
+    expected = context.to_dict()
+
+    assert unleash_client.is_enabled("missingFlag", context, fallback_function)
+    unleash_client.get_variant("testVariations", context)
+    for event in events:
+        if event.event_type == UnleashEventType.VARIANT:
+            event.context["properties"]["plan"] = "changed"
+
+    assert context.to_dict() == expected
+    unleash_client.destroy()
+
+
 def test_uuids_are_valid_context_properties():
     unleash_client = UnleashClient(
         URL,
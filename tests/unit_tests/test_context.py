@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from UnleashClient.context import (
+    CoarseClock,
+    UnleashContext,
+    normalize_context,
+    trim_context,
+)
+
+STATIC_CONTEXT = {"appName": "pytest", "environment": "default"}
+
+
+def test_normalize_context_moves_custom_fields_to_properties():
+    context = normalize_context(
+        {"userId": 1234, "myContext": "1234", "properties": {"yourContext": 5}},
+        STATIC_CONTEXT,
+    )
+
+    assert context["userId"] == "1234"
+    assert context["appName"] == "pytest"
+    assert context["properties"] == {"myContext": "1234", "yourContext": "5"}
+    assert "currentTime" not in context
+
+
+def test_normalize_context_handles_datetimes():
+    current_time = datetime(1834, 2, 20, tzinfo=timezone.utc)
+
+    context = normalize_context({"currentTime": current_time})
+
+    assert context["currentTime"] == current_time.isoformat()
+
+
+def test_trim_context_keeps_requested_fields():
+    context = normalize_context(
+        {"userId": "1", "sessionId": "2", "plan": "premium", "tier": "gold"},
+        {"appName": "app"},
+    )
+
+    assert trim_context(context, ("userId", "plan", "missing")) == {
+        "userId": "1",
+        "properties": {"plan": "premium"},
+    }
+
+
+def test_unleash_context_is_immutable():
+    context = UnleashContext({"userId": "1234"}, STATIC_CONTEXT)
+
+    with pytest.raises(AttributeError):
+        context.userId = "4321"
+
+    with pytest.raises(AttributeError):
+        context.extra = "value"
+
+    context.to_dict()["properties"]["injected"] = "value"
+    assert "injected" not in context.to_dict()["properties"]
+
+
+def test_unleash_context_equality():
+    assert UnleashContext({"userId": "1"}, STATIC_CONTEXT) == UnleashContext(
+        {"userId": 1}, STATIC_CONTEXT
+    )
+    assert UnleashContext({"userId": "1"}) != UnleashContext({"userId": "2"})
+
+
+def test_unleash_context_current_time():
+    assert not UnleashContext({"userId": "1"}).has_current_time
+    assert UnleashContext({"currentTime": "2024-01-01T00:00:00Z"}).has_current_time
+
+
+def test_coarse_clock_returns_utc_isoformat():
+    clock = CoarseClock()
+
+    value = clock.isoformat()
+
+    parsed = datetime.fromisoformat(value)
+    assert parsed.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 1
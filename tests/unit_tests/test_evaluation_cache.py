@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from UnleashClient.evaluation_cache import MISSING, EvaluationCache
+
+
+def test_evaluation_cache_get_set():
+    cache = EvaluationCache(maxsize=10)
+
+    assert cache.get("key") is MISSING
+    cache.set("key", None)
+    assert cache.get("key") is None
+
+
+def test_evaluation_cache_evicts_least_recently_used():
+    cache = EvaluationCache(maxsize=2)
+    cache.set("a", True)
+    cache.set("b", True)
+    cache.get("a")
+
+    cache.set("c", True)
+
+    assert len(cache) == 2
+    assert cache.get("a") is True
+    assert cache.get("b") is MISSING
+    assert cache.get("c") is True
+
+
+def test_evaluation_cache_expires_entries():
+    cache = EvaluationCache(maxsize=10, ttl=0.05)
+    cache.set("a", True)
+    assert cache.get("a") is True
+
+    time.sleep(0.1)
+
+    assert cache.get("a") is MISSING
+    assert len(cache) == 0
+
+
+def test_evaluation_cache_clear():
+    cache = EvaluationCache(maxsize=10)
+    cache.set("a", True)
+
+    cache.clear()
+
+    assert cache.get("a") is MISSING
+
+
+def test_evaluation_cache_requires_positive_size():
+    with pytest.raises(ValueError):
+        EvaluationCache(maxsize=0)
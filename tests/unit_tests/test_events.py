@@ -0,0 +1,76 @@
+import copy
+import json
+import pickle
+import uuid
+from dataclasses import asdict
+
+import pytest
+
+from UnleashClient.events import (
+    UnleashEvent,
+    UnleashEventType,
+    UnleashFetchedEvent,
+    UnleashReadyEvent,
+)
+
+
+def build_event(**kwargs):
+    return UnleashEvent(
+        event_type=UnleashEventType.FEATURE_FLAG,
+        context={"userId": "1"},
+        enabled=True,
+        feature_name="testFlag",
+        **kwargs,
+    )
+
+
+def test_event_id_is_generated_once_on_access():
+    event = build_event(event_id=None)
+
+    assert event._event_id is None
+    event_id = event.event_id
+    assert isinstance(event_id, uuid.UUID)
+    assert event.event_id == event_id
+
+
+def test_event_id_can_be_given():
+    event_id = uuid.uuid4()
+    event = build_event(event_id=event_id)
+
+    assert event.event_id == event_id
+    assert event == build_event(event_id=event_id)
+    assert asdict(event) == {
+        "event_type": UnleashEventType.FEATURE_FLAG,
+        "event_id": event_id,
+        "context": {"userId": "1"},
+        "enabled": True,
+        "feature_name": "testFlag",
+        "variant": "",
+    }
+
+
+def test_copies_keep_the_event_id():
+    event = build_event(event_id=None)
+
+    assert pickle.loads(pickle.dumps(event)) == event
+    assert copy.copy(event).event_id == event.event_id
+
+
+def test_events_are_slotted():
+    event = build_event(event_id=None)
+
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.unknown = True
+    assert not hasattr(UnleashReadyEvent(UnleashEventType.READY, None), "__dict__")
+
+
+def test_fetched_event_parses_features_once():
+    event = UnleashFetchedEvent(
+        event_type=UnleashEventType.FETCHED,
+        event_id=None,
+        raw_features=json.dumps({"version": 1, "features": [{"name": "testFlag"}]}),
+    )
+
+    assert event.features == [{"name": "testFlag"}]
+    assert event.features is event.features
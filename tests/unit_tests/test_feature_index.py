@@ -0,0 +1,400 @@
+import json
+
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURE_RESPONSE_PROJECT,
+    MOCK_FEATURE_WITH_DATE_AFTER_CONSTRAINT,
+)
+from UnleashClient.feature_index import FeatureIndex
+
+DATE_CONSTRAINT = {
+    "contextName": "currentTime",
+    "operator": "DATE_BEFORE",
+    "value": "2100-01-01T00:00:00.000Z",
+}
+
+
+def test_feature_index_detects_date_constraints():
+    index = FeatureIndex()
+    assert not index.uses_current_time
+
+    index.update(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    assert not index.uses_current_time
+
+    index.update(json.dumps(MOCK_FEATURE_WITH_DATE_AFTER_CONSTRAINT))
+    assert index.uses_current_time
+
+    index.update(json.dumps(MOCK_FEATURE_RESPONSE))
+    assert index.uses_current_time
+
+
+def test_feature_index_detects_date_constraints_in_segments():
+    index = FeatureIndex()
+
+    index.update(
+        json.dumps(
+            {
+                "version": 1,
+                "features": [],
+                "segments": [{"id": 1, "constraints": [DATE_CONSTRAINT]}],
+            }
+        )
+    )
+
+    assert index.uses_current_time
+
+
+def test_feature_index_applies_delta_events():
+    index = FeatureIndex()
+    index.update(
+        json.dumps(
+            {
+                "events": [
+                    {
+                        "type": "hydration",
+                        "eventId": 1,
+                        "features": [
+                            {
+                                "name": "plain",
+                                "enabled": True,
+                                "strategies": [{"name": "default"}],
+                            }
+                        ],
+                        "segments": [],
+                    }
+                ]
+            }
+        )
+    )
+    assert not index.uses_current_time
+
+    index.update(
+        json.dumps(
+            {
+                "events": [
+                    {
+                        "type": "feature-updated",
+                        "eventId": 2,
+                        "feature": {
+                            "name": "dated",
+                            "enabled": True,
+                            "strategies": [
+                                {"name": "default", "constraints": [DATE_CONSTRAINT]}
+                            ],
+                        },
+                    }
+                ]
+            }
+        )
+    )
+    assert index.uses_current_time
+
+    index.update(
+        json.dumps(
+            {
+                "events": [
+                    {
+                        "type": "feature-removed",
+                        "eventId": 3,
+                        "featureName": "dated",
+                        "project": "default",
+                    }
+                ]
+            }
+        )
+    )
+    assert not index.uses_current_time
+
+
+def test_feature_index_is_conservative_on_unparseable_payloads():
+    index = FeatureIndex()
+
+    index.update("this is not json")
+
+    assert index.uses_current_time
+
+
+def test_feature_index_stays_degraded_until_full_state():
+    plain = {"name": "plain", "enabled": True, "strategies": [{"name": "default"}]}
+    index = build_index(plain)
+
+    # The engine applies this delta, but the index can't tell what it changed.
+    index.update(json.dumps({"events": [{"type": "feature-updated", "eventId": 2}]}))
+    assert index.context_fields("plain") is None
+
+    index.update(
+        json.dumps(
+            {"events": [{"type": "feature-updated", "eventId": 3, "feature": plain}]}
+        )
+    )
+    assert index.context_fields("plain") is None
+    assert index.uses_current_time
+
+    index.update(
+        json.dumps(
+            {
+                "events": [
+                    {
+                        "type": "hydration",
+                        "eventId": 4,
+                        "features": [plain],
+                        "segments": [],
+                    }
+                ]
+            }
+        )
+    )
+    assert index.context_fields("plain") == ()
+    assert not index.uses_current_time
+
+
+def build_index(*features, segments=None):
+    index = FeatureIndex()
+    index.update(
+        json.dumps(
+            {"version": 1, "features": list(features), "segments": segments or []}
+        )
+    )
+    return index
+
+
+def test_feature_index_fingerprint_uses_referenced_fields_only():
+    index = build_index(
+        {
+            "name": "userFlag",
+            "enabled": True,
+            "strategies": [
+                {
+                    "name": "userWithId",
+                    "parameters": {"userIds": "1"},
+                    "constraints": [
+                        {"contextName": "plan", "operator": "IN", "values": ["pro"]}
+                    ],
+                }
+            ],
+        }
+    )
+
+    first = index.fingerprint(
+        "userFlag",
+        {"userId": "1", "sessionId": "a", "properties": {"plan": "pro"}},
+    )
+    second = index.fingerprint(
+        "userFlag",
+        {"userId": "1", "sessionId": "b", "properties": {"plan": "pro"}},
+    )
+    third = index.fingerprint(
+        "userFlag",
+        {"userId": "1", "sessionId": "b", "properties": {"plan": "free"}},
+    )
+
+    assert first is not None
+    assert first == second
+    assert first != third
+
+
+def test_feature_index_fingerprint_includes_revision():
+    feature = {"name": "plain", "enabled": True, "strategies": [{"name": "default"}]}
+    index = build_index(feature)
+    before = index.fingerprint("plain", {})
+
+    index.update(json.dumps({"version": 1, "features": [feature]}))
+
+    assert index.fingerprint("plain", {}) != before
+
+
+def test_feature_index_fingerprint_rejects_nondeterministic_features():
+    index = build_index(
+        {"name": "custom", "enabled": True, "strategies": [{"name": "amIACat"}]},
+        {
+            "name": "random",
+            "enabled": True,
+            "strategies": [
+                {"name": "gradualRolloutRandom", "parameters": {"percentage": "50"}}
+            ],
+        },
+        {
+            "name": "dated",
+            "enabled": True,
+            "strategies": [{"name": "default", "constraints": [DATE_CONSTRAINT]}],
+        },
+        {
+            "name": "rollout",
+            "enabled": True,
+            "strategies": [
+                {
+                    "name": "flexibleRollout",
+                    "parameters": {"rollout": "50", "stickiness": "default"},
+                }
+            ],
+        },
+    )
+
+    assert index.fingerprint("custom", {"userId": "1"}) is None
+    assert index.fingerprint("random", {"userId": "1"}) is None
+    assert index.fingerprint("dated", {"userId": "1"}) is None
+    assert index.fingerprint("missing", {"userId": "1"}) is None
+    assert index.fingerprint("rollout", {}) is None
+    assert index.fingerprint("rollout", {"userId": "1"}) is not None
+
+
+def test_feature_index_fingerprint_requires_variant_stickiness_field():
+    index = build_index(
+        {
+            "name": "tenantVariants",
+            "enabled": True,
+            "strategies": [{"name": "default"}],
+            "variants": [
+                {"name": "a", "weight": 500, "stickiness": "tenantId"},
+                {"name": "b", "weight": 500, "stickiness": "tenantId"},
+            ],
+        },
+        {
+            "name": "child",
+            "enabled": True,
+            "strategies": [{"name": "default"}],
+            "dependencies": [{"feature": "tenantVariants", "variants": ["a"]}],
+        },
+    )
+
+    # Without tenantId the variant is picked randomly on every check.
+    assert index.fingerprint("tenantVariants", {"userId": "1"}) is None
+    assert index.fingerprint("child", {"userId": "1"}) is None
+    assert (
+        index.fingerprint("tenantVariants", {"properties": {"tenantId": "t1"}})
+        is not None
+    )
+    assert index.fingerprint("child", {"properties": {"tenantId": "t1"}}) is not None
+
+
+def test_feature_index_fingerprint_follows_segments_and_dependencies():
+    index = build_index(
+        {
+            "name": "parent",
+            "enabled": True,
+            "strategies": [{"name": "default", "segments": [1]}],
+        },
+        {
+            "name": "child",
+            "enabled": True,
+            "strategies": [{"name": "default"}],
+            "dependencies": [{"feature": "parent"}],
+        },
+        segments=[
+            {
+                "id": 1,
+                "constraints": [
+                    {"contextName": "region", "operator": "IN", "values": ["eu"]}
+                ],
+            }
+        ],
+    )
+
+    eu = index.fingerprint("child", {"properties": {"region": "eu"}})
+    us = index.fingerprint("child", {"properties": {"region": "us"}})
+
+    assert eu is not None
+    assert eu != us
+
+
+def test_feature_index_context_fields():
+    index = build_index(
+        {
+            "name": "parent",
+            "enabled": True,
+            "strategies": [
+                {
+                    "name": "flexibleRollout",
+                    "parameters": {"rollout": "50", "stickiness": "tenant"},
+                    "segments": [1],
+                }
+            ],
+        },
+        {
+            "name": "child",
+            "enabled": True,
+            "strategies": [{"name": "userWithId", "parameters": {"userIds": "1"}}],
+            "dependencies": [{"feature": "parent"}],
+        },
+        {
+            "name": "custom",
+            "enabled": True,
+            "strategies": [{"name": "myCustomStrategy"}],
+        },
+        {
+            "name": "customChild",
+            "enabled": True,
+            "strategies": [{"name": "default"}],
+            "dependencies": [{"feature": "custom"}],
+        },
+        segments=[
+            {
+                "id": 1,
+                "constraints": [
+                    {"contextName": "region", "operator": "IN", "values": ["eu"]}
+                ],
+            }
+        ],
+    )
+
+    assert index.context_fields("parent") == ("region", "tenant")
+    assert index.context_fields("child") == ("region", "tenant", "userId")
+    assert index.context_fields("custom") is None
+    assert index.context_fields("customChild") is None
+    assert index.context_fields("missing") is None
+    assert index.all_context_fields() == {
+        "parent": ("region", "tenant"),
+        "child": ("region", "tenant", "userId"),
+        "custom": None,
+        "customChild": None,
+    }
+
+
+def test_feature_index_invalidate():
+    index = build_index(
+        {"name": "plain", "enabled": True, "strategies": [{"name": "default"}]}
+    )
+    revision = index.revision
+
+    index.invalidate()
+
+    assert index.revision > revision
+    assert index.uses_current_time
+    assert index.context_fields("plain") is None
+    assert index.fingerprint("plain", {}) is None
+
+    index.update(
+        json.dumps(
+            {
+                "version": 1,
+                "features": [
+                    {
+                        "name": "plain",
+                        "enabled": True,
+                        "strategies": [{"name": "default"}],
+                    }
+                ],
+            }
+        )
+    )
+    assert index.context_fields("plain") == ()
+    assert not index.uses_current_time
+
+
+def test_feature_index_export_round_trips():
+    index = FeatureIndex()
+    index.update(json.dumps(MOCK_FEATURE_WITH_DATE_AFTER_CONSTRAINT))
+    index.update(
+        json.dumps({"events": [{"type": "hydration", **MOCK_FEATURE_RESPONSE}]})
+    )
+
+    restored = FeatureIndex()
+    restored.restore(json.loads(json.dumps(index.export())))
+
+    assert restored.all_context_fields() == index.all_context_fields()
+    assert restored.uses_current_time == index.uses_current_time
+    context = {"userId": "1", "properties": {}}
+    assert (
+        restored.fingerprint("testFlag", context)[1:]
+        == index.fingerprint("testFlag", context)[1:]
+    )
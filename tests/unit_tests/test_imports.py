@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+from UnleashClient import api, connectors, constants, periodic_tasks
+
+DEFERRED_MODULES = [
+    "apscheduler",
+    "fcache",
+    "importlib_metadata",
+    "ld_eventsource",
+    "requests",
+]
+
+
+def test_import_defers_optional_dependencies():
+    code = (
+        "import sys\n"
+        "import UnleashClient\n"
+        f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_exports_resolve():
+    assert connectors.StreamingConnector.__name__ == "StreamingConnector"
+    assert api.build_session is not None
+    assert periodic_tasks.aggregate_and_send_metrics is not None
+    assert constants.SDK_VERSION
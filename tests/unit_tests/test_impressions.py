@@ -0,0 +1,243 @@
+import threading
+
+import pytest
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.testing_constants import APP_NAME, URL
+from UnleashClient import PerformanceOptions, UnleashClient
+from UnleashClient.cache import MemoryCache
+from UnleashClient.events import UnleashEventType
+from UnleashClient.impressions import ImpressionDispatcher, ImpressionSampler
+from UnleashClient.scheduler import TimerScheduler
+
+
+def paused_dispatcher(**kwargs):
+    """
+    Returns a dispatcher whose worker is stuck delivering the first event until ``release`` is set.
+    """
+    release = threading.Event()
+    delivering = threading.Event()
+    delivered = []
+
+    def callback(event):
+        delivering.set()
+        release.wait(timeout=5)
+        delivered.append(event)
+
+    dispatcher = ImpressionDispatcher(batch_size=1, **kwargs)
+    dispatcher.bind(callback)
+    dispatcher.submit("first")
+    assert delivering.wait(timeout=5)
+    return dispatcher, release, delivered
+
+
+def test_dispatcher_delivers_in_batches():
+    batches = []
+    dispatcher = ImpressionDispatcher(batch_size=2, batch_callback=batches.append)
+    for event in range(5):
+        assert dispatcher.submit(event)
+
+    dispatcher.stop(timeout=5)
+
+    assert [event for batch in batches for event in batch] == list(range(5))
+    assert all(len(batch) <= 2 for batch in batches)
+    assert dispatcher.delivered == 5
+    assert dispatcher.dropped == 0
+
+
+def test_dispatcher_drop_oldest():
+    dispatcher, release, delivered = paused_dispatcher(max_queue_size=2)
+    for event in ("a", "b", "c"):
+        assert dispatcher.submit(event)
+
+    release.set()
+    dispatcher.stop(timeout=5)
+
+    assert delivered == ["first", "b", "c"]
+    assert dispatcher.dropped == 1
+
+
+def test_dispatcher_drop_newest():
+    dispatcher, release, delivered = paused_dispatcher(
+        max_queue_size=2, overflow="drop_newest"
+    )
+    assert dispatcher.submit("a")
+    assert dispatcher.submit("b")
+    assert not dispatcher.submit("c")
+
+    release.set()
+    dispatcher.stop(timeout=5)
+
+    assert delivered == ["first", "a", "b"]
+    assert dispatcher.dropped == 1
+
+
+def test_dispatcher_block():
+    dispatcher, release, delivered = paused_dispatcher(
+        max_queue_size=1, overflow="block"
+    )
+    assert dispatcher.submit("a")
+
+    submitted = threading.Event()
+
+    def submit():
+        dispatcher.submit("b")
+        submitted.set()
+
+    threading.Thread(target=submit, daemon=True).start()
+    assert not submitted.wait(timeout=0.1)
+
+    release.set()
+    assert submitted.wait(timeout=5)
+    dispatcher.stop(timeout=5)
+
+    assert delivered == ["first", "a", "b"]
+    assert dispatcher.dropped == 0
+
+
+def test_dispatcher_stop_drops_undelivered_events():
+    dispatcher, release, _ = paused_dispatcher()
+    dispatcher.submit("a")
+
+    dispatcher.stop(timeout=0.05)
+    assert not dispatcher.submit("b")
+    release.set()
+
+    assert dispatcher.dropped == 2
+    assert len(dispatcher) == 0
+
+
+def test_dispatcher_survives_callback_errors():
+    delivered = []
+
+    def callback(event):
+        if event == "bad":
+            raise RuntimeError("boom")
+        delivered.append(event)
+
+    dispatcher = ImpressionDispatcher()
+    dispatcher.bind(callback)
+    for event in ("bad", "good"):
+        dispatcher.submit(event)
+    dispatcher.stop(timeout=5)
+
+    assert delivered == ["good"]
+
+
+def test_dispatcher_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        ImpressionDispatcher(overflow="drop_all")
+
+
+def test_uc_impression_dispatcher():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    events = []
+    main_thread = threading.current_thread()
+
+    def event_callback(event):
+        events.append((event, threading.current_thread()))
+
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        cache=cache,
+        disable_metrics=True,
+        disable_registration=True,
+        event_callback=event_callback,
+        performance=PerformanceOptions(impression_dispatcher=ImpressionDispatcher()),
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.get_variant("testVariations", {"userId": "2"})
+    unleash_client.destroy()
+
+    impressions = [
+        event
+        for event, thread in events
+        if event.event_type != UnleashEventType.READY and thread is not main_thread
+    ]
+    assert [event.event_type for event in impressions] == [
+        UnleashEventType.FEATURE_FLAG,
+        UnleashEventType.VARIANT,
+    ]
+    assert impressions[0].feature_name == "testFlag"
+    assert impressions[1].feature_name == "testVariations"
+
+
+def test_sampler_rates():
+    sampler = ImpressionSampler(rates={"never": 0, "always": 1}, default_rate=0.5)
+
+    assert not any(sampler.record("never", True) for _ in range(100))
+    assert all(sampler.record("always", True) for _ in range(100))
+    assert 0 < sum(sampler.record("other", True) for _ in range(1000)) < 1000
+    assert sampler.summaries() == []
+
+
+def test_sampler_rejects_invalid_rates():
+    with pytest.raises(ValueError):
+        ImpressionSampler(rates={"flag": 2})
+    with pytest.raises(ValueError):
+        ImpressionSampler(aggregate_interval=0)
+
+
+def test_sampler_summaries():
+    sampler = ImpressionSampler(default_rate=0, aggregate_interval=60)
+    for _ in range(3):
+        sampler.record("flag", True)
+    sampler.record("flag", False)
+    sampler.record("variants", True, "VarA")
+
+    summaries = sampler.summaries()
+
+    assert all(
+        summary.event_type == UnleashEventType.IMPRESSION_SUMMARY
+        for summary in summaries
+    )
+    assert {
+        (summary.feature_name, summary.variant, summary.enabled): summary.count
+        for summary in summaries
+    } == {("flag", "", True): 3, ("flag", "", False): 1, ("variants", "VarA", True): 1}
+    assert summaries[0].start <= summaries[0].stop
+    assert sampler.summaries() == []
+
+
+def test_uc_impression_sampler():
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    events = []
+
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        cache=cache,
+        disable_metrics=True,
+        disable_registration=True,
+        scheduler=TimerScheduler(),
+        event_callback=events.append,
+        performance=PerformanceOptions(
+            impression_sampler=ImpressionSampler(
+                rates={"testVariations": 0}, aggregate_interval=60
+            )
+        ),
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+
+    for _ in range(5):
+        unleash_client.is_enabled("testFlag")
+        unleash_client.get_variant("testVariations", {"userId": "2"})
+    unleash_client.destroy()
+
+    impressions = [
+        event.feature_name
+        for event in events
+        if event.event_type in (UnleashEventType.FEATURE_FLAG, UnleashEventType.VARIANT)
+    ]
+    summaries = {
+        event.feature_name: event.count
+        for event in events
+        if event.event_type == UnleashEventType.IMPRESSION_SUMMARY
+    }
+    assert impressions == ["testFlag"] * 5
+    assert summaries == {"testFlag": 5, "testVariations": 5}
@@ -0,0 +1,92 @@
+import math
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.testing_constants import APP_NAME, URL
+from UnleashClient import PerformanceOptions, UnleashClient
+from UnleashClient.cache import MemoryCache
+from UnleashClient.instrumentation import EvaluationInstrumentation, Histogram
+
+
+def build_client(instrumentation):
+    cache = MemoryCache()
+    cache.bootstrap_from_dict(MOCK_FEATURE_RESPONSE)
+    unleash_client = UnleashClient(
+        URL,
+        APP_NAME,
+        cache=cache,
+        disable_metrics=True,
+        disable_registration=True,
+        performance=PerformanceOptions(instrumentation=instrumentation),
+    )
+    unleash_client.initialize_client(fetch_toggles=False)
+    return unleash_client
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.001, 0.01))
+    for value in (0.0005, 0.001, 0.005, 1):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {
+        "count": 4,
+        "sum": 1.0065,
+        "buckets": {0.001: 2, 0.01: 3, math.inf: 4},
+    }
+
+
+def test_uc_records_phases_per_feature():
+    instrumentation = EvaluationInstrumentation()
+    unleash_client = build_client(instrumentation)
+
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.get_variant("testVariations", {"userId": "2"})
+    unleash_client.is_enabled_many(["testFlag"])
+    unleash_client.destroy()
+
+    latency = instrumentation.snapshot()["latency"]
+    assert set(latency) == {"testFlag", "testVariations"}
+    assert set(latency["testVariations"]) == {"context", "engine", "metrics", "events"}
+    # The *_many methods normalize the context once for all features.
+    assert latency["testFlag"]["context"]["count"] == 1
+    assert latency["testFlag"]["engine"]["count"] == 2
+    assert latency["testFlag"]["engine"]["buckets"][math.inf] == 2
+    assert latency["testFlag"]["engine"]["sum"] > 0
+
+
+def test_uc_counts_fallbacks():
+    fallbacks = []
+    instrumentation = EvaluationInstrumentation(fallback_callback=fallbacks.append)
+    unleash_client = build_client(instrumentation)
+
+    assert unleash_client.is_enabled(
+        "missingFlag", fallback_function=lambda feature_name, context: True
+    )
+    assert not unleash_client.is_enabled("missingFlag")
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.destroy()
+
+    assert instrumentation.snapshot()["fallbacks"] == {"missingFlag": 2}
+    assert fallbacks == ["missingFlag", "missingFlag"]
+
+
+def test_callbacks_and_reset():
+    recorded = []
+
+    def latency_callback(feature_name, phase, seconds):
+        recorded.append((feature_name, phase))
+        raise RuntimeError("Callbacks can't break flag checks")
+
+    instrumentation = EvaluationInstrumentation(latency_callback=latency_callback)
+    unleash_client = build_client(instrumentation)
+
+    assert unleash_client.is_enabled("testFlag")
+    unleash_client.destroy()
+
+    assert recorded == [
+        ("testFlag", "context"),
+        ("testFlag", "engine"),
+        ("testFlag", "metrics"),
+        ("testFlag", "events"),
+    ]
+    assert instrumentation.snapshot(reset=True)["latency"]
+    assert instrumentation.snapshot() == {"latency": {}, "fallbacks": {}}
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from UnleashClient.scheduler import (
+    STATE_RUNNING,
+    STATE_STOPPED,
+    IntervalSchedule,
+    JobLookupError,
+    TimerScheduler,
+    add_interval_job,
+)
+
+
+def test_timer_scheduler_runs_jobs_until_removed():
+    scheduler = TimerScheduler()
+    calls = []
+    ran_twice = threading.Event()
+
+    def job(name):
+        calls.append(name)
+        if len(calls) == 2:
+            ran_twice.set()
+
+    scheduled = add_interval_job(scheduler, job, 0.05, kwargs={"name": "job"})
+    scheduler.start()
+    assert scheduler.state == STATE_RUNNING
+
+    assert ran_twice.wait(timeout=5)
+    scheduled.remove()
+    with pytest.raises(JobLookupError):
+        scheduled.remove()
+
+    scheduler.shutdown()
+    assert scheduler.state == STATE_STOPPED
+    assert not scheduler._thread.is_alive()
+    assert set(calls) == {"job"}
+
+
+def test_timer_scheduler_survives_failing_jobs():
+    scheduler = TimerScheduler()
+    recovered = threading.Event()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    scheduler.add_job(failing, trigger=IntervalSchedule(0.01))
+    scheduler.add_job(recovered.set, trigger=IntervalSchedule(0.05, jitter=0.01))
+    scheduler.start()
+
+    assert recovered.wait(timeout=5)
+    scheduler.remove_all_jobs()
+    scheduler.shutdown()
+
+
+def test_timer_scheduler_does_not_import_apscheduler():
+    code = (
+        "import sys\n"
+        "from UnleashClient import UnleashClient\n"
+        "from UnleashClient.scheduler import TimerScheduler\n"
+        "client = UnleashClient('http://localhost:4242/api', 'test', "
+        "scheduler=TimerScheduler(), disable_registration=True, disable_metrics=False)\n"
+        "client.initialize_client(fetch_toggles=False)\n"
+        "client.destroy()\n"
+        "assert 'apscheduler' not in sys.modules, 'apscheduler was imported'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
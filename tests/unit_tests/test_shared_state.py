@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from tests.utilities.mocks.mock_features import (
+    MOCK_FEATURE_RESPONSE,
+    MOCK_FEATURE_RESPONSE_PROJECT,
+)
+from UnleashClient.shared_state import (
+    SharedStatePublisher,
+    StateFileError,
+    read_header,
+    read_state_file,
+    write_state_file,
+)
+
+
+def test_state_file_round_trip(tmp_path):
+    path = str(tmp_path / "unleash.state")
+    assert read_state_file(path) is None
+    assert read_header(path) is None
+
+    write_state_file(path, 7, b'{"version": 1}', {"etag": "abc"})
+    shared_state = read_state_file(path)
+
+    assert shared_state.generation == 7
+    assert shared_state.metadata == {"etag": "abc"}
+    assert shared_state.payload == b'{"version": 1}'
+    assert read_header(path)[0] == 7
+
+
+def test_state_file_detects_corruption(tmp_path):
+    path = tmp_path / "unleash.state"
+    write_state_file(str(path), 1, b'{"version": 1}')
+
+    contents = path.read_bytes()
+    path.write_bytes(contents[:-1] + b"!")
+    with pytest.raises(StateFileError):
+        read_state_file(str(path))
+
+    path.write_bytes(b"nope")
+    with pytest.raises(StateFileError):
+        read_header(str(path))
+
+
+def test_publisher_only_writes_changed_state(tmp_path):
+    path = str(tmp_path / "unleash.state")
+    publisher = SharedStatePublisher(path)
+
+    assert publisher.publish(json.dumps(MOCK_FEATURE_RESPONSE))
+    assert not publisher.publish(json.dumps(MOCK_FEATURE_RESPONSE))
+    assert read_header(path)[0] == 1
+
+    assert publisher.publish(json.dumps(MOCK_FEATURE_RESPONSE_PROJECT))
+    shared_state = read_state_file(path)
+    assert shared_state.generation == 2
+    assert json.loads(shared_state.payload) == MOCK_FEATURE_RESPONSE_PROJECT
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+import yggdrasil_engine
+
+from tests.utilities.mocks.mock_features import MOCK_FEATURE_RESPONSE
+from tests.utilities.testing_constants import APP_NAME, URL
+from UnleashClient import UnleashClient
+from UnleashClient.cache import MemoryCache
+from UnleashClient.shared_state import (
+    StateFileError,
+    read_state_file,
+    write_state_file,
+)
+from UnleashClient.snapshot import (
+    SNAPSHOT_FORMAT,
+    SnapshotVersionError,
+    read_snapshot,
+    write_snapshot,
+)
+
+
+def build_client():
+    return UnleashClient(
+        URL,
+        APP_NAME,
+        cache=MemoryCache(),
+        disable_metrics=True,
+        disable_registration=True,
+    )
+
+
+def test_snapshot_round_trip(tmp_path, mocker):
+    path = str(tmp_path / "features.snapshot")
+    write_snapshot(path, json.dumps(MOCK_FEATURE_RESPONSE))
+
+    unleash_client = build_client()
+    update_index = mocker.spy(unleash_client._feature_index, "update")
+
+    assert unleash_client.load_snapshot(path)
+    assert unleash_client.is_enabled("testFlag")
+    assert unleash_client.feature_context_fields()["testFlag"] == []
+    assert update_index.call_count == 0
+
+    exported = str(tmp_path / "exported.snapshot")
+    unleash_client.export_snapshot(exported)
+    assert read_snapshot(exported).state == read_snapshot(path).state
+    unleash_client.destroy()
+
+
+def test_snapshot_for_other_engine_version_is_ignored(tmp_path, monkeypatch):
+    path = str(tmp_path / "features.snapshot")
+    write_snapshot(path, json.dumps(MOCK_FEATURE_RESPONSE))
+    monkeypatch.setattr(yggdrasil_engine, "__yggdrasil_core_version__", "0.0.0")
+
+    with pytest.raises(SnapshotVersionError):
+        read_snapshot(path)
+
+    unleash_client = build_client()
+    assert not unleash_client.load_snapshot(path)
+    assert not unleash_client.is_enabled("testFlag")
+    unleash_client.destroy()
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = str(tmp_path / "features.snapshot")
+    with pytest.raises(FileNotFoundError):
+        read_snapshot(path)
+
+    write_state_file(path, 1, json.dumps(MOCK_FEATURE_RESPONSE).encode("utf-8"))
+    with pytest.raises(StateFileError):
+        read_snapshot(path)
+
+
+def test_snapshot_rejects_other_formats(tmp_path):
+    path = str(tmp_path / "features.snapshot")
+    write_snapshot(path, json.dumps(MOCK_FEATURE_RESPONSE))
+    snapshot = read_state_file(path)
+    metadata = {**snapshot.metadata, "snapshotFormat": SNAPSHOT_FORMAT + 1}
+    write_state_file(path, snapshot.generation, snapshot.payload, metadata=metadata)
+
+    with pytest.raises(StateFileError):
+        read_snapshot(path)